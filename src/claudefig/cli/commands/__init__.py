@@ -4,9 +4,10 @@ This package contains all command group modules:
 - components: Component discovery and management
 - config: Configuration management
 - files: File instance management
+- fleet: Initializing or syncing many repositories at once
 - presets: Preset management (project-level configuration templates)
 """
 
-from . import components, config, files, presets
+from . import components, config, files, fleet, presets
 
-__all__ = ["components", "config", "files", "presets"]
+__all__ = ["components", "config", "files", "fleet", "presets"]
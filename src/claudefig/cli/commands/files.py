@@ -8,12 +8,12 @@ from pathlib import Path
 
 import click
 
+from claudefig import registry
 from claudefig.cli.decorators import handle_errors, with_config
 from claudefig.cli.types import FILE_TYPE
 from claudefig.error_messages import ErrorMessages, format_cli_error, format_cli_warning
 from claudefig.logging_config import get_logger
 from claudefig.models import FileType
-from claudefig.repositories.preset_repository import TomlPresetRepository
 from claudefig.services import config_service, file_instance_service
 
 # Import shared console from parent
@@ -216,7 +216,7 @@ def files_add(
 
     # Validate and add
     repo_path = Path(repo_path_arg).resolve()
-    preset_repo = TomlPresetRepository()
+    preset_repo = registry.get_preset_repository()
     result = file_instance_service.add_instance(
         instances_dict, instance, preset_repo, repo_path
     )
@@ -438,7 +438,7 @@ def files_edit(
         return
 
     # Validate changes
-    preset_repo = TomlPresetRepository()
+    preset_repo = registry.get_preset_repository()
     result = file_instance_service.update_instance(
         instances_dict, instance, preset_repo, repo_path
     )
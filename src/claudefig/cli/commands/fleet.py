@@ -0,0 +1,153 @@
+"""Fleet commands.
+
+This module contains commands for initializing or syncing many repositories
+from a single invocation (init, sync).
+"""
+
+from pathlib import Path
+
+import click
+from rich.table import Table
+
+from claudefig.error_messages import format_cli_error
+from claudefig.exceptions import FileReadError
+from claudefig.logging_config import get_logger
+from claudefig.models import FleetRepoResult
+from claudefig.services import fleet_service
+
+# Import shared console from parent
+from .. import console
+
+logger = get_logger("cli.fleet")
+
+
+def fleet_options(func):
+    """Apply the options shared by all fleet commands."""
+    options = [
+        click.option(
+            "--repos-file",
+            required=True,
+            type=click.Path(exists=True, dir_okay=False, path_type=Path),
+            help="File listing one repository path per line (# for comments)",
+        ),
+        click.option(
+            "--jobs",
+            "-j",
+            type=click.IntRange(min=1),
+            default=None,
+            help="Number of repositories processed in parallel (default: CPU count)",
+        ),
+        click.option(
+            "--force",
+            is_flag=True,
+            help="Overwrite existing files",
+        ),
+        click.option(
+            "--staged",
+            is_flag=True,
+            help="Stage each repository's files and move them into place at the end",
+        ),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+@click.group(name="fleet")
+def fleet_group():
+    """Initialize or sync many repositories in one invocation."""
+    pass
+
+
+@fleet_group.command("init")
+@fleet_options
+def fleet_init(repos_file, jobs, force, staged):
+    """Initialize every repository listed in a repos file."""
+    _run_fleet("init", repos_file, jobs, force, staged)
+
+
+@fleet_group.command("sync")
+@fleet_options
+def fleet_sync(repos_file, jobs, force, staged):
+    """Regenerate files in every repository listed in a repos file.
+
+    Repositories without a claudefig.toml are reported as failed.
+    """
+    _run_fleet("sync", repos_file, jobs, force, staged)
+
+
+def _run_fleet(
+    mode: str, repos_file: Path, jobs: int | None, force: bool, staged: bool
+) -> None:
+    """Run a fleet operation and print the consolidated summary.
+
+    Args:
+        mode: "init" or "sync"
+        repos_file: File listing the repositories
+        jobs: Number of worker processes
+        force: Overwrite existing files
+        staged: Stage files per repository
+
+    Raises:
+        click.Abort: If the repos file cannot be read or any repository failed
+    """
+    try:
+        repos = fleet_service.read_repos_file(repos_file)
+    except FileReadError as e:
+        console.print(format_cli_error(str(e)))
+        raise click.Abort() from e
+
+    if not repos:
+        console.print(f"[yellow]No repositories listed in {repos_file}[/yellow]")
+        return
+
+    console.print(f"[bold green]Fleet {mode}:[/bold green] {len(repos)} repositories")
+
+    def report(result: FleetRepoResult) -> None:
+        mark = "[green]+[/green]" if result.success else "[red]x[/red]"
+        console.print(f"{mark} {result.repo_path} ({result.duration:.2f}s)")
+
+    results = fleet_service.run_fleet(
+        repos, mode=mode, jobs=jobs, force=force, staged=staged, on_result=report
+    )
+    _print_fleet_summary(results)
+
+    failed = [result for result in results if not result.success]
+    if failed:
+        logger.info(f"Fleet {mode}: {len(failed)} of {len(results)} failed")
+        raise click.Abort()
+
+
+def _print_fleet_summary(results: list[FleetRepoResult]) -> None:
+    """Print a per-repository summary table with totals.
+
+    Args:
+        results: Fleet results in repository order
+    """
+    table = Table(title="Fleet Summary")
+    table.add_column("Repository", style="cyan")
+    table.add_column("Status")
+    table.add_column("Written", justify="right")
+    table.add_column("Up to date", justify="right")
+    table.add_column("Duration", justify="right")
+    table.add_column("Error", style="dim")
+
+    for result in results:
+        table.add_row(
+            str(result.repo_path),
+            "[green]ok[/green]" if result.success else "[red]failed[/red]",
+            str(result.files_written),
+            str(result.files_unchanged),
+            f"{result.duration:.2f}s",
+            result.error or "",
+        )
+
+    console.print()
+    console.print(table)
+
+    succeeded = sum(1 for result in results if result.success)
+    written = sum(result.files_written for result in results)
+    console.print(
+        f"\n[bold]{succeeded}/{len(results)} repositories succeeded, "
+        f"{written} file(s) written[/bold]"
+    )
@@ -10,7 +10,9 @@ from pathlib import Path
 import click
 from rich.table import Table
 
-from claudefig import __version__
+from claudefig import __version__, registry
+from claudefig.cli.decorators import handle_errors
+from claudefig.cli.types import FILE_TYPE
 from claudefig.error_messages import (
     ErrorMessages,
     format_cli_error,
@@ -22,9 +24,13 @@ from claudefig.exceptions import (
 )
 from claudefig.initializer import Initializer
 from claudefig.logging_config import get_logger, setup_logging
+from claudefig.models import GenerationPlan
 from claudefig.repositories.config_repository import TomlConfigRepository
-from claudefig.repositories.preset_repository import TomlPresetRepository
-from claudefig.services import config_service, file_instance_service
+from claudefig.services import (
+    config_service,
+    file_instance_service,
+    search_service,
+)
 
 # Import shared console from parent
 from . import console
@@ -103,7 +109,24 @@ def main(ctx, verbose, quiet):
     is_flag=True,
     help="Skip interactive prompts (for scripting/testing)",
 )
-def init(path, force, non_interactive):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of file instances to generate in parallel (default: CPU count)",
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    help="Write all files to a staging directory and move them into place at the end",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-register MCP servers even if they are unchanged since the last run",
+)
+def init(path, force, non_interactive, jobs, staged, refresh):
     """Initialize Claude Code configuration in a repository.
 
     Creates necessary files and directory structure for Claude Code integration:
@@ -129,7 +152,12 @@ def init(path, force, non_interactive):
     try:
         initializer = Initializer()
         success = initializer.initialize(
-            repo_path, force=force, skip_prompts=non_interactive
+            repo_path,
+            force=force,
+            skip_prompts=non_interactive,
+            jobs=jobs,
+            staged=staged,
+            refresh_mcp=refresh,
         )
 
         if success:
@@ -246,7 +274,26 @@ def show():
     type=click.Path(exists=True, file_okay=False, dir_okay=True),
     help="Repository path (default: current directory)",
 )
-def setup_mcp(path):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of servers to register concurrently (default: 4)",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=30.0,
+    show_default=True,
+    help="Per-server registration timeout in seconds",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-register servers even if they are unchanged since the last run",
+)
+def setup_mcp(path, jobs, timeout, refresh):
     """Set up MCP servers from configuration files.
 
     Supports two configuration patterns:
@@ -254,7 +301,10 @@ def setup_mcp(path):
     1. Standard .mcp.json in project root
     2. Multiple .json files in .claude/mcp/ directory
 
-    Runs 'claude mcp add-json' for each server configuration.
+    Runs 'claude mcp add-json' for each server configuration, several
+    servers at a time, and reports which registrations succeeded. Servers
+    whose configuration is unchanged since their last successful
+    registration are skipped unless --refresh is given.
 
     Transport types supported:
     \b
@@ -277,7 +327,9 @@ def setup_mcp(path):
 
     try:
         initializer = Initializer()
-        success = initializer.setup_mcp_servers(repo_path)
+        success = initializer.setup_mcp_servers(
+            repo_path, jobs=jobs, timeout=timeout, refresh=refresh
+        )
 
         if not success:
             raise click.Abort()
@@ -299,7 +351,29 @@ def setup_mcp(path):
     is_flag=True,
     help="Overwrite existing files",
 )
-def sync(path, force):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of file instances to generate in parallel (default: CPU count)",
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    help="Write all files to a staging directory and move them into place at the end",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Show what would be written without changing any files",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-register MCP servers even if they are unchanged since the last run",
+)
+def sync(path, force, jobs, staged, dry_run, refresh):
     """Regenerate files from current configuration.
 
     Reads claudefig.toml and regenerates all enabled file instances.
@@ -332,8 +406,17 @@ def sync(path, force):
         # Initialize with existing config
         initializer = Initializer(config_path=config_path)
 
+        if dry_run:
+            plan = initializer.plan(repo_path, force=force, jobs=jobs)
+            _print_generation_plan(plan)
+            if plan.errors:
+                raise click.Abort()
+            return
+
         # Regenerate files
-        success = initializer.initialize(repo_path, force=force)
+        success = initializer.initialize(
+            repo_path, force=force, jobs=jobs, staged=staged, refresh_mcp=refresh
+        )
 
         if success:
             logger.info("Files synchronized successfully")
@@ -351,6 +434,8 @@ def sync(path, force):
         logger.error(f"Synchronization rolled back: {e}", exc_info=True)
         console.print(format_cli_error(str(e)))
         raise click.Abort() from e
+    except click.Abort:
+        raise
     except Exception as e:
         logger.error(f"Synchronization failed: {e}", exc_info=True)
         console.print(
@@ -361,6 +446,44 @@ def sync(path, force):
         raise click.Abort() from e
 
 
+def _print_generation_plan(plan: GenerationPlan) -> None:
+    """Display a generation plan without applying it.
+
+    Args:
+        plan: Plan produced by Initializer.plan()
+    """
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Operation", style="cyan")
+    table.add_column("Destination", style="green")
+    table.add_column("Hash", style="dim")
+
+    for op in plan.operations:
+        try:
+            destination = op.destination.relative_to(plan.repo_path)
+        except ValueError:
+            destination = op.destination
+        table.add_row(op.type.value, str(destination), (op.content_hash or "")[:12])
+
+    console.print()
+    if plan.operations:
+        console.print(table)
+    else:
+        console.print("[blue]i[/blue] Nothing to write")
+
+    if plan.unchanged:
+        console.print(f"[dim]{len(plan.unchanged)} instance(s) are up to date[/dim]")
+    skipped = sum(len(instance_plan.skipped) for instance_plan in plan.instances)
+    if skipped:
+        console.print(
+            f"[dim]{skipped} existing file(s) would be skipped "
+            "(use --force to overwrite)[/dim]"
+        )
+    for instance_plan in plan.errors:
+        console.print(f"[red]x[/red] {instance_plan.error}")
+
+    console.print("\n[yellow]Dry run - no files were written[/yellow]")
+
+
 @main.command()
 @click.option(
     "--path",
@@ -423,7 +546,7 @@ def validate(path):
         total_errors = []
         total_warnings = []
 
-        preset_repo = TomlPresetRepository()
+        preset_repo = registry.get_preset_repository()
         for instance in enabled_instances:
             result = file_instance_service.validate_instance(
                 instance, instances_dict, preset_repo, repo_path, is_update=True
@@ -486,6 +609,71 @@ def validate(path):
         raise click.Abort() from e
 
 
+@main.command()
+@click.argument("query", nargs=-1)
+@click.option(
+    "--type",
+    "file_type",
+    type=FILE_TYPE,
+    help="Only show presets and components of this file type",
+)
+@click.option(
+    "--kind",
+    type=click.Choice(["preset", "component"]),
+    help="Only show presets or only components",
+)
+@click.option(
+    "--limit",
+    "-n",
+    default=20,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of results",
+)
+@click.option(
+    "--rebuild", is_flag=True, help="Rebuild the search index instead of using it"
+)
+@handle_errors("searching")
+def search(query, file_type, kind, limit, rebuild):
+    """Search presets and components by name, tag, type, and description.
+
+    Every QUERY term must match, either as a whole word, as the start of a
+    word, or approximately (e.g. "pyhton" finds "python"). Results are
+    ranked by relevance, with name and tag matches ranked highest.
+    """
+    index = search_service.load_search_index(rebuild=rebuild)
+    matches = index.search(
+        " ".join(query),
+        kind=kind,
+        file_type=file_type.value if file_type else None,
+        limit=limit,
+    )
+
+    if not matches:
+        console.print("[yellow]No matching presets or components found[/yellow]")
+        return
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Kind", style="yellow", no_wrap=True)
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Source", style="green", no_wrap=True)
+    table.add_column("Description", style="white")
+    table.add_column("Tags", style="dim")
+
+    for match in matches:
+        entry = match.entry
+        table.add_row(
+            entry.kind,
+            entry.id,
+            entry.source,
+            entry.description,
+            ", ".join(entry.tags),
+        )
+
+    console.print(table)
+    console.print(f"\n[dim]{len(matches)} result(s)[/dim]")
+
+
 @main.command()
 def interactive():
     """Launch interactive TUI mode."""
@@ -1,19 +1,152 @@
 """Component loading using Chain of Responsibility pattern.
 
 Provides a clean, testable way to load components from multiple sources
-with clear priority ordering.
+with clear priority ordering. Resolutions made through the default chain are
+memoized per process, including misses, so each unique lookup costs at most
+one filesystem check until ``clear_component_cache()`` is called. Misses in
+user-editable locations are re-checked when the directory they would appear
+in changes, so components added by hand are found without invalidation.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable
 from importlib.resources import files
 from pathlib import Path
 
+from claudefig.utils.cache import RACY_WINDOW_NS
+
 logger = logging.getLogger(__name__)
 
 
+def _miss_stamp(path: Path) -> tuple[Path, int] | None:
+    """Stamp the deepest existing directory a missing path would appear in.
+
+    Creating the missing path (or any missing parent of it) modifies that
+    directory, so an unchanged stamp means the path is still missing.
+
+    Args:
+        path: Path that was not found
+
+    Returns:
+        (directory, mtime_ns), or None if no stable stamp can be taken.
+    """
+    directory = path.parent
+    try:
+        while True:
+            try:
+                mtime_ns = directory.stat().st_mtime_ns
+                break
+            except FileNotFoundError:
+                if directory.parent == directory:
+                    return None
+                directory = directory.parent
+    except OSError:
+        return None
+    # Misses under a recently modified directory are not cached
+    if mtime_ns >= time.time_ns() - RACY_WINDOW_NS:
+        return None
+    return directory, mtime_ns
+
+
+def _stamp_matches(stamp: tuple[Path, int]) -> bool:
+    """Check whether a miss stamp's directory is unchanged.
+
+    Args:
+        stamp: (directory, mtime_ns) from ``_miss_stamp``
+
+    Returns:
+        True if the directory's mtime is unchanged.
+    """
+    directory, mtime_ns = stamp
+    try:
+        return directory.stat().st_mtime_ns == mtime_ns
+    except OSError:
+        return False
+
+
+class ComponentResolutionCache:
+    """Thread-safe memo of component path resolutions.
+
+    Stores both hits (a path) and misses (None), so repeated lookups of
+    components that don't exist are as cheap as lookups of ones that do.
+    A miss registered with a ``watch`` path stays valid only while the
+    directory that path would appear in is unchanged.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._resolved: dict[Hashable, Path | None] = {}
+        self._miss_stamps: dict[Hashable, tuple[Path, int]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_resolve(
+        self,
+        key: Hashable,
+        resolver: Callable[[], Path | None],
+        watch: Path | None = None,
+    ) -> Path | None:
+        """Get a cached resolution, resolving and caching it on first use.
+
+        Args:
+            key: Cache key identifying the lookup
+            resolver: Called to resolve the path when the key isn't cached
+            watch: Path the component would be found at, for lookups in
+                locations users edit by hand. A cached miss is re-checked once
+                the directory it would appear in changes.
+
+        Returns:
+            Resolved path, or None if the component was not found.
+        """
+        with self._lock:
+            if key in self._resolved:
+                path = self._resolved[key]
+                stamp = self._miss_stamps.get(key)
+                if stamp is None or _stamp_matches(stamp):
+                    return path
+
+        path = resolver()
+        stamp = _miss_stamp(watch) if path is None and watch is not None else None
+        with self._lock:
+            self._miss_stamps.pop(key, None)
+            if path is None and watch is not None:
+                if stamp is None:
+                    # No stable stamp: resolve again next time
+                    self._resolved.pop(key, None)
+                    return path
+                self._miss_stamps[key] = stamp
+            self._resolved[key] = path
+        return path
+
+    def clear(self) -> None:
+        """Forget all cached resolutions."""
+        with self._lock:
+            self._resolved.clear()
+            self._miss_stamps.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached resolutions."""
+        with self._lock:
+            return len(self._resolved)
+
+
+# Process-wide resolution cache shared by the default loader chain and the
+# preset repositories
+component_cache = ComponentResolutionCache()
+
+
+def clear_component_cache() -> None:
+    """Invalidate all memoized component resolutions.
+
+    Call this after components are added, moved or removed on disk.
+    """
+    component_cache.clear()
+
+
 class ComponentLoader(ABC):
     """Base class for component loaders using Chain of Responsibility pattern.
 
@@ -78,6 +211,22 @@ class PresetComponentLoader(ComponentLoader):
     def try_load(self, preset: str, type: str, name: str) -> Path | None:
         """Try to load component from preset-specific directory.
 
+        Args:
+            preset: Preset name (e.g., "default")
+            type: Component type (e.g., "claude_md")
+            name: Component name (e.g., "default")
+
+        Returns:
+            Path to component if found, None otherwise.
+        """
+        return component_cache.get_or_resolve(
+            ("preset", preset, type, name),
+            lambda: self._find_component(preset, type, name),
+        )
+
+    def _find_component(self, preset: str, type: str, name: str) -> Path | None:
+        """Look up a preset-specific component on disk (uncached).
+
         Args:
             preset: Preset name (e.g., "default")
             type: Component type (e.g., "claude_md")
@@ -118,26 +267,56 @@ class GlobalComponentLoader(ComponentLoader):
             from claudefig.user_config import get_components_dir
 
             global_path = get_components_dir() / type / name
-            if global_path.exists():
-                return global_path
         except (ImportError, OSError) as e:
             logger.debug(f"Could not access global component pool: {e}")
+            return None
+
+        return component_cache.get_or_resolve(
+            ("global", str(global_path)),
+            lambda: _existing_path(global_path),
+            watch=global_path,
+        )
+
+
+def _existing_path(path: Path) -> Path | None:
+    """Return the path if it exists, None otherwise (or if it can't be checked).
+
+    Args:
+        path: Path to check
 
+    Returns:
+        The path, or None.
+    """
+    try:
+        return path if path.exists() else None
+    except OSError as e:
+        logger.debug(f"Could not access {path}: {e}")
         return None
 
 
+_default_chain: ComponentLoader | None = None
+_default_chain_lock = threading.Lock()
+
+
 def create_component_loader_chain() -> ComponentLoader:
-    """Create default component loader chain.
+    """Get the default component loader chain.
 
     Priority order:
     1. Preset-specific components (src/presets/{preset}/components/{type}/{name}/)
     2. Global component pool (~/.claudefig/components/{type}/{name}/)
 
+    The chain is built once per process. Its loaders memoize their lookups
+    in the shared ``component_cache``.
+
     Returns:
         Head of the loader chain.
     """
-    # Build chain in reverse order (last to first)
-    global_loader = GlobalComponentLoader(next_loader=None)
-    preset_loader = PresetComponentLoader(next_loader=global_loader)
+    global _default_chain
+
+    with _default_chain_lock:
+        if _default_chain is None:
+            # Build chain in reverse order (last to first)
+            global_loader = GlobalComponentLoader(next_loader=None)
+            _default_chain = PresetComponentLoader(next_loader=global_loader)
 
-    return preset_loader
+    return _default_chain
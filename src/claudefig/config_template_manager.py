@@ -17,10 +17,15 @@ else:
     import tomli as tomllib
 
 
+from claudefig.component_loaders import clear_component_cache
 from claudefig.models import PresetDefinition
 from claudefig.preset_validator import PresetValidator
 from claudefig.services.preset_definition_loader import PresetDefinitionLoader
-from claudefig.utils.paths import validate_not_symlink
+from claudefig.utils.paths import (
+    DEFAULT_COPY_STRATEGY,
+    copy_file,
+    validate_not_symlink,
+)
 
 if TYPE_CHECKING:
     from claudefig.config import Config
@@ -52,16 +57,23 @@ class ConfigTemplateManager:
             raise ValueError(f"Invalid name after sanitization: '{name}'")
         return sanitized
 
-    def __init__(self, global_presets_dir: Path | None = None):
+    def __init__(
+        self,
+        global_presets_dir: Path | None = None,
+        copy_strategy: str = DEFAULT_COPY_STRATEGY,
+    ):
         """Initialize config template manager.
 
         Args:
             global_presets_dir: Path to global presets directory
                                (default: ~/.claudefig/presets/)
+            copy_strategy: How component files are copied into presets
+                (see ``utils.paths.copy_file``)
         """
         self.global_presets_dir = global_presets_dir or (
             Path.home() / ".claudefig" / "presets"
         )
+        self.copy_strategy = copy_strategy
         self.validator = PresetValidator(self.global_presets_dir)
 
         # Initialize preset loader
@@ -392,17 +404,27 @@ class ConfigTemplateManager:
                     dirs_exist_ok=True,
                     symlinks=False,
                     ignore_dangling_symlinks=True,
+                    copy_function=self._copy_file,
                 )
             else:
                 # If source is a file (shouldn't happen), copy it
                 dest_path.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source_path, dest_path)
+                self._copy_file(source_path, dest_path / source_path.name)
 
         except Exception as e:
             raise FileOperationError(
                 f"copy component {component_type}/{name} to preset", str(e)
             ) from e
 
+    def _copy_file(self, src: str | Path, dst: str | Path) -> None:
+        """Copy a single file using the configured copy strategy.
+
+        Args:
+            src: Source file path
+            dst: Destination file path
+        """
+        copy_file(Path(src), Path(dst), self.copy_strategy)
+
     def _build_preset_definition(
         self, name: str, description: str, components: list[dict[str, Any]]
     ) -> dict[str, Any]:
@@ -523,6 +545,9 @@ class ConfigTemplateManager:
                 raise
             else:
                 raise FileOperationError(f"create preset '{name}'", str(e)) from e
+        finally:
+            # New or removed component folders change component resolution
+            clear_component_cache()
 
     def create_preset_from_discovery(
         self,
@@ -633,6 +658,8 @@ class ConfigTemplateManager:
                 raise FileOperationError(
                     f"create preset '{preset_name}'", str(e)
                 ) from e
+        finally:
+            clear_component_cache()
 
     def delete_global_preset(self, name: str) -> None:
         """Delete a global preset directory.
@@ -652,6 +679,7 @@ class ConfigTemplateManager:
             raise FileNotFoundError(f"Preset '{name}' not found")
 
         shutil.rmtree(preset_dir)
+        clear_component_cache()
 
     def apply_preset_to_project(
         self,
@@ -1,35 +1,126 @@
 """Repository initialization logic for claudefig."""
 
+import contextlib
+import os
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 from rich.console import Console
 
-from claudefig.exceptions import FileOperationError, InitializationRollbackError
-from claudefig.models import FileInstance, FileType
+from claudefig import registry
+from claudefig.exceptions import (
+    FileOperationError,
+    FileWriteError,
+    InitializationRollbackError,
+)
+from claudefig.models import (
+    FileInstance,
+    FileType,
+    GenerationPlan,
+    InstancePlan,
+    OperationType,
+    PlannedOperation,
+)
 from claudefig.preset_manager import PresetManager
 from claudefig.repositories.config_repository import TomlConfigRepository
 from claudefig.repositories.preset_repository import TomlPresetRepository
-from claudefig.services import config_service, file_instance_service
+from claudefig.services import (
+    config_service,
+    file_instance_service,
+    gitignore_service,
+    manifest_service,
+    mcp_registration_service,
+    preset_service,
+)
 from claudefig.template_manager import FileTemplateManager
+from claudefig.utils.hashing import hash_file, hash_text
 from claudefig.utils.paths import (
+    COPY_STRATEGIES,
+    DEFAULT_COPY_STRATEGY,
+    copy_file,
     ensure_directory,
     is_git_repository,
     validate_not_symlink,
 )
-from claudefig.utils.platform import is_windows
+from claudefig.utils.platform import is_windows, run_commands_concurrently
+from claudefig.utils.templating import (
+    STREAMING_RENDER_THRESHOLD,
+    render_template_file,
+)
 
 console = Console()
 
+# Prefix of the temporary directory staged initialization renders into
+STAGING_DIR_PREFIX = ".claudefig-staging-"
+
+# Directory, relative to the repository root, that holds staging directories
+STAGING_PARENT_DIR = ".claude"
+
+# Concurrency and per-server timeout for 'claude mcp add-json' registrations
+MCP_SETUP_JOBS = 4
+MCP_COMMAND_TIMEOUT = 30.0
+
+
+def default_jobs() -> int:
+    """Get the default number of parallel generation workers.
+
+    Returns:
+        Number of CPUs available, or 1 if it cannot be determined.
+    """
+    return os.cpu_count() or 1
+
+
+@dataclass
+class _GenerationContext:
+    """Output and rollback tracking captured while generating one instance.
+
+    Worker threads record into a context instead of printing or mutating the
+    shared tracking lists, so results can be replayed in instance order.
+    """
+
+    messages: list[str] = field(default_factory=list)
+    files: list[Path] = field(default_factory=list)
+    dirs: list[Path] = field(default_factory=list)
+
+
+def _remove_stale_staging_dirs(repo_path: Path) -> None:
+    """Remove staging directories left behind by an interrupted staged run.
+
+    Older versions staged directly in the repository root, so both locations
+    are checked.
+
+    Args:
+        repo_path: Repository root path
+    """
+    for parent in (repo_path / STAGING_PARENT_DIR, repo_path):
+        if not parent.is_dir():
+            continue
+        for stale in parent.glob(f"{STAGING_DIR_PREFIX}*"):
+            if stale.is_dir() and not stale.is_symlink():
+                shutil.rmtree(stale, ignore_errors=True)
+
 
 class Initializer:
     """Handles repository initialization."""
 
-    def __init__(self, config_path: Path | None = None):
+    def __init__(
+        self,
+        config_path: Path | None = None,
+        preset_manager: PresetManager | None = None,
+        preset_repo: TomlPresetRepository | None = None,
+    ):
         """Initialize the Initializer.
 
         Args:
             config_path: Path to config file. If None, finds or uses default.
+            preset_manager: Preset manager to use (default: the shared one
+                from ``claudefig.registry``).
+            preset_repo: Preset repository used for template content
+                (default: the shared one from ``claudefig.registry``).
         """
         # Initialize repositories
         if config_path is None:
@@ -45,24 +136,64 @@ class Initializer:
         self.template_manager = FileTemplateManager(
             Path(custom_dir) if custom_dir else None
         )
-        self.preset_manager = PresetManager()
-        self.preset_repo = TomlPresetRepository()
+        self.preset_manager = preset_manager or registry.get_preset_manager()
+        self.preset_repo = preset_repo or registry.get_preset_repository()
+
+        # How component files are copied (copy, reflink, hardlink or auto)
+        self.copy_strategy = config_service.get_value(
+            self.config_data, "init.copy_strategy", DEFAULT_COPY_STRATEGY
+        )
+        if self.copy_strategy not in COPY_STRATEGIES:
+            console.print(
+                f"[yellow]Warning:[/yellow] Unknown init.copy_strategy "
+                f"'{self.copy_strategy}', using '{DEFAULT_COPY_STRATEGY}'"
+            )
+            self.copy_strategy = DEFAULT_COPY_STRATEGY
 
         # Instance tracking
         self.instances_dict: dict[str, FileInstance] = {}
 
+        # Counts from the last initialize() run
+        self.files_written = 0
+        self.files_unchanged = 0
+
         # Track created files/directories for rollback
         self._created_files: list[Path] = []
         self._created_dirs: list[Path] = []
         self._rollback_enabled: bool = True
 
+        # Per-thread generation context (set only on parallel workers)
+        self._local = threading.local()
+
+        # (repo root, staging dir) while a staged plan is being applied
+        self._staging: tuple[Path, Path] | None = None
+
+    def _current_context(self) -> _GenerationContext | None:
+        """Get the generation context of the calling worker thread, if any."""
+        return getattr(self._local, "context", None)
+
+    def _print(self, message: str) -> None:
+        """Print a generation message, buffering it on worker threads.
+
+        Args:
+            message: Rich-formatted message to print
+        """
+        context = self._current_context()
+        if context is not None:
+            context.messages.append(message)
+        else:
+            console.print(message)
+
     def _track_file(self, file_path: Path) -> None:
         """Track a created file for potential rollback.
 
         Args:
             file_path: Path to file that was created
         """
-        if self._rollback_enabled and file_path not in self._created_files:
+        context = self._current_context()
+        if context is not None:
+            context.files.append(file_path)
+        elif self._rollback_enabled and file_path not in self._created_files:
             self._created_files.append(file_path)
 
     def _track_directory(self, dir_path: Path) -> None:
@@ -71,7 +202,10 @@ class Initializer:
         Args:
             dir_path: Path to directory that was created
         """
-        if self._rollback_enabled and dir_path not in self._created_dirs:
+        context = self._current_context()
+        if context is not None:
+            context.dirs.append(dir_path)
+        elif self._rollback_enabled and dir_path not in self._created_dirs:
             self._created_dirs.append(dir_path)
 
     def _rollback(self) -> None:
@@ -113,7 +247,13 @@ class Initializer:
         self._created_dirs.clear()
 
     def initialize(
-        self, repo_path: Path, force: bool = False, skip_prompts: bool = False
+        self,
+        repo_path: Path,
+        force: bool = False,
+        skip_prompts: bool = False,
+        jobs: int | None = None,
+        staged: bool = False,
+        refresh_mcp: bool = False,
     ) -> bool:
         """Initialize Claude Code configuration in repository.
 
@@ -123,6 +263,12 @@ class Initializer:
             repo_path: Path to repository to initialize
             force: If True, overwrite existing files
             skip_prompts: If True, skip interactive prompts (for TUI/non-interactive use)
+            jobs: Number of instances to generate concurrently. Defaults to the
+                CPU count; 1 generates instances sequentially.
+            staged: If True, render all files into a staging directory and
+                only move them into place once every instance succeeded.
+            refresh_mcp: If True, re-register MCP servers even if their
+                configuration is unchanged since the last registration.
 
         Returns:
             True if initialization successful, False otherwise.
@@ -132,6 +278,8 @@ class Initializer:
         """
         # Clear any previous tracking
         self._clear_tracking()
+        self.files_written = 0
+        self.files_unchanged = 0
 
         # Disable rollback in force mode (user explicitly wants to overwrite)
         self._rollback_enabled = not force
@@ -156,26 +304,7 @@ class Initializer:
         failed_files = []
 
         try:
-            # Load file instances from config
-            instances_data = config_service.get_file_instances(self.config_data)
-
-            if not instances_data:
-                # No file instances configured - create default ones
-                console.print(
-                    "[yellow]No file instances configured, using defaults[/yellow]"
-                )
-                instances_data = self._create_default_instances()
-                config_service.set_file_instances(self.config_data, instances_data)
-
-            # Load instances into dictionary
-            self.instances_dict, load_errors = (
-                file_instance_service.load_instances_from_config(instances_data)
-            )
-
-            # Show load errors if any
-            if load_errors:
-                for error in load_errors:
-                    console.print(f"[yellow]Warning:[/yellow] {error}")
+            self._load_instances()
 
             # Create .claude directory
             claude_dir = repo_path / ".claude"
@@ -187,6 +316,9 @@ class Initializer:
             # Generate files from file instances
             success = True
             files_created = 0
+            files_unchanged = 0
+            manifest = manifest_service.load_manifest(repo_path)
+            plan = None
 
             enabled_instances = file_instance_service.list_instances(
                 self.instances_dict, enabled_only=True
@@ -199,17 +331,42 @@ class Initializer:
                     f"\n[bold blue]Generating {len(enabled_instances)} file(s)...[/bold blue]\n"
                 )
 
-                for instance in enabled_instances:
-                    result = self._generate_file_from_instance(
-                        instance, repo_path, force
+                plan = self._build_plan(
+                    enabled_instances, repo_path, force, jobs, manifest=manifest
+                )
+
+                # Reject the whole plan before touching disk if most of it
+                # failed, or if anything failed in all-or-nothing staged mode
+                if (staged and plan.errors) or (
+                    self._rollback_enabled
+                    and len(plan.errors) > len(enabled_instances) // 2
+                ):
+                    for instance_plan in plan.errors:
+                        console.print(f"[red]x[/red] {instance_plan.error}")
+                    raise InitializationRollbackError(
+                        [instance_plan.path for instance_plan in plan.errors],
+                        [
+                            f"Failed to generate {instance_plan.path}"
+                            for instance_plan in plan.errors
+                        ],
                     )
-                    if result:
+
+                results = self.apply_plan(plan, jobs, staged=staged)
+                for instance_plan, result in zip(plan.instances, results, strict=True):
+                    if result and instance_plan.unchanged:
+                        files_unchanged += 1
+                    elif result:
                         files_created += 1
                     else:
-                        failed_files.append(instance.path)
-                        errors.append(f"Failed to generate {instance.path}")
+                        failed_files.append(instance_plan.path)
+                        errors.append(f"Failed to generate {instance_plan.path}")
                     success &= result
 
+                if staged and not success:
+                    # Nothing was committed, so there are no files to undo
+                    console.print("[yellow]Staged changes discarded[/yellow]")
+                    raise InitializationRollbackError(failed_files, errors)
+
             # Create config file if it doesn't exist
             config_path = repo_path / "claudefig.toml"
             if not config_path.exists():
@@ -231,9 +388,17 @@ class Initializer:
                 # More than half failed - this is a critical failure
                 raise InitializationRollbackError(failed_files, errors)
 
+            if plan is not None:
+                self._save_manifest(manifest, plan, results)
+
+            self.files_written = files_created
+            self.files_unchanged = files_unchanged
+
             # Summary
             console.print("\n[bold]Summary:[/bold]")
             console.print(f"  Files created: {files_created}")
+            if files_unchanged:
+                console.print(f"  Up to date: {files_unchanged}")
             console.print(f"  Enabled instances: {len(enabled_instances)}")
 
             if success:
@@ -247,7 +412,9 @@ class Initializer:
                 )
 
             # Auto-setup MCP servers if any MCP instances were enabled
-            self._auto_setup_mcp_servers(repo_path, enabled_instances)
+            self._auto_setup_mcp_servers(
+                repo_path, enabled_instances, refresh=refresh_mcp
+            )
 
             # Clear tracking on success
             self._clear_tracking()
@@ -273,6 +440,64 @@ class Initializer:
 
             return False
 
+    def _load_instances(self) -> None:
+        """Load file instances from config into ``instances_dict``.
+
+        Falls back to default instances when none are configured.
+        """
+        instances_data = config_service.get_file_instances(self.config_data)
+
+        if not instances_data:
+            # No file instances configured - create default ones
+            console.print(
+                "[yellow]No file instances configured, using defaults[/yellow]"
+            )
+            instances_data = self._create_default_instances()
+            config_service.set_file_instances(self.config_data, instances_data)
+
+        # Load instances into dictionary
+        self.instances_dict, load_errors = (
+            file_instance_service.load_instances_from_config(instances_data)
+        )
+
+        # Show load errors if any
+        if load_errors:
+            for error in load_errors:
+                console.print(f"[yellow]Warning:[/yellow] {error}")
+
+    def plan(
+        self, repo_path: Path, force: bool = False, jobs: int | None = None
+    ) -> GenerationPlan:
+        """Plan initialization without writing anything to disk.
+
+        Args:
+            repo_path: Path to repository to initialize
+            force: If True, plan to overwrite existing files
+            jobs: Number of instances to plan concurrently (default: CPU count)
+
+        Returns:
+            GenerationPlan describing every operation initialization would apply.
+
+        Raises:
+            FileOperationError: If the repository path cannot be resolved
+        """
+        try:
+            repo_path = repo_path.resolve()
+        except (OSError, RuntimeError) as e:
+            raise FileOperationError(f"resolve path {repo_path}", str(e)) from e
+
+        self._load_instances()
+        enabled_instances = file_instance_service.list_instances(
+            self.instances_dict, enabled_only=True
+        )
+        return self._build_plan(
+            enabled_instances,
+            repo_path,
+            force,
+            jobs,
+            manifest=manifest_service.load_manifest(repo_path),
+        )
+
     def _create_default_instances(self) -> list[dict]:
         """Create default file instances when none are configured.
 
@@ -288,141 +513,412 @@ class Initializer:
 
         return defaults
 
-    def _generate_file_from_instance(
-        self, instance, repo_path: Path, force: bool
-    ) -> bool:
-        """Generate a file from a file instance.
+    def _build_plan(
+        self,
+        instances: list[FileInstance],
+        repo_path: Path,
+        force: bool,
+        jobs: int | None = None,
+        manifest: dict | None = None,
+    ) -> GenerationPlan:
+        """Turn file instances into an immutable generation plan.
+
+        Planning reads presets and templates but never writes to disk.
+        Instances whose manifest entry still matches are marked unchanged
+        without reading their templates. Single-file instances that share a
+        destination with another instance fail planning, and appends to a
+        shared destination are coalesced into one operation.
 
         Args:
-            instance: FileInstance to generate
+            instances: Enabled instances, in the order they should be applied
             repo_path: Repository root path
             force: Whether to overwrite existing files
+            jobs: Maximum number of worker threads (default: CPU count)
+            manifest: Manifest from the previous run, if any
 
         Returns:
-            True if successful, False otherwise
+            GenerationPlan with one InstancePlan per instance.
         """
-        # Use preset/component system for all file types
-        preset = self.preset_manager.get_preset(instance.preset)
-        if not preset:
-            console.print(
-                f"[red]x[/red] Preset not found for instance '{instance.id}': {instance.preset}"
+        entries = manifest["instances"] if manifest else {}
+        conflicts = self._find_destination_conflicts(instances, repo_path)
+
+        def plan_instance(instance: FileInstance) -> InstancePlan:
+            if instance.id in conflicts:
+                return InstancePlan(
+                    instance_id=instance.id,
+                    path=instance.path,
+                    destination=repo_path / instance.path,
+                    error=conflicts[instance.id],
+                )
+            return self._plan_instance(
+                instance, repo_path, force, entries.get(instance.id)
             )
-            return False
 
+        max_workers = default_jobs() if jobs is None else max(1, jobs)
+        if max_workers == 1 or len(instances) <= 1:
+            instance_plans = [plan_instance(instance) for instance in instances]
+        else:
+            # Load the preset cache up front so workers only ever read it
+            self.preset_manager.list_presets()
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(instances))
+            ) as pool:
+                instance_plans = list(pool.map(plan_instance, instances))
+
+        instance_plans = self._coalesce_appends(
+            instance_plans, instances, repo_path, force
+        )
+
+        if not force:
+            instance_plans = self._skip_claimed_destinations(instance_plans)
+
+        return GenerationPlan(
+            repo_path=repo_path, force=force, instances=tuple(instance_plans)
+        )
+
+    def _find_destination_conflicts(
+        self, instances: list[FileInstance], repo_path: Path
+    ) -> dict[str, str]:
+        """Find instances whose destination is claimed by an earlier instance.
+
+        Several append-mode instances may share a destination (their entries
+        are merged), and directory instances may share a directory. Any other
+        combination would make the output depend on apply order, so every
+        instance after the first one for such a destination is a conflict.
+
+        Args:
+            instances: Enabled instances, in apply order
+            repo_path: Repository root path
+
+        Returns:
+            Mapping of conflicting instance id to an error message.
+        """
+        by_destination: dict[str, list[FileInstance]] = {}
+        for instance in instances:
+            if instance.type.is_directory:
+                continue
+            key = os.path.normcase(os.path.normpath(repo_path / instance.path))
+            by_destination.setdefault(key, []).append(instance)
+
+        conflicts: dict[str, str] = {}
+        for group in by_destination.values():
+            if len(group) < 2 or all(i.type.append_mode for i in group):
+                continue
+            first = group[0]
+            for instance in group[1:]:
+                conflicts[instance.id] = (
+                    f"Conflicting destination for instance '{instance.id}': "
+                    f"{instance.path} is also generated by '{first.id}'"
+                )
+        return conflicts
+
+    def _coalesce_appends(
+        self,
+        instance_plans: list[InstancePlan],
+        instances: list[FileInstance],
+        repo_path: Path,
+        force: bool,
+    ) -> list[InstancePlan]:
+        """Merge appends to a shared destination into a single operation.
+
+        The first instance appending to a destination carries one operation
+        with the entries of every instance, so the file is read and written
+        once. The others keep no operations and point at it through
+        ``coalesced_into``. Because the merged operation rewrites the whole
+        managed block, a group is replanned in full when any member changed.
+
+        Args:
+            instance_plans: Instance plans in apply order
+            instances: Instances matching ``instance_plans``
+            repo_path: Repository root path
+            force: Whether to overwrite existing files
+
+        Returns:
+            Instance plans with shared appends coalesced.
+        """
+        groups: dict[Path, list[int]] = {}
+        for index, instance in enumerate(instances):
+            if instance.type.append_mode and not instance_plans[index].has_error:
+                groups.setdefault(instance_plans[index].destination, []).append(index)
+
+        resolved = list(instance_plans)
+        for indices in groups.values():
+            if len(indices) < 2 or all(resolved[i].unchanged for i in indices):
+                continue
+
+            for index in indices:
+                if resolved[index].unchanged:
+                    resolved[index] = self._plan_instance(
+                        instances[index], repo_path, force
+                    )
+
+            members = [i for i in indices if not resolved[i].has_error]
+            appends = [
+                op
+                for i in members
+                for op in resolved[i].operations
+                if op.type == OperationType.APPEND
+            ]
+            if len(members) < 2 or not appends:
+                continue
+
+            content = "\n".join(op.content or "" for op in appends)
+            merged = replace(
+                appends[0], content=content, content_hash=hash_text(content)
+            )
+            lead = resolved[members[0]]
+            resolved[members[0]] = replace(lead, operations=(merged,))
+            for index in members[1:]:
+                resolved[index] = replace(
+                    resolved[index], operations=(), coalesced_into=lead.instance_id
+                )
+
+        return resolved
+
+    def _skip_claimed_destinations(
+        self, instance_plans: list[InstancePlan]
+    ) -> list[InstancePlan]:
+        """Skip writes to destinations already written by an earlier instance.
+
+        Without force, an existing file is never overwritten. That includes
+        files created earlier in the same plan, so the first instance wins.
+
+        Args:
+            instance_plans: Instance plans in apply order
+
+        Returns:
+            Instance plans with later duplicate writes moved to ``skipped``.
+        """
+        claimed: set[Path] = set()
+        resolved = []
+        for instance_plan in instance_plans:
+            operations = []
+            skipped = list(instance_plan.skipped)
+            for op in instance_plan.operations:
+                if op.type in (
+                    OperationType.WRITE,
+                    OperationType.COPY,
+                    OperationType.RENDER,
+                ):
+                    if op.destination in claimed:
+                        skipped.append(op.destination)
+                        continue
+                    claimed.add(op.destination)
+                operations.append(op)
+            if len(operations) != len(instance_plan.operations):
+                instance_plan = replace(
+                    instance_plan,
+                    operations=tuple(operations),
+                    skipped=tuple(skipped),
+                )
+            resolved.append(instance_plan)
+        return resolved
+
+    def _plan_instance(
+        self,
+        instance: FileInstance,
+        repo_path: Path,
+        force: bool,
+        manifest_entry: dict | None = None,
+    ) -> InstancePlan:
+        """Plan the operations needed to generate a file instance.
+
+        Args:
+            instance: FileInstance to plan
+            repo_path: Repository root path
+            force: Whether to overwrite existing files
+            manifest_entry: Manifest entry recorded for the instance, if any
+
+        Returns:
+            InstancePlan with operations, skipped destinations or an error.
+        """
         # Determine full path
         dest_path = repo_path / instance.path
+        instance_plan = InstancePlan(
+            instance_id=instance.id, path=instance.path, destination=dest_path
+        )
+
+        # Use preset/component system for all file types
+        preset = self.preset_manager.get_preset(instance.preset)
+        if not preset:
+            return replace(
+                instance_plan,
+                error=f"Preset not found for instance '{instance.id}': {instance.preset}",
+            )
 
         # Check if file/directory already exists
         if dest_path.exists() and not force and not instance.type.append_mode:
-            console.print(f"[blue]i[/blue] Already exists (skipped): {dest_path}")
-            return True  # Treat existing files as success (skip)
+            return replace(instance_plan, skipped=(dest_path,))
 
         try:
+            sources = tuple(self._get_instance_sources(instance, preset))
+            variables = self._get_template_variables(instance, preset)
+            instance_plan = replace(instance_plan, sources=sources, variables=variables)
+
+            # Skip reading templates entirely when nothing has drifted
+            if manifest_service.is_instance_current(
+                manifest_entry, instance, list(sources), repo_path, variables
+            ):
+                return replace(instance_plan, unchanged=True)
+
             if instance.type.is_directory:
                 # Handle directory-based file types (commands, agents, hooks, etc.)
-                return self._generate_directory_from_instance(
+                operations, skipped = self._plan_directory(
                     instance, preset, dest_path, force
                 )
-            elif instance.type.append_mode:
-                # Handle append mode (gitignore)
-                return self._append_file_from_instance(instance, preset, dest_path)
+                return replace(instance_plan, operations=operations, skipped=skipped)
+
+            # Make statusline executable (Unix only)
+            executable = instance.type == FileType.STATUSLINE and not is_windows()
+
+            # Large single-file templates are streamed to disk when applied
+            if (
+                not instance.type.append_mode
+                and len(sources) == 1
+                and sources[0].stat().st_size >= STREAMING_RENDER_THRESHOLD
+            ):
+                operation = PlannedOperation(
+                    type=OperationType.RENDER,
+                    destination=dest_path,
+                    source=sources[0],
+                    variables=variables,
+                    executable=executable,
+                )
+                return replace(instance_plan, operations=(operation,))
+
+            # Single files and append mode (gitignore) use the rendered template
+            content = self._render_instance_template(preset, variables)
+            if instance.type.append_mode:
+                operation = PlannedOperation(
+                    type=OperationType.APPEND,
+                    destination=dest_path,
+                    content=content.strip(),
+                    content_hash=hash_text(content.strip()),
+                )
             else:
-                # Handle single file types
-                return self._generate_single_file_from_instance(
-                    instance, preset, dest_path
+                operation = PlannedOperation(
+                    type=OperationType.WRITE,
+                    destination=dest_path,
+                    content=content,
+                    content_hash=hash_text(content),
+                    executable=executable,
                 )
+            return replace(instance_plan, operations=(operation,))
 
         except Exception as e:
-            console.print(f"[red]x[/red] Error generating {instance.path}: {e}")
-            return False
+            return replace(
+                instance_plan, error=f"Error generating {instance.path}: {e}"
+            )
 
-    def _generate_single_file_from_instance(
-        self, instance, preset, dest_path: Path
-    ) -> bool:
-        """Generate a single file from an instance.
+    def _render_instance_template(self, preset, variables: dict | None) -> str:
+        """Render the template of a single-file instance.
+
+        Templates are compiled once per file through the shared compiled
+        template cache, so instances reusing a template only pay for
+        substitution. Without any variables the template is written verbatim,
+        leaving literal ``{{``/``}}`` in existing templates untouched.
 
         Args:
-            instance: FileInstance
             preset: Preset to use
-            dest_path: Destination file path
+            variables: Merged variables from ``_get_template_variables``
 
         Returns:
-            True if successful
+            Template content with variables substituted.
         """
-        try:
-            # Get content from preset using component system
-            content = self.preset_repo.get_template_content(preset)
+        if variables is None:
+            return self.preset_repo.get_template_content(preset)
 
-            # Create parent directory if needed
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+        return preset_service.render_preset(self.preset_repo, preset, variables)
 
-            # Write content
-            dest_path.write_text(content, encoding="utf-8")
-            self._track_file(dest_path)  # Track for rollback
-            console.print(f"[green]+[/green] Created: {dest_path}")
+    def _get_template_variables(self, instance, preset) -> dict | None:
+        """Merge the template variables of an instance.
 
-            # Make statusline executable (Unix only)
-            if instance.type == FileType.STATUSLINE and not is_windows():
-                dest_path.chmod(0o755)
+        Args:
+            instance: FileInstance being generated
+            preset: Preset to use
 
-            return True
+        Returns:
+            Preset defaults (including those inherited through ``extends``)
+            overridden by instance variables, or None if none are defined
+            (the template is used verbatim).
 
-        except Exception as e:
-            console.print(f"[red]x[/red] Error generating {instance.path}: {e}")
-            return False
+        Raises:
+            CircularDependencyError: If the preset's inheritance has a cycle
+        """
+        # component_name selects the component; it is not a template variable
+        variables = preset_service.resolve_preset_variables(self.preset_repo, preset)
+        variables.update(
+            (key, value)
+            for key, value in instance.variables.items()
+            if key != "component_name"
+        )
+        return variables or None
 
-    def _append_file_from_instance(self, instance, preset, dest_path: Path) -> bool:
-        """Append content to a file (for gitignore).
+    def _get_instance_sources(self, instance, preset) -> list[Path]:
+        """Get the component files an instance is generated from.
 
         Args:
             instance: FileInstance
             preset: Preset to use
-            dest_path: Destination file path
 
         Returns:
-            True if successful
+            Source file paths, or an empty list if they are not file-backed.
+
+        Raises:
+            FileNotFoundError: If a directory component folder does not exist
         """
-        try:
-            # Get entries from preset using component system
-            entries = self.preset_repo.get_template_content(preset)
-            entries = entries.strip()
+        if instance.type.is_directory:
+            component_folder = self._get_component_folder(instance, preset)
+            return [
+                item for item in sorted(component_folder.iterdir()) if item.is_file()
+            ]
 
-            # Check if .gitignore exists
-            if dest_path.exists():
-                existing_content = dest_path.read_text(encoding="utf-8")
+        template_path = self.preset_repo.get_template_path(preset)
+        return [template_path] if isinstance(template_path, Path) else []
 
-                # Check if claudefig section already exists
-                if (
-                    "# claudefig" in existing_content
-                    or "claudefig.toml" in existing_content
-                ):
-                    console.print(
-                        f"[blue]i[/blue] Already contains entries: {dest_path}"
-                    )
-                    return True
+    def _get_component_folder(self, instance, preset) -> Path:
+        """Get the builtin component folder for a directory instance.
 
-                # Append to existing
-                separator = "\n\n" if existing_content.strip() else ""
-                new_content = existing_content.rstrip() + separator + entries + "\n"
-                dest_path.write_text(new_content, encoding="utf-8")
-                # Don't track appends - file already existed
-                console.print(f"[green]+[/green] Updated: {dest_path}")
-            else:
-                # Create new
-                dest_path.write_text(entries + "\n", encoding="utf-8")
-                self._track_file(dest_path)  # Track for rollback
-                console.print(f"[green]+[/green] Created: {dest_path}")
+        Args:
+            instance: FileInstance
+            preset: Preset to use
 
-            return True
+        Returns:
+            Path to the component folder.
 
-        except Exception as e:
-            console.print(f"[red]x[/red] Error reading preset template: {e}")
-            return False
+        Raises:
+            FileNotFoundError: If the component folder does not exist
+        """
+        # Use component system to get source folder
+        # Extract component name from preset (e.g., "commands:default" -> "default")
+        component_name = preset.id.split(":")[-1] if ":" in preset.id else preset.name
+
+        # Get component folder from preset repository
+        from importlib.resources import files
+
+        # Path: src/presets/default/components/{file_type}/{component_name}/
+        builtin_source = files("presets").joinpath("default")
+
+        # Get the actual path
+        if hasattr(builtin_source, "__fspath__"):
+            source_path = Path(builtin_source)  # type: ignore[arg-type]
+        else:
+            # For Python 3.10+, extract path as string
+            source_path = Path(str(builtin_source))
 
-    def _generate_directory_from_instance(
+        component_folder: Path = (
+            source_path / "components" / instance.type.value / component_name
+        )
+
+        if not component_folder.exists() or not component_folder.is_dir():
+            raise FileNotFoundError(f"Component folder not found: {component_folder}")
+
+        return component_folder
+
+    def _plan_directory(
         self, instance, preset, dest_path: Path, force: bool
-    ) -> bool:
-        """Generate a directory with template files from an instance.
+    ) -> tuple[tuple[PlannedOperation, ...], tuple[Path, ...]]:
+        """Plan copying a component directory for an instance.
 
         Args:
             instance: FileInstance
@@ -431,70 +927,411 @@ class Initializer:
             force: Whether to overwrite existing files
 
         Returns:
-            True if successful
+            Tuple of (planned operations, skipped destinations).
+
+        Raises:
+            FileNotFoundError: If the component folder does not exist
+            ValueError: If a component file is a symbolic link
         """
-        # Use component system to get source folder
-        # Extract component name from preset (e.g., "commands:default" -> "default")
-        component_name = preset.id.split(":")[-1] if ":" in preset.id else preset.name
+        component_folder = self._get_component_folder(instance, preset)
 
-        # Get component folder from preset repository
-        from importlib.resources import files
+        operations: list[PlannedOperation] = []
+        skipped: list[Path] = []
+
+        # Create destination directory
+        if not dest_path.exists():
+            operations.append(
+                PlannedOperation(type=OperationType.MKDIR, destination=dest_path)
+            )
+
+        # Copy all files from component folder to destination
+        for item in sorted(component_folder.iterdir()):
+            if item.is_file():
+                # Security: Reject symlinks
+                validate_not_symlink(item, context="component file")
+
+                dest_file = dest_path / item.name
+                if dest_file.exists() and not force:
+                    skipped.append(dest_file)
+                    continue
+
+                operations.append(
+                    PlannedOperation(
+                        type=OperationType.COPY,
+                        destination=dest_file,
+                        source=item,
+                        content_hash=hash_file(item),
+                    )
+                )
+
+        return tuple(operations), tuple(skipped)
+
+    def apply_plan(
+        self, plan: GenerationPlan, jobs: int | None = None, staged: bool = False
+    ) -> list[bool]:
+        """Apply a generation plan, optionally in parallel.
+
+        Instance plans targeting the same destination are applied in order on
+        a single worker. Console output and rollback tracking are replayed in
+        instance order, so results are identical to a sequential run.
+
+        In staged mode every file is first written into a temporary directory
+        under the repository's ``.claude/`` directory (same filesystem) and
+        moved into place with renames only if all instances succeeded.
+        Otherwise the staging directory is removed and the repository is left
+        untouched. Staging directories left behind by a crashed run are
+        removed before a new one is created.
 
+        Args:
+            plan: Plan produced by the planning phase
+            jobs: Maximum number of worker threads (default: CPU count)
+            staged: If True, apply the plan through a staging directory
+
+        Returns:
+            List of per-instance results, in the same order as ``plan.instances``
+
+        Raises:
+            FileOperationError: If staged files cannot be moved into place
+        """
+        if not staged:
+            return self._apply_instance_plans(plan, jobs)
+
+        staging_parent = plan.repo_path / STAGING_PARENT_DIR
+        created_parent = not staging_parent.exists()
+        _remove_stale_staging_dirs(plan.repo_path)
+        staging_parent.mkdir(parents=True, exist_ok=True)
+        staging_dir = Path(
+            tempfile.mkdtemp(prefix=STAGING_DIR_PREFIX, dir=staging_parent)
+        )
         try:
-            # Path: src/presets/default/components/{file_type}/{component_name}/
-            builtin_source = files("presets").joinpath("default")
+            self._staging = (plan.repo_path, staging_dir)
+            try:
+                results = self._apply_instance_plans(plan, jobs)
+            finally:
+                self._staging = None
+
+            if all(results):
+                self._commit_staging_dir(staging_dir, plan.repo_path)
+            return results
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            if created_parent:
+                # Leave no trace of a run that did not commit anything there
+                with contextlib.suppress(OSError):
+                    staging_parent.rmdir()
+
+    def _commit_staging_dir(self, staging_dir: Path, repo_path: Path) -> None:
+        """Move every staged file into place in the repository.
 
-            # Get the actual path
-            if hasattr(builtin_source, "__fspath__"):
-                source_path = Path(builtin_source)  # type: ignore[arg-type]
-            else:
-                # For Python 3.10+, extract path as string
-                source_path = Path(str(builtin_source))
+        Args:
+            staging_dir: Staging directory mirroring the repository layout
+            repo_path: Repository root path
+
+        Raises:
+            FileOperationError: If a staged file cannot be moved into place
+        """
+        try:
+            for root, _dirs, filenames in os.walk(staging_dir):
+                dest_dir = repo_path / Path(root).relative_to(staging_dir)
+                dest_dir.mkdir(parents=True, exist_ok=True)
+                for filename in filenames:
+                    os.replace(Path(root) / filename, dest_dir / filename)
+        except OSError as e:
+            raise FileOperationError("commit staged files", str(e)) from e
+
+    def _staged_path(self, dest_path: Path) -> Path:
+        """Map a destination to the path it is written to while applying.
+
+        Args:
+            dest_path: Final destination path
+
+        Returns:
+            The matching path in the staging directory when staging,
+            otherwise ``dest_path`` itself.
+        """
+        if self._staging is None:
+            return dest_path
+        repo_path, staging_dir = self._staging
+        return staging_dir / dest_path.relative_to(repo_path)
+
+    def _apply_instance_plans(
+        self, plan: GenerationPlan, jobs: int | None = None
+    ) -> list[bool]:
+        """Apply the instance plans of a generation plan, optionally in parallel.
 
-            component_folder = (
-                source_path / "components" / instance.type.value / component_name
+        Args:
+            plan: Plan produced by the planning phase
+            jobs: Maximum number of worker threads (default: CPU count)
+
+        Returns:
+            List of per-instance results, in the same order as ``plan.instances``
+        """
+        instance_plans = plan.instances
+        max_workers = default_jobs() if jobs is None else max(1, jobs)
+        if max_workers == 1 or len(instance_plans) <= 1:
+            return self._propagate_coalesced_results(
+                instance_plans,
+                [
+                    self._apply_instance_plan(instance_plan)
+                    for instance_plan in instance_plans
+                ],
             )
 
-            if not component_folder.exists() or not component_folder.is_dir():
-                console.print(
-                    f"[yellow]![/yellow] Component folder not found: {component_folder}"
-                )
-                return False
+        groups: dict[Path, list[int]] = {}
+        for index, instance_plan in enumerate(instance_plans):
+            groups.setdefault(instance_plan.destination, []).append(index)
+
+        results = [False] * len(instance_plans)
+        contexts: list[_GenerationContext | None] = [None] * len(instance_plans)
+
+        def run_group(indices: list[int]) -> None:
+            for index in indices:
+                context = _GenerationContext()
+                self._local.context = context
+                try:
+                    results[index] = self._apply_instance_plan(instance_plans[index])
+                finally:
+                    self._local.context = None
+                    contexts[index] = context
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+            futures = [pool.submit(run_group, indices) for indices in groups.values()]
+
+        for context in contexts:
+            if context is None:
+                continue
+            for message in context.messages:
+                console.print(message)
+            for dir_path in context.dirs:
+                self._track_directory(dir_path)
+            for file_path in context.files:
+                self._track_file(file_path)
+
+        # Surface unexpected worker errors after replaying completed output
+        for future in futures:
+            future.result()
+
+        return self._propagate_coalesced_results(instance_plans, results)
+
+    def _propagate_coalesced_results(
+        self, instance_plans: tuple[InstancePlan, ...], results: list[bool]
+    ) -> list[bool]:
+        """Give coalesced instances the result of the instance that wrote them.
 
-            # Create destination directory
-            if not dest_path.exists():
-                dest_path.mkdir(parents=True, exist_ok=True)
-                self._track_directory(dest_path)
+        Args:
+            instance_plans: Applied instance plans
+            results: Per-instance results, in the same order
 
-            # Copy all files from component folder to destination
-            copied_count = 0
-            for item in component_folder.iterdir():
-                if item.is_file():
-                    # Security: Reject symlinks
-                    validate_not_symlink(item, context="component file")
+        Returns:
+            Results with coalesced instances updated.
+        """
+        by_id = {
+            instance_plan.instance_id: result
+            for instance_plan, result in zip(instance_plans, results, strict=True)
+        }
+        return [
+            by_id.get(instance_plan.coalesced_into, False)
+            if instance_plan.coalesced_into is not None
+            else result
+            for instance_plan, result in zip(instance_plans, results, strict=True)
+        ]
 
-                    dest_file = dest_path / item.name
-                    if dest_file.exists() and not force:
-                        console.print(
-                            f"[blue]i[/blue] Already exists (skipped): {dest_file}"
-                        )
-                        continue
+    def _apply_instance_plan(self, instance_plan: InstancePlan) -> bool:
+        """Apply the planned operations of a single instance.
+
+        Args:
+            instance_plan: Planned operations for the instance
 
-                    shutil.copy2(str(item), dest_file)
-                    self._track_file(dest_file)
+        Returns:
+            True if successful, False otherwise
+        """
+        if instance_plan.error is not None:
+            self._print(f"[red]x[/red] {instance_plan.error}")
+            return False
+
+        if instance_plan.unchanged:
+            self._print(f"[blue]i[/blue] Up to date: {instance_plan.destination}")
+            return True
+
+        if instance_plan.coalesced_into is not None:
+            self._print(
+                f"[blue]i[/blue] Merged into '{instance_plan.coalesced_into}': "
+                f"{instance_plan.destination}"
+            )
+            return True
+
+        for skipped_path in instance_plan.skipped:
+            self._print(f"[blue]i[/blue] Already exists (skipped): {skipped_path}")
+
+        try:
+            copied_count = 0
+            for op in instance_plan.operations:
+                if op.type == OperationType.COPY:
                     copied_count += 1
-                    console.print(f"[green]+[/green] Created: {dest_file}")
+                self._apply_operation(op)
 
             if copied_count > 0:
-                console.print(
-                    f"[green]+[/green] Created directory: {dest_path} ({copied_count} files)"
+                self._print(
+                    f"[green]+[/green] Created directory: {instance_plan.destination} "
+                    f"({copied_count} files)"
                 )
             return True
 
         except Exception as e:
-            console.print(f"[red]x[/red] Error generating directory: {e}")
+            self._print(f"[red]x[/red] Error generating {instance_plan.path}: {e}")
             return False
 
+    def _apply_operation(self, op: PlannedOperation) -> None:
+        """Apply a single planned operation.
+
+        Args:
+            op: Operation to apply
+
+        Raises:
+            OSError: If a filesystem operation fails
+        """
+        dest_path = op.destination
+        # Staged files are committed all at once, so they need no tracking
+        staging = self._staging is not None
+        target_path = self._staged_path(dest_path)
+
+        if op.type == OperationType.MKDIR:
+            if not target_path.exists():
+                target_path.mkdir(parents=True, exist_ok=True)
+                if not staging:
+                    self._track_directory(dest_path)
+
+        elif op.type == OperationType.WRITE:
+            # Create parent directory if needed
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            target_path.write_text(op.content or "", encoding="utf-8")
+            if not staging:
+                self._track_file(dest_path)  # Track for rollback
+            self._print(f"[green]+[/green] Created: {dest_path}")
+            if op.executable:
+                target_path.chmod(0o755)
+
+        elif op.type == OperationType.RENDER:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            render_template_file(Path(str(op.source)), target_path, op.variables)
+            if not staging:
+                self._track_file(dest_path)
+            self._print(f"[green]+[/green] Created: {dest_path}")
+            if op.executable:
+                target_path.chmod(0o755)
+
+        elif op.type == OperationType.COPY:
+            if staging:
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+            copy_file(Path(str(op.source)), target_path, self.copy_strategy)
+            if not staging:
+                self._track_file(dest_path)
+            self._print(f"[green]+[/green] Created: {dest_path}")
+
+        elif op.type == OperationType.APPEND:
+            self._append_entries(dest_path, op.content or "")
+
+    def _save_manifest(
+        self, manifest: dict, plan: GenerationPlan, results: list[bool]
+    ) -> None:
+        """Record applied instances in the manifest and save it.
+
+        Entries of instances that are no longer enabled are dropped; entries
+        of instances that were skipped or failed are kept as they were.
+
+        Args:
+            manifest: Manifest loaded before planning
+            plan: Plan that was applied
+            results: Per-instance results returned by ``apply_plan``
+        """
+        entries = manifest["instances"]
+        planned_ids = {instance_plan.instance_id for instance_plan in plan.instances}
+        for stale_id in set(entries) - planned_ids:
+            del entries[stale_id]
+
+        for instance_plan, result in zip(plan.instances, results, strict=True):
+            instance = self.instances_dict.get(instance_plan.instance_id)
+            if (
+                not result
+                or instance is None
+                or instance_plan.unchanged
+                or instance_plan.skipped
+                or not instance_plan.sources
+            ):
+                continue
+
+            sources: dict[Path, str | None] = dict.fromkeys(instance_plan.sources)
+            outputs: dict[Path, str | None] = {}
+            for op in instance_plan.operations:
+                if op.type == OperationType.COPY and op.source is not None:
+                    sources[op.source] = op.content_hash
+                    outputs[op.destination] = op.content_hash
+                elif op.type in (OperationType.WRITE, OperationType.RENDER):
+                    # Streamed outputs have no hash yet; it is computed on disk
+                    outputs[op.destination] = op.content_hash
+                elif op.type == OperationType.APPEND:
+                    # Appended files also hold content we didn't generate
+                    outputs[op.destination] = None
+            if instance_plan.coalesced_into is not None:
+                outputs[instance_plan.destination] = None
+            if not outputs:
+                continue
+
+            try:
+                manifest_service.record_instance(
+                    manifest,
+                    instance,
+                    sources,
+                    outputs,
+                    plan.repo_path,
+                    instance_plan.variables,
+                )
+            except (OSError, ValueError):
+                entries.pop(instance_plan.instance_id, None)
+
+        try:
+            manifest_service.save_manifest(plan.repo_path, manifest)
+        except FileOperationError as e:
+            console.print(f"[yellow]Warning:[/yellow] Could not save manifest: {e}")
+
+    def _append_entries(self, dest_path: Path, entries: str) -> None:
+        """Merge entries into the claudefig block of a file (for gitignore).
+
+        Entries already present elsewhere in the file are not repeated, and
+        an existing claudefig block is updated in place. When staging, the
+        existing file is read from its destination and the result is written
+        to the staging directory.
+
+        Args:
+            dest_path: Destination file path
+            entries: Entries to merge (already stripped)
+        """
+        target_path = self._staged_path(dest_path)
+        staging = target_path != dest_path
+        if staging:
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if dest_path.exists():
+            # Read without newline translation so CRLF files stay CRLF
+            with open(dest_path, encoding="utf-8", newline="") as f:
+                existing_content = f.read()
+            new_content = gitignore_service.merge_entries(existing_content, entries)
+
+            if new_content == existing_content:
+                self._print(f"[blue]i[/blue] Already up to date: {dest_path}")
+                return
+
+            target_path.write_text(new_content, encoding="utf-8", newline="")
+            # Don't track appends - file already existed
+            self._print(f"[green]+[/green] Updated: {dest_path}")
+        else:
+            # Create new
+            new_content = gitignore_service.merge_entries(None, entries)
+            target_path.write_text(new_content, encoding="utf-8", newline="")
+            if not staging:
+                self._track_file(dest_path)  # Track for rollback
+            self._print(f"[green]+[/green] Created: {dest_path}")
+
     def _copy_template_file(
         self, template_name: str, filename: str, dest_dir: Path, force: bool
     ) -> bool:
@@ -590,20 +1427,37 @@ class Initializer:
             console.print(f"[red]x[/red] Error updating .gitignore: {e}")
             return False
 
-    def setup_mcp_servers(self, repo_path: Path) -> bool:
+    def setup_mcp_servers(
+        self,
+        repo_path: Path,
+        jobs: int | None = None,
+        timeout: float = MCP_COMMAND_TIMEOUT,
+        refresh: bool = False,
+    ) -> bool:
         """Set up MCP servers from .mcp.json or .claude/mcp/ directory.
 
         Supports two configuration patterns:
         1. Standard .mcp.json file in project root (checked first)
         2. Multiple JSON files in .claude/mcp/ directory
 
-        Runs 'claude mcp add-json' for each server configuration found.
+        Every configuration is validated first; 'claude mcp add-json' is then
+        run for the valid ones on a bounded pool of concurrent subprocesses,
+        each with its own timeout, followed by an aggregated report.
+
+        Servers whose configuration is unchanged since their last successful
+        registration (see the MCP registration cache) are skipped without
+        running a subprocess, unless refresh is set.
 
         Args:
             repo_path: Path to repository
+            jobs: Maximum number of concurrent registrations
+                (default: MCP_SETUP_JOBS)
+            timeout: Per-server timeout in seconds
+            refresh: If True, re-register every server even if cached
 
         Returns:
-            True if successful, False otherwise.
+            True if at least one server was added or is already registered,
+            False otherwise.
         """
         import json
         import subprocess
@@ -636,7 +1490,17 @@ class Initializer:
         if config_sources:
             console.print(f"[dim]Sources:[/dim] {', '.join(config_sources)}")
 
-        success_count = 0
+        registrations = (
+            {} if refresh else mcp_registration_service.load_registrations(repo_path)
+        )
+
+        # Validate every configuration before starting any subprocess
+        server_names: list[str] = []
+        config_hashes: list[str] = []
+        commands: list[list[str]] = []
+        invalid_count = 0
+        cached_count = 0
+        seen_names: set[str] = set()
         for json_file in json_files:
             # Extract server name from filename (remove example- prefix if present)
             server_name = json_file.stem
@@ -644,59 +1508,129 @@ class Initializer:
                 server_name = server_name.replace("example-", "")
 
             try:
-                # Read JSON content
                 with open(json_file, encoding="utf-8") as f:
                     json_content = f.read().strip()
 
-                # Validate JSON structure before subprocess execution
                 config = self._validate_mcp_json_schema(json_content, json_file.name)
-
-                # Validate transport type if present
                 self._validate_mcp_transport(config, json_file.name)
 
-                # Build claude mcp add-json command
-                cmd = ["claude", "mcp", "add-json", server_name, json_content]
-
-                console.print(
-                    f"[dim]Running:[/dim] claude mcp add-json {server_name} ..."
-                )
-
-                # Run command
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-                if result.returncode == 0:
-                    console.print(f"[green]+[/green] Added MCP server: {server_name}")
-                    success_count += 1
-                else:
-                    console.print(
-                        f"[yellow]![/yellow] Failed to add {server_name}: {result.stderr.strip()}"
-                    )
-
             except json.JSONDecodeError as e:
                 console.print(f"[red]x[/red] Invalid JSON in {json_file.name}: {e}")
+                invalid_count += 1
+                continue
             except ValueError as e:
                 console.print(
                     f"[red]x[/red] Configuration error in {json_file.name}: {e}"
                 )
-            except subprocess.TimeoutExpired:
+                invalid_count += 1
+                continue
+            except OSError as e:
+                console.print(f"[red]x[/red] Error reading {json_file.name}: {e}")
+                invalid_count += 1
+                continue
+
+            seen_names.add(server_name)
+            config_hash = mcp_registration_service.hash_server_config(config)
+            if registrations.get(server_name) == config_hash:
+                console.print(f"[blue]i[/blue] Already registered: {server_name}")
+                cached_count += 1
+                continue
+
+            console.print(f"[dim]Running:[/dim] claude mcp add-json {server_name} ...")
+            server_names.append(server_name)
+            config_hashes.append(config_hash)
+            commands.append(["claude", "mcp", "add-json", server_name, json_content])
+
+        if not commands:
+            if cached_count > 0:
+                console.print(
+                    f"\n[bold green]{cached_count} MCP server(s) already "
+                    "registered[/bold green]"
+                )
+                return True
+            console.print("\n[yellow]No MCP servers were added[/yellow]")
+            return False
+
+        outcomes = run_commands_concurrently(
+            commands,
+            max_concurrency=MCP_SETUP_JOBS if jobs is None else jobs,
+            timeout=timeout,
+            # 'claude mcp add-json' registers into the project of its cwd
+            cwd=repo_path,
+        )
+
+        if any(isinstance(outcome, FileNotFoundError) for outcome in outcomes):
+            console.print(
+                "[red]x[/red] 'claude' command not found. Make sure Claude Code is installed."
+            )
+            return False
+
+        success_count = 0
+        failed_count = 0
+        timeout_count = 0
+        for server_name, config_hash, outcome in zip(
+            server_names, config_hashes, outcomes, strict=True
+        ):
+            # Forget the server unless this registration succeeds
+            registrations.pop(server_name, None)
+            if isinstance(outcome, subprocess.TimeoutExpired):
                 console.print(f"[red]x[/red] Timeout adding {server_name}")
-            except FileNotFoundError:
+                timeout_count += 1
+            elif isinstance(outcome, Exception):
+                console.print(f"[red]x[/red] Error adding {server_name}: {outcome}")
+                failed_count += 1
+            elif outcome.returncode == 0:
+                console.print(f"[green]+[/green] Added MCP server: {server_name}")
+                registrations[server_name] = config_hash
+                success_count += 1
+            else:
                 console.print(
-                    "[red]x[/red] 'claude' command not found. Make sure Claude Code is installed."
+                    f"[yellow]![/yellow] Failed to add {server_name}: {outcome.stderr.strip()}"
                 )
-                return False
-            except Exception as e:
-                console.print(f"[red]x[/red] Error adding {server_name}: {e}")
+                failed_count += 1
+
+        self._save_mcp_registrations(
+            repo_path,
+            {name: h for name, h in registrations.items() if name in seen_names},
+        )
 
-        if success_count > 0:
+        problems = [
+            f"{count} {label}"
+            for count, label in (
+                (cached_count, "already registered"),
+                (failed_count, "failed"),
+                (timeout_count, "timed out"),
+                (invalid_count, "invalid"),
+            )
+            if count
+        ]
+        summary = f" ({', '.join(problems)})" if problems else ""
+
+        if success_count + cached_count > 0:
             console.print(
-                f"\n[bold green]Added {success_count} MCP server(s)[/bold green]"
+                f"\n[bold green]Added {success_count} MCP server(s)[/bold green]{summary}"
             )
             return True
         else:
-            console.print("\n[yellow]No MCP servers were added[/yellow]")
+            console.print(f"\n[yellow]No MCP servers were added[/yellow]{summary}")
             return False
 
+    def _save_mcp_registrations(
+        self, repo_path: Path, registrations: dict[str, str]
+    ) -> None:
+        """Persist the MCP registration cache, warning instead of failing.
+
+        Args:
+            repo_path: Path to repository
+            registrations: Server name to configuration hash mapping
+        """
+        try:
+            mcp_registration_service.save_registrations(repo_path, registrations)
+        except FileWriteError as e:
+            console.print(
+                f"[yellow]Warning:[/yellow] Could not save MCP registration cache: {e}"
+            )
+
     def _validate_mcp_json_schema(self, json_content: str, filename: str) -> dict:
         """Validate MCP config JSON structure before subprocess execution.
 
@@ -796,7 +1730,9 @@ class Initializer:
                 "Consider using HTTP transport instead."
             )
 
-    def _auto_setup_mcp_servers(self, repo_path: Path, enabled_instances: list) -> None:
+    def _auto_setup_mcp_servers(
+        self, repo_path: Path, enabled_instances: list, refresh: bool = False
+    ) -> None:
         """Automatically setup MCP servers if MCP instances are enabled.
 
         Called during initialization to register MCP servers with Claude Code.
@@ -805,6 +1741,7 @@ class Initializer:
         Args:
             repo_path: Path to repository
             enabled_instances: List of enabled FileInstance objects
+            refresh: If True, re-register servers even if cached as registered
         """
         from .models import FileType
 
@@ -830,7 +1767,7 @@ class Initializer:
         console.print("\n[bold blue]Setting up MCP servers...[/bold blue]")
 
         try:
-            success = self.setup_mcp_servers(repo_path)
+            success = self.setup_mcp_servers(repo_path, refresh=refresh)
             if not success:
                 console.print(
                     "[yellow]Note:[/yellow] MCP servers not registered. "
@@ -929,7 +1866,7 @@ class Initializer:
                         )
                         continue
 
-                    shutil.copy2(str(item), dest_file)
+                    copy_file(item_path, dest_file, self.copy_strategy)
                     self._track_file(dest_file)  # Track for rollback
                     copied_count += 1
                     console.print(f"[green]+[/green] Created file: {dest_file}")
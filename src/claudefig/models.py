@@ -545,3 +545,190 @@ class ComponentDiscoveryResult:
             f"warnings={len(self.warnings)}, "
             f"time={self.scan_time_ms:.1f}ms)"
         )
+
+
+# ============================================================================
+# Generation Plan Models
+# ============================================================================
+
+
+class OperationType(Enum):
+    """Kinds of filesystem operations in a generation plan."""
+
+    WRITE = "write"  # Write content to a file (replacing it)
+    APPEND = "append"  # Merge content into a file (e.g. .gitignore)
+    COPY = "copy"  # Copy a component file
+    RENDER = "render"  # Stream-render a large template file to disk
+    MKDIR = "mkdir"  # Create a directory
+
+
+@dataclass(frozen=True)
+class PlannedOperation:
+    """A single filesystem operation decided during planning.
+
+    Operations carry everything needed to apply them, so executing a plan
+    never has to consult presets or templates again.
+    """
+
+    type: OperationType
+    destination: Path
+    source: Path | None = None  # Source file for COPY and RENDER operations
+    content: str | None = None  # Content for WRITE and APPEND operations
+    content_hash: str | None = None  # SHA-256 of the content or source file
+    # Variables for RENDER operations (None copies the template verbatim)
+    variables: dict[str, Any] | None = None
+    executable: bool = False  # Mark destination executable after writing
+
+    def __repr__(self) -> str:
+        """String representation of planned operation."""
+        return f"PlannedOperation({self.type.value} {self.destination})"
+
+
+@dataclass(frozen=True)
+class InstancePlan:
+    """Planned operations for a single file instance.
+
+    An instance plan either carries an error (planning failed), is marked
+    unchanged (its manifest entry still matches), or holds the operations to
+    apply plus any destinations skipped because they exist. Appends to a
+    destination shared with earlier instances are merged into the first
+    instance's operation and recorded in ``coalesced_into``.
+    """
+
+    instance_id: str
+    path: str  # Instance path as configured (relative to repository)
+    destination: Path  # Resolved destination path
+    operations: tuple[PlannedOperation, ...] = ()
+    skipped: tuple[Path, ...] = ()  # Existing destinations left untouched
+    error: str | None = None
+    sources: tuple[Path, ...] = ()  # Component files the instance is built from
+    unchanged: bool = False  # Inputs and outputs match the manifest
+    coalesced_into: str | None = None  # Instance whose operation writes our output
+    variables: dict[str, Any] | None = None  # Merged template variables
+
+    @property
+    def has_error(self) -> bool:
+        """Check if planning this instance failed."""
+        return self.error is not None
+
+
+@dataclass(frozen=True)
+class GenerationPlan:
+    """Immutable plan describing everything initialization will write.
+
+    Produced by the planning phase and consumed by the executor, so work can
+    be inspected (dry runs), rejected or batched before touching disk.
+    """
+
+    repo_path: Path
+    force: bool
+    instances: tuple[InstancePlan, ...] = ()
+
+    @property
+    def operations(self) -> list[PlannedOperation]:
+        """All planned operations, in instance order."""
+        return [op for plan in self.instances for op in plan.operations]
+
+    @property
+    def errors(self) -> list[InstancePlan]:
+        """Instance plans that failed during planning."""
+        return [plan for plan in self.instances if plan.has_error]
+
+    @property
+    def unchanged(self) -> list[InstancePlan]:
+        """Instance plans skipped because they are up to date."""
+        return [plan for plan in self.instances if plan.unchanged]
+
+    def __repr__(self) -> str:
+        """String representation of generation plan."""
+        return (
+            f"GenerationPlan(instances={len(self.instances)}, "
+            f"operations={len(self.operations)}, errors={len(self.errors)})"
+        )
+
+
+@dataclass(frozen=True)
+class FleetRepoResult:
+    """Outcome of initializing or syncing one repository in fleet mode."""
+
+    repo_path: Path
+    success: bool
+    files_written: int = 0
+    files_unchanged: int = 0
+    duration: float = 0.0  # Wall-clock seconds spent on the repository
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON output.
+
+        Returns:
+            Dictionary representation of the result.
+        """
+        return {
+            "repo_path": str(self.repo_path),
+            "success": self.success,
+            "files_written": self.files_written,
+            "files_unchanged": self.files_unchanged,
+            "duration": round(self.duration, 3),
+            "error": self.error,
+        }
+
+
+@dataclass(frozen=True)
+class SearchEntry:
+    """A preset or component in the search index."""
+
+    kind: str  # "preset" or "component"
+    id: str  # Preset ID, or "{type}:{name}" for components
+    name: str
+    file_type: str  # Preset type, or the component's type directory
+    source: str  # Preset source, or "global"/"preset" for components
+    description: str = ""
+    tags: tuple[str, ...] = ()
+    path: str | None = None  # Component directory
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SearchEntry":
+        """Create search entry from dictionary.
+
+        Args:
+            data: Dictionary containing entry data
+
+        Returns:
+            SearchEntry instance
+        """
+        return cls(
+            kind=data["kind"],
+            id=data["id"],
+            name=data["name"],
+            file_type=data["file_type"],
+            source=data["source"],
+            description=data.get("description", ""),
+            tags=tuple(data.get("tags", ())),
+            path=data.get("path"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert search entry to dictionary format.
+
+        Returns:
+            Dictionary representation of the entry.
+        """
+        return {
+            "kind": self.kind,
+            "id": self.id,
+            "name": self.name,
+            "file_type": self.file_type,
+            "source": self.source,
+            "description": self.description,
+            "tags": list(self.tags),
+            "path": self.path,
+        }
+
+
+@dataclass(frozen=True)
+class SearchMatch:
+    """A search result with its relevance score."""
+
+    entry: SearchEntry
+    score: float
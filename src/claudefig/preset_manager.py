@@ -32,15 +32,19 @@ class PresetManager:
         self,
         user_presets_dir: Path | None = None,
         project_presets_dir: Path | None = None,
+        repo: TomlPresetRepository | None = None,
     ):
         """Initialize preset manager.
 
         Args:
             user_presets_dir: Path to user presets directory (default: ~/.claudefig/presets/)
             project_presets_dir: Path to project presets directory (default: .claudefig/presets/)
+            repo: Existing repository to wrap (e.g. a shared one from
+                ``claudefig.registry``). The directory arguments are ignored
+                when given.
         """
         # Initialize repository with directory paths
-        self._repo = TomlPresetRepository(
+        self._repo = repo or TomlPresetRepository(
             user_presets_dir=user_presets_dir,
             project_presets_dir=project_presets_dir,
         )
@@ -201,6 +205,11 @@ class PresetManager:
         # Delegate to repository
         self._repo.clear_cache()
 
+    def refresh(self) -> None:
+        """Reload only the presets whose files changed since they were loaded."""
+        # Delegate to repository
+        self._repo.refresh()
+
     def get_load_errors(self) -> list[str]:
         """Get any errors that occurred during preset loading.
 
@@ -222,10 +231,12 @@ class PresetManager:
         Raises:
             CircularDependencyError: If circular dependency is detected
         """
-        # This method is preserved for backward compatibility
-        # but circular dependency checking is now done in the repository layer
-        # during preset loading
+        # Circular dependencies are detected by the repository when presets
+        # are loaded; only repositories without that table need a walk
         if visited is None:
+            preset = self.get_preset(preset_id)
+            if preset is None or self._repo.get_resolved_variables(preset) is not None:
+                return
             visited = set()
 
         if preset_id in visited:
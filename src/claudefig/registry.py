@@ -0,0 +1,126 @@
+"""Process-wide registry of shared preset repositories and managers.
+
+Parsing presets is the most expensive part of starting a command, and the
+CLI, TUI and ``Initializer`` all need them. Instead of each constructing its
+own ``TomlPresetRepository``, they ask this registry, which hands out one
+instance per pair of (resolved) user/project preset directories, so presets
+are parsed once per process and stay cache-warm. ``PresetManager`` instances
+are shared the same way and wrap the shared repository.
+
+Registrations live in the innermost active scope. ``scope()`` opens a fresh
+one, which is how tests keep shared instances from leaking between them.
+
+Example:
+    >>> from claudefig import registry
+    >>> with registry.scope():
+    ...     repo = registry.get_preset_repository()
+    ...     assert registry.get_preset_repository() is repo
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from claudefig.repositories.preset_repository import TomlPresetRepository
+
+if TYPE_CHECKING:
+    from claudefig.preset_manager import PresetManager
+
+_lock = threading.RLock()
+
+# Stack of scopes; each maps (kind, user dir, project dir) to an instance
+_scopes: list[dict[tuple[str, Path, Path], Any]] = [{}]
+
+
+def _key(
+    kind: str, user_presets_dir: Path | None, project_presets_dir: Path | None
+) -> tuple[str, Path, Path]:
+    """Build the registry key for a pair of preset directories.
+
+    Defaults are resolved at call time, so a change of working directory
+    selects a different project preset directory.
+    """
+    user_dir = user_presets_dir or (Path.home() / ".claudefig" / "presets")
+    project_dir = project_presets_dir or (Path.cwd() / ".claudefig" / "presets")
+    return kind, user_dir.resolve(), project_dir.resolve()
+
+
+def get_preset_repository(
+    user_presets_dir: Path | None = None,
+    project_presets_dir: Path | None = None,
+) -> TomlPresetRepository:
+    """Get the shared preset repository for a pair of preset directories.
+
+    Args:
+        user_presets_dir: User presets directory (default: ~/.claudefig/presets/)
+        project_presets_dir: Project presets directory (default: .claudefig/presets/)
+
+    Returns:
+        The repository registered in the current scope, created on first use.
+    """
+    key = _key("repository", user_presets_dir, project_presets_dir)
+    with _lock:
+        repo = _scopes[-1].get(key)
+        if repo is None:
+            repo = TomlPresetRepository(
+                user_presets_dir=key[1], project_presets_dir=key[2]
+            )
+            _scopes[-1][key] = repo
+        return repo
+
+
+def get_preset_manager(
+    user_presets_dir: Path | None = None,
+    project_presets_dir: Path | None = None,
+) -> PresetManager:
+    """Get the shared preset manager for a pair of preset directories.
+
+    The manager wraps the shared repository for the same directories.
+
+    Args:
+        user_presets_dir: User presets directory (default: ~/.claudefig/presets/)
+        project_presets_dir: Project presets directory (default: .claudefig/presets/)
+
+    Returns:
+        The manager registered in the current scope, created on first use.
+    """
+    from claudefig.preset_manager import PresetManager
+
+    key = _key("manager", user_presets_dir, project_presets_dir)
+    with _lock:
+        manager = _scopes[-1].get(key)
+        if manager is None:
+            manager = PresetManager(
+                repo=get_preset_repository(user_presets_dir, project_presets_dir)
+            )
+            _scopes[-1][key] = manager
+        return manager
+
+
+def clear() -> None:
+    """Forget every instance registered in the current scope."""
+    with _lock:
+        _scopes[-1].clear()
+
+
+@contextmanager
+def scope() -> Iterator[None]:
+    """Register instances in a fresh scope for the duration of the block.
+
+    Instances registered outside the block are not visible inside it, and
+    instances registered inside it are dropped when it exits.
+
+    Yields:
+        None
+    """
+    with _lock:
+        _scopes.append({})
+    try:
+        yield
+    finally:
+        with _lock:
+            _scopes.pop()
@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+from claudefig.exceptions import BuiltInModificationError, PresetExistsError
 from claudefig.models import Preset, PresetSource
 
 
@@ -149,6 +150,45 @@ class AbstractPresetRepository(ABC):
         """
         raise NotImplementedError
 
+    def add_presets(self, presets: list[Preset], source: PresetSource) -> None:
+        """Add several new presets to the specified source.
+
+        Every preset is checked before any is added. Repositories that can
+        write in one commit override this; the default adds them one by one.
+
+        Args:
+            presets: Preset objects to add.
+            source: Target source (USER or PROJECT only, not BUILT_IN).
+
+        Raises:
+            BuiltInModificationError: If source is BUILT_IN.
+            PresetExistsError: If a preset already exists or an ID repeats.
+            FileWriteError: If write operation fails.
+        """
+        self._check_new_presets(presets, source)
+        for preset in presets:
+            self.add_preset(preset, source)
+
+    def _check_new_presets(self, presets: list[Preset], source: PresetSource) -> None:
+        """Check that presets can be added to a source.
+
+        Args:
+            presets: Preset objects to add.
+            source: Target source.
+
+        Raises:
+            BuiltInModificationError: If source is BUILT_IN.
+            PresetExistsError: If a preset already exists or an ID repeats.
+        """
+        if source == PresetSource.BUILT_IN:
+            raise BuiltInModificationError("preset", "add")
+
+        seen: set[str] = set()
+        for preset in presets:
+            if preset.id in seen or self.exists(preset.id):
+                raise PresetExistsError(preset.id)
+            seen.add(preset.id)
+
     @abstractmethod
     def update_preset(self, preset: Preset) -> None:
         """Update an existing preset.
@@ -205,6 +245,38 @@ class AbstractPresetRepository(ABC):
         """
         raise NotImplementedError
 
+    def get_template_path(self, preset: Preset) -> Path | None:
+        """Resolve the template file path for a preset without reading it.
+
+        Repositories that don't store templates on disk return None.
+
+        Args:
+            preset: Preset to resolve.
+
+        Returns:
+            Path to the template file, or None if not file-backed.
+        """
+        return None
+
+    def get_resolved_variables(self, preset: Preset) -> dict[str, Any] | None:
+        """Get a preset's variables merged along its inheritance chain.
+
+        Repositories that flatten inheritance when loading return the
+        precomputed result; others return None and callers walk the
+        ``extends`` chain themselves.
+
+        Args:
+            preset: Preset to resolve.
+
+        Returns:
+            Merged variables (child overrides parent), or None if not
+            precomputed for this preset.
+
+        Raises:
+            CircularDependencyError: If the preset's chain contains a cycle.
+        """
+        return None
+
     @abstractmethod
     def clear_cache(self) -> None:
         """Clear any internal caches.
@@ -212,3 +284,10 @@ class AbstractPresetRepository(ABC):
         Useful when presets have been modified externally and need to be reloaded.
         """
         raise NotImplementedError
+
+    def refresh(self) -> None:
+        """Pick up presets modified externally since they were loaded.
+
+        Repositories without an incremental reload clear their caches.
+        """
+        self.clear_cache()
@@ -1,8 +1,11 @@
 """Concrete implementations of configuration repositories."""
 
+import contextlib
+import os
 import shutil
 import sys
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, cast
@@ -20,8 +23,22 @@ from claudefig.exceptions import (
     FileWriteError,
 )
 from claudefig.repositories.base import AbstractConfigRepository
+from claudefig.utils.cache import RACY_WINDOW_NS, LRUCache
+from claudefig.utils.hashing import hash_text
 from claudefig.utils.paths import validate_not_symlink
 
+# Maximum number of config files kept in the in-process load cache
+CONFIG_CACHE_SIZE = 32
+
+# Parsed config documents shared by all repositories in this process, keyed
+# by resolved path and validated against the file's (mtime_ns, size). Files
+# stamped inside the racy window also carry a content digest that is checked
+# on every hit. The documents are never handed out directly; load() returns
+# copies.
+_config_cache: LRUCache[tuple[int, int, str | None, dict[str, Any]]] = LRUCache(
+    maxsize=CONFIG_CACHE_SIZE
+)
+
 
 class TomlConfigRepository(AbstractConfigRepository):
     """TOML-based configuration repository.
@@ -34,6 +51,7 @@ class TomlConfigRepository(AbstractConfigRepository):
     - Automatic backup creation
     - Schema version tracking
     - Error recovery
+    - Parsed documents cached per process while the file is unchanged
     """
 
     def __init__(self, config_path: Path):
@@ -44,9 +62,23 @@ class TomlConfigRepository(AbstractConfigRepository):
         """
         self.config_path = config_path.resolve()
 
+    def _cache_key(self) -> str:
+        """Get the load cache key: the fully resolved config path.
+
+        Resolved on every call, since ``config_path`` may be reassigned, so
+        every spelling of the same file shares one cache entry.
+        """
+        return str(self.config_path.resolve())
+
     def load(self) -> dict[str, Any]:
         """Load configuration from TOML file.
 
+        The parsed document is cached per process and reused while the
+        file's modification time and size are unchanged; a file modified
+        within the racy window is reused only while its content hash also
+        matches. Every call returns its own copy of the tables and arrays,
+        so callers may modify it.
+
         Returns:
             Configuration data as nested dictionary.
 
@@ -57,19 +89,73 @@ class TomlConfigRepository(AbstractConfigRepository):
         if not self.exists():
             raise ConfigFileNotFoundError(str(self.config_path))
 
+        # Stat before reading so a change during the read misses next time
+        stat = self.config_path.stat()
+        key = self._cache_key()
+        content: str | None = None
+        cached = _config_cache.get(key)
+        if cached is not None:
+            mtime_ns, size, digest, document = cached
+            if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+                if digest is None:
+                    return cast(dict[str, Any], _copy_document(document))
+                content = self._read_text()
+                if hash_text(content) == digest:
+                    # Once out of the racy window the stamp alone suffices
+                    self._cache_document(stat, content, document)
+                    return cast(dict[str, Any], _copy_document(document))
+
+        if content is None:
+            content = self._read_text()
         try:
-            with open(self.config_path, "rb") as f:
-                return cast(dict[str, Any], tomllib.load(f))
+            document = tomllib.loads(content)
         except tomllib.TOMLDecodeError as e:
             raise ValueError(
                 f"Invalid TOML in config file {self.config_path}: {e}"
             ) from e
 
+        self._cache_document(stat, content, document)
+        return cast(dict[str, Any], _copy_document(document))
+
+    def _read_text(self) -> str:
+        """Read the config file as UTF-8 text.
+
+        Raises:
+            ValueError: If the file is not valid UTF-8.
+        """
+        try:
+            return self.config_path.read_bytes().decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise ValueError(
+                f"Invalid TOML in config file {self.config_path}: {e}"
+            ) from e
+
+    def _cache_document(
+        self, stat: os.stat_result, content: str, document: dict[str, Any]
+    ) -> None:
+        """Cache a parsed document under the stat taken before reading it.
+
+        A file modified this recently could change again without its mtime
+        or size changing on filesystems with coarse timestamps, so its
+        entry also records the content digest to check on every hit.
+
+        Args:
+            stat: Stat of the config file taken before its content was read
+            content: Text the document was parsed from
+            document: Parsed document, owned by the cache from now on
+        """
+        racy = stat.st_mtime_ns >= time.time_ns() - RACY_WINDOW_NS
+        digest = hash_text(content) if racy else None
+        _config_cache.set(
+            self._cache_key(), (stat.st_mtime_ns, stat.st_size, digest, document)
+        )
+
     def save(self, data: dict[str, Any]) -> None:
         """Save configuration to TOML file atomically.
 
         Uses atomic write pattern (temp file + rename) to prevent corruption
-        on crashes or interruptions.
+        on crashes or interruptions. The written document seeds the load
+        cache, so loading it back does not parse the file again.
 
         Args:
             data: Configuration data to persist.
@@ -80,10 +166,12 @@ class TomlConfigRepository(AbstractConfigRepository):
         """
         # Ensure parent directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        _config_cache.pop(self._cache_key())
 
         # Atomic write: temp file + rename
         tmp_path = None
         try:
+            content = tomli_w.dumps(data)
             with tempfile.NamedTemporaryFile(
                 mode="wb",
                 dir=self.config_path.parent,
@@ -91,7 +179,7 @@ class TomlConfigRepository(AbstractConfigRepository):
                 suffix=".tmp",
             ) as tmp:
                 tmp_path = Path(tmp.name)
-                tomli_w.dump(data, tmp)
+                tmp.write(content.encode("utf-8"))
 
             # Atomic rename (POSIX guarantees atomicity)
             tmp_path.replace(self.config_path)
@@ -102,6 +190,11 @@ class TomlConfigRepository(AbstractConfigRepository):
                 tmp_path.unlink()
             raise FileWriteError(str(self.config_path), str(e)) from e
 
+        # Just written, so always racy: later hits also check the digest
+        with contextlib.suppress(OSError):
+            stat = self.config_path.stat()
+            self._cache_document(stat, content, _copy_document(data))
+
     def exists(self) -> bool:
         """Check if configuration file exists.
 
@@ -158,6 +251,7 @@ class TomlConfigRepository(AbstractConfigRepository):
         if not self.exists():
             raise ConfigFileNotFoundError(str(self.config_path))
 
+        _config_cache.pop(self._cache_key())
         try:
             self.config_path.unlink()
         except Exception as e:
@@ -282,3 +376,28 @@ class FakeConfigRepository(AbstractConfigRepository):
             raise ConfigFileNotFoundError(str(self._path))
 
         self._data = self._backups[index].copy()
+
+
+def clear_config_cache() -> None:
+    """Forget every parsed config document cached in this process."""
+    _config_cache.clear()
+
+
+def _copy_document(value: Any) -> Any:
+    """Copy the tables and arrays of a TOML document.
+
+    TOML scalars (strings, numbers, booleans, dates and times) are immutable,
+    so they are shared with the cached document rather than copied. Tuples
+    become lists, as they would when parsed back from the file.
+
+    Args:
+        value: Parsed TOML value.
+
+    Returns:
+        Copy that can be modified without affecting the original.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_document(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_copy_document(item) for item in value]
+    return value
@@ -0,0 +1,262 @@
+"""Persistent preset index for TomlPresetRepository.
+
+The index (``~/.claudefig/cache/preset-index.json``) stores the presets
+loaded from the built-in preset file and a pair of user/project preset
+directories, including presets overridden by a higher-priority source and the
+file each preset was parsed from, together with the stat signature of every
+file and directory the load read. As long as all signatures still match, a repository can
+deserialize the index instead of parsing every preset TOML file. Adding or
+removing a preset file changes its directory's mtime, and editing one changes
+the file's own mtime or size, so any change falls back to a full parse.
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from claudefig.exceptions import FileWriteError
+from claudefig.logging_config import get_logger
+from claudefig.models import Preset
+from claudefig.user_config import get_cache_dir
+from claudefig.utils.cache import RACY_WINDOW_NS
+
+logger = get_logger("repositories.preset_index")
+
+PRESET_INDEX_FILENAME = "preset-index.json"
+PRESET_INDEX_VERSION = 2
+
+# Number of user/project directory pairs kept in the index
+PRESET_INDEX_MAX_ENTRIES = 16
+
+
+def get_preset_index_path() -> Path:
+    """Get the path of the preset index.
+
+    Returns:
+        Path to the index file inside ``~/.claudefig/cache/``.
+    """
+    return get_cache_dir() / PRESET_INDEX_FILENAME
+
+
+def index_key(directories: list[Path]) -> str:
+    """Build the index entry key for a set of preset directories.
+
+    Args:
+        directories: User and project preset directories.
+
+    Returns:
+        Key identifying the directories.
+    """
+    return "\n".join(str(directory.resolve()) for directory in directories)
+
+
+def stamp_sources(files: list[Path], directories: list[Path]) -> dict[str, Any]:
+    """Record the stat signature of everything a preset load reads.
+
+    Stamp sources before loading them, so a file changed during the load
+    does not match its stamp afterwards.
+
+    Args:
+        files: Individual preset files (e.g. the built-in preset file).
+        directories: Preset directories; their ``*.toml`` files are stamped
+            too.
+
+    Returns:
+        Mapping of path to ``[mtime_ns, size]``, or None if it is missing.
+    """
+    paths = list(files)
+    for directory in directories:
+        paths.append(directory)
+        if directory.is_dir():
+            paths.extend(sorted(directory.glob("*.toml")))
+    return stamp_paths(paths)
+
+
+def stamp_paths(paths: list[Path]) -> dict[str, Any]:
+    """Record the stat signature of individual paths.
+
+    Args:
+        paths: Files or directories to stamp.
+
+    Returns:
+        Mapping of path to ``[mtime_ns, size]``, or None if it is missing.
+    """
+    return {str(path): _stamp(path) for path in paths}
+
+
+def _stamp(path: Path) -> list[int] | None:
+    """Get the ``[mtime_ns, size]`` signature of a path, or None if missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def sources_match(sources: dict[str, Any]) -> bool:
+    """Check whether every stamped source is unchanged.
+
+    Args:
+        sources: Stamps from ``stamp_sources``.
+
+    Returns:
+        True if all paths still have their recorded signature.
+    """
+    for path, stamp in sources.items():
+        if _stamp(Path(path)) != stamp:
+            logger.debug(f"Stamped source changed: {path}")
+            return False
+    return True
+
+
+def has_racy_sources(sources: dict[str, Any]) -> bool:
+    """Check whether a source was modified too recently to be trusted.
+
+    Args:
+        sources: Stamps from ``stamp_sources``.
+
+    Returns:
+        True if any source was modified within ``RACY_WINDOW_NS``.
+    """
+    racy_after = time.time_ns() - RACY_WINDOW_NS
+    return any(stamp and stamp[0] >= racy_after for stamp in sources.values())
+
+
+def _load_index(index_path: Path) -> dict[str, Any]:
+    """Load the whole index, treating problems as empty.
+
+    Args:
+        index_path: Index file path.
+
+    Returns:
+        Index dictionary.
+    """
+    empty: dict[str, Any] = {"version": PRESET_INDEX_VERSION, "entries": {}}
+    if not index_path.exists():
+        return empty
+
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable preset index: {e}")
+        return empty
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != PRESET_INDEX_VERSION
+        or not isinstance(data.get("entries"), dict)
+    ):
+        logger.debug(f"Ignoring outdated preset index: {index_path}")
+        return empty
+
+    return data
+
+
+def load_presets(key: str) -> list[Preset] | None:
+    """Load indexed presets if none of their sources changed.
+
+    Args:
+        key: Entry key from ``index_key``.
+
+    Returns:
+        Presets in load order, or None if there is no valid entry.
+    """
+    entry = load_entry(key)
+    return entry[1] if entry is not None else None
+
+
+def load_entry(
+    key: str,
+) -> tuple[dict[str, Any], list[Preset], list[str | None]] | None:
+    """Load an index entry if none of its sources changed.
+
+    Args:
+        key: Entry key from ``index_key``.
+
+    Returns:
+        The entry's source stamps, its presets in load order and the file
+        each preset was parsed from (None for built-in presets), or None if
+        there is no valid entry.
+    """
+    entry = _load_index(get_preset_index_path())["entries"].get(key)
+    if not isinstance(entry, dict) or not isinstance(entry.get("sources"), dict):
+        return None
+
+    if not sources_match(entry["sources"]):
+        return None
+
+    try:
+        presets = [Preset.from_dict(data) for data in entry.get("presets", [])]
+    except (KeyError, TypeError, ValueError) as e:
+        logger.debug(f"Ignoring invalid preset index entry: {e}")
+        return None
+
+    origins = entry.get("origins", [None] * len(presets))
+    if not isinstance(origins, list) or len(origins) != len(presets):
+        logger.debug("Ignoring preset index entry with invalid origins")
+        return None
+
+    return entry["sources"], presets, origins
+
+
+def save_presets(
+    key: str,
+    sources: dict[str, Any],
+    presets: list[Preset],
+    origins: list[str | None] | None = None,
+) -> None:
+    """Save loaded presets to the index atomically.
+
+    Nothing is saved when a source was modified too recently to be trusted.
+    Entries for other directories are preserved, up to
+    ``PRESET_INDEX_MAX_ENTRIES`` (least recently saved are dropped first).
+
+    Args:
+        key: Entry key from ``index_key``.
+        sources: Stamps from ``stamp_sources``, taken before loading.
+        presets: Loaded presets in load order.
+        origins: File each preset was parsed from (None for built-in
+            presets). Defaults to None for every preset.
+
+    Raises:
+        FileWriteError: If the index cannot be written.
+    """
+    if has_racy_sources(sources):
+        return
+
+    index_path = get_preset_index_path()
+    index = _load_index(index_path)
+    entries = index["entries"]
+    entries.pop(key, None)
+    entries[key] = {
+        "sources": sources,
+        "presets": [preset.to_dict() for preset in presets],
+        "origins": origins if origins is not None else [None] * len(presets),
+    }
+    while len(entries) > PRESET_INDEX_MAX_ENTRIES:
+        del entries[next(iter(entries))]
+
+    tmp_path = None
+    try:
+        # Serialize first so unsupported values never leave a partial file
+        content = json.dumps(index, separators=(",", ":"))
+
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=index_path.parent,
+            delete=False,
+            suffix=".tmp",
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            tmp.write(content)
+
+        tmp_path.replace(index_path)
+
+    except Exception as e:
+        if tmp_path and tmp_path.exists():
+            tmp_path.unlink()
+        raise FileWriteError(str(index_path), str(e)) from e
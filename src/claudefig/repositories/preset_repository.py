@@ -1,7 +1,13 @@
 """Concrete implementations of preset repositories."""
 
+import bisect
+import contextlib
+import os
 import sys
+import tempfile
+from collections import deque
 from pathlib import Path
+from typing import Any
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -10,8 +16,10 @@ else:
 
 import tomli_w
 
+from claudefig.component_loaders import clear_component_cache, component_cache
 from claudefig.exceptions import (
     BuiltInModificationError,
+    CircularDependencyError,
     FileOperationError,
     FileReadError,
     FileWriteError,
@@ -21,7 +29,105 @@ from claudefig.exceptions import (
     TemplateNotFoundError,
 )
 from claudefig.models import FileType, Preset, PresetSource
+from claudefig.repositories import preset_index
 from claudefig.repositories.base import AbstractPresetRepository
+from claudefig.utils.cache import LRUCache
+from claudefig.utils.templating import clear_compiled_cache
+
+# Maximum number of template files kept in the in-process content cache
+TEMPLATE_CACHE_SIZE = 256
+
+# Template content shared by all repositories in this process, keyed by
+# resolved path and validated against the file's (mtime_ns, size)
+_template_content_cache: LRUCache[tuple[int, int, str]] = LRUCache(
+    maxsize=TEMPLATE_CACHE_SIZE
+)
+
+# Override priority of preset sources (higher wins for the same ID)
+_SOURCE_PRIORITY = {
+    PresetSource.BUILT_IN: 0,
+    PresetSource.USER: 1,
+    PresetSource.PROJECT: 2,
+}
+
+# File type prefixes of preset file names, longest first so that e.g.
+# "settings_local_json_x.toml" is not filed under "settings"
+_FILE_TYPE_PREFIXES = sorted(
+    (file_type.value for file_type in FileType), key=len, reverse=True
+)
+
+
+class _PresetListIndex:
+    """Sorted preset listings by file type and source.
+
+    Every preset is kept in four sorted listings: all presets, its file
+    type, its source, and its (file type, source) pair. Any filtered listing
+    is then a ready-made slice, so listing costs the size of the result
+    rather than the catalog. Entries sort by file type, then name (then ID
+    to break ties).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._listings: dict[
+            tuple[str | None, PresetSource | None], list[tuple[str, str, str]]
+        ] = {}
+        self._keys: dict[str, tuple[str, str, str]] = {}
+        self._scopes: dict[str, tuple[str, PresetSource]] = {}
+
+    def add(self, preset: Preset) -> None:
+        """Index a preset, replacing any entry with the same ID.
+
+        Args:
+            preset: Preset to index.
+        """
+        self.remove(preset.id)
+        key = (preset.type.value, preset.name, preset.id)
+        self._keys[preset.id] = key
+        self._scopes[preset.id] = (preset.type.value, preset.source)
+        for listing_key in self._listing_keys(preset.type.value, preset.source):
+            bisect.insort(self._listings.setdefault(listing_key, []), key)
+
+    def remove(self, preset_id: str) -> None:
+        """Remove a preset from the index, if present.
+
+        Args:
+            preset_id: ID of the preset to remove.
+        """
+        key = self._keys.pop(preset_id, None)
+        if key is None:
+            return
+        file_type, source = self._scopes.pop(preset_id)
+        for listing_key in self._listing_keys(file_type, source):
+            listing = self._listings[listing_key]
+            del listing[bisect.bisect_left(listing, key)]
+
+    def select(
+        self, file_type: str | None = None, source: PresetSource | None = None
+    ) -> list[str]:
+        """List the IDs of matching presets in sort order.
+
+        Args:
+            file_type: Only include this file type.
+            source: Only include this source.
+
+        Returns:
+            Matching preset IDs.
+        """
+        return [key[2] for key in self._listings.get((file_type, source), ())]
+
+    def clear(self) -> None:
+        """Remove all presets from the index."""
+        self._listings.clear()
+        self._keys.clear()
+        self._scopes.clear()
+
+    @staticmethod
+    def _listing_keys(
+        file_type: str, source: PresetSource
+    ) -> tuple[tuple[str | None, PresetSource | None], ...]:
+        """Get the listings a preset of this type and source belongs to."""
+        return ((None, None), (file_type, None), (None, source), (file_type, source))
 
 
 class TomlPresetRepository(AbstractPresetRepository):
@@ -37,6 +143,19 @@ class TomlPresetRepository(AbstractPresetRepository):
     - TOML persistence for user/project presets
     - Caching for performance
     - Circular dependency detection
+
+    Presets are loaded lazily. Looking up a preset ID only parses what is
+    needed to answer authoritatively: sources are visited from highest to
+    lowest priority (project, user, built-in), stopping at the first that
+    defines the ID, and within a preset directory only the files of the ID's
+    file type are read. Files are attributed to a file type by the
+    ``{file_type}_{name}.toml`` naming ``add_preset`` uses; files not named
+    that way are read on every lookup of their directory. Listing, load
+    errors and the inheritance table need every preset and load the rest.
+
+    The stat signatures of the preset directories and files are kept as a
+    snapshot, so ``refresh()`` can re-parse just the files added, changed or
+    removed since they were loaded.
     """
 
     def __init__(
@@ -57,11 +176,32 @@ class TomlPresetRepository(AbstractPresetRepository):
             Path.cwd() / ".claudefig" / "presets"
         )
 
-        # Cache for loaded presets
+        # Cache for loaded presets, with sorted listings by type and source
         self._preset_cache: dict[str, Preset] = {}
+        self._list_index = _PresetListIndex()
         self._cache_loaded = False
         self._load_errors: list[str] = []  # Track errors during preset loading
 
+        # Lazy loading state: (source, file type prefix) parts already parsed,
+        # preset files per source grouped by file type prefix (None for files
+        # not named after a file type), and the source stamps taken before the
+        # first part was parsed, which double as the snapshot for refresh()
+        self._loaded_parts: set[tuple[PresetSource, str | None]] = set()
+        self._source_files: dict[PresetSource, dict[str | None, list[Path]]] = {}
+        self._load_stamps: dict[str, Any] | None = None
+
+        # Every parsed preset by origin, including presets overridden by a
+        # higher-priority source, and load errors per preset file
+        self._builtin_presets: list[Preset] = []
+        self._file_presets: dict[Path, Preset] = {}
+        self._file_errors: dict[Path, str] = {}
+
+        # Inheritance flattened at load time: merged variables per preset, and
+        # the offending chain for presets in or extending an inheritance cycle
+        self._resolved_variables: dict[str, dict[str, Any]] = {}
+        self._inheritance_cycles: dict[str, list[str]] = {}
+        self._inheritance_errors: list[str] = []
+
     def list_presets(
         self, file_type: str | None = None, source: PresetSource | None = None
     ) -> list[Preset]:
@@ -76,18 +216,8 @@ class TomlPresetRepository(AbstractPresetRepository):
         """
         self._ensure_cache_loaded()
 
-        presets = list(self._preset_cache.values())
-
-        # Apply filters
-        if file_type:
-            presets = [p for p in presets if p.type.value == file_type]
-        if source:
-            presets = [p for p in presets if p.source == source]
-
-        # Sort by file type, then name
-        presets.sort(key=lambda p: (p.type.value, p.name))
-
-        return presets
+        preset_ids = self._list_index.select(file_type or None, source or None)
+        return [self._preset_cache[preset_id] for preset_id in preset_ids]
 
     def get_preset(self, preset_id: str) -> Preset | None:
         """Retrieve a specific preset by ID.
@@ -102,8 +232,7 @@ class TomlPresetRepository(AbstractPresetRepository):
             InvalidPresetNameError: If preset ID contains dangerous characters.
         """
         self._validate_preset_id(preset_id)
-        self._ensure_cache_loaded()
-        return self._preset_cache.get(preset_id)
+        return self._lookup(preset_id)
 
     def add_preset(self, preset: Preset, source: PresetSource) -> None:
         """Add a new preset to the specified source.
@@ -123,9 +252,7 @@ class TomlPresetRepository(AbstractPresetRepository):
         if source == PresetSource.BUILT_IN:
             raise BuiltInModificationError("preset", "add")
 
-        self._ensure_cache_loaded()
-
-        if preset.id in self._preset_cache:
+        if self._lookup(preset.id) is not None:
             raise PresetExistsError(preset.id)
 
         # Determine storage directory
@@ -147,6 +274,71 @@ class TomlPresetRepository(AbstractPresetRepository):
         # Update cache
         preset.source = source
         self._preset_cache[preset.id] = preset
+        self._track_file(preset_file, source, preset)
+        self._update_indexes(preset)
+
+    def add_presets(self, presets: list[Preset], source: PresetSource) -> None:
+        """Add several new presets to the specified source in one commit.
+
+        Every ID is validated before anything is written. Each preset is
+        written to a temporary file next to its destination, and the files
+        are renamed into place only once all of them were written; if a write
+        or rename fails, the presets already moved into place are removed
+        again. The cache, listing index and inheritance table are updated
+        once at the end.
+
+        Args:
+            presets: Preset objects to add.
+            source: Target source (USER or PROJECT only).
+
+        Raises:
+            InvalidPresetNameError: If a preset ID contains dangerous characters.
+            BuiltInModificationError: If source is BUILT_IN.
+            PresetExistsError: If a preset already exists or an ID repeats.
+            FileWriteError: If a write or rename fails.
+        """
+        for preset in presets:
+            self._validate_preset_id(preset.id)
+        self._check_new_presets(presets, source)
+        if not presets:
+            return
+
+        storage_dir = self._source_dir(source)
+        storage_dir.mkdir(parents=True, exist_ok=True)
+
+        # Stage every preset in a temporary file (not matched by *.toml)
+        staged: list[tuple[Path, Path]] = []
+        committed: list[Path] = []
+        preset_file = storage_dir
+        try:
+            for preset in presets:
+                preset_file = storage_dir / f"{preset.id.replace(':', '_')}.toml"
+                with tempfile.NamedTemporaryFile(
+                    mode="wb", dir=storage_dir, delete=False, suffix=".tmp"
+                ) as tmp:
+                    staged.append((Path(tmp.name), preset_file))
+                    tomli_w.dump({"preset": preset.to_dict()}, tmp)
+
+            for tmp_path, preset_file in staged:
+                os.replace(tmp_path, preset_file)
+                committed.append(preset_file)
+
+        except Exception as e:
+            for tmp_path, _ in staged:
+                tmp_path.unlink(missing_ok=True)
+            for path in committed:
+                path.unlink(missing_ok=True)
+            raise FileWriteError(str(preset_file), str(e)) from e
+
+        # Update cache
+        for preset, (_, preset_file) in zip(presets, staged, strict=True):
+            preset.source = source
+            self._preset_cache[preset.id] = preset
+            self._track_file(preset_file, source, preset)
+            if self._cache_loaded:
+                self._list_index.add(preset)
+        if self._cache_loaded:
+            self._build_inheritance_table()
 
     def update_preset(self, preset: Preset) -> None:
         """Update an existing preset.
@@ -161,12 +353,11 @@ class TomlPresetRepository(AbstractPresetRepository):
             FileWriteError: If write operation fails.
         """
         self._validate_preset_id(preset.id)
-        self._ensure_cache_loaded()
 
-        if preset.id not in self._preset_cache:
+        existing = self._lookup(preset.id)
+        if existing is None:
             raise PresetNotFoundError(preset.id)
 
-        existing = self._preset_cache[preset.id]
         if existing.source == PresetSource.BUILT_IN:
             raise BuiltInModificationError("preset", "update")
 
@@ -190,6 +381,8 @@ class TomlPresetRepository(AbstractPresetRepository):
 
         # Update cache
         self._preset_cache[preset.id] = preset
+        self._track_file(preset_file, existing.source, preset)
+        self._update_indexes(preset)
 
     def delete_preset(self, preset_id: str) -> None:
         """Delete a preset by ID.
@@ -204,9 +397,8 @@ class TomlPresetRepository(AbstractPresetRepository):
             FileOperationError: If deletion fails.
         """
         self._validate_preset_id(preset_id)
-        self._ensure_cache_loaded()
 
-        preset = self._preset_cache.get(preset_id)
+        preset = self._lookup(preset_id)
         if not preset:
             raise PresetNotFoundError(preset_id)
 
@@ -231,6 +423,10 @@ class TomlPresetRepository(AbstractPresetRepository):
 
         # Remove from cache
         del self._preset_cache[preset_id]
+        self._track_file(preset_file, preset.source, None)
+        if self._cache_loaded:
+            self._list_index.remove(preset_id)
+            self._build_inheritance_table()
 
     def exists(self, preset_id: str) -> bool:
         """Check if a preset exists.
@@ -241,12 +437,14 @@ class TomlPresetRepository(AbstractPresetRepository):
         Returns:
             True if preset exists, False otherwise.
         """
-        self._ensure_cache_loaded()
-        return preset_id in self._preset_cache
+        return self._lookup(preset_id) is not None
 
     def get_template_content(self, preset: Preset) -> str:
         """Load the template file content for a preset.
 
+        Content is served from an in-process LRU cache while the file's
+        modification time and size are unchanged.
+
         Args:
             preset: Preset object with template_path.
 
@@ -257,26 +455,37 @@ class TomlPresetRepository(AbstractPresetRepository):
             TemplateNotFoundError: If template file doesn't exist.
             FileReadError: If read operation fails.
         """
-        # If preset has explicit template_path, use it
-        if preset.template_path and preset.template_path.exists():
-            try:
-                return preset.template_path.read_text(encoding="utf-8")
-            except Exception as e:
-                raise FileReadError(str(preset.template_path), str(e)) from e
+        template_path = self.get_template_path(preset)
 
-        # Otherwise, resolve from preset source using component system
-        component_path = self._resolve_component_path(preset)
-
-        if not component_path or not component_path.exists():
+        if not template_path or not template_path.exists():
             raise TemplateNotFoundError(
                 preset.id,
-                f"Component file not found for preset '{preset.id}' at {component_path}",
+                f"Component file not found for preset '{preset.id}' at {template_path}",
             )
 
         try:
-            return component_path.read_text(encoding="utf-8")
+            return _read_template_cached(template_path)
         except Exception as e:
-            raise FileReadError(str(component_path), str(e)) from e
+            raise FileReadError(str(template_path), str(e)) from e
+
+    def get_template_path(self, preset: Preset) -> Path | None:
+        """Resolve the template file path for a preset without reading it.
+
+        An explicit ``template_path`` takes precedence over the component
+        resolved from the preset's source.
+
+        Args:
+            preset: Preset to resolve.
+
+        Returns:
+            Path to the template file, or None if it cannot be found.
+        """
+        # If preset has explicit template_path, use it
+        if preset.template_path and preset.template_path.exists():
+            return preset.template_path
+
+        # Otherwise, resolve from preset source using component system
+        return self._resolve_component_path(preset)
 
     def _resolve_component_path(self, preset: Preset) -> Path | None:
         """Resolve the component file path for a preset.
@@ -336,6 +545,24 @@ class TomlPresetRepository(AbstractPresetRepository):
     ) -> Path | None:
         """Resolve component path from built-in presets.
 
+        Args:
+            file_type: Type of file/component
+            component_name: Name of the component variant
+            file_name: Expected filename
+
+        Returns:
+            Path to component file, or None if not found
+        """
+        return component_cache.get_or_resolve(
+            ("builtin", file_type.value, component_name, file_name),
+            lambda: self._find_builtin_component(file_type, component_name, file_name),
+        )
+
+    def _find_builtin_component(
+        self, file_type: FileType, component_name: str, file_name: str
+    ) -> Path | None:
+        """Look up a built-in component file on disk (uncached).
+
         Args:
             file_type: Type of file/component
             component_name: Name of the component variant
@@ -394,17 +621,10 @@ class TomlPresetRepository(AbstractPresetRepository):
             Path to component file, or None if not found
         """
         # Path: ~/.claudefig/presets/default/components/{file_type}/{component_name}/{file_name}
-        component_path = (
-            self.user_presets_dir
-            / "default"
-            / "components"
-            / file_type.value
-            / component_name
-            / file_name
+        return self._find_component_file(
+            self.user_presets_dir, file_type, component_name, file_name
         )
 
-        return component_path if component_path.exists() else None
-
     def _resolve_project_component(
         self, file_type: FileType, component_name: str, file_name: str
     ) -> Path | None:
@@ -419,8 +639,30 @@ class TomlPresetRepository(AbstractPresetRepository):
             Path to component file, or None if not found
         """
         # Path: .claudefig/presets/default/components/{file_type}/{component_name}/{file_name}
+        return self._find_component_file(
+            self.project_presets_dir, file_type, component_name, file_name
+        )
+
+    def _find_component_file(
+        self,
+        presets_dir: Path,
+        file_type: FileType,
+        component_name: str,
+        file_name: str,
+    ) -> Path | None:
+        """Resolve a component file below a presets directory (memoized).
+
+        Args:
+            presets_dir: User or project presets directory
+            file_type: Type of file/component
+            component_name: Name of the component variant
+            file_name: Expected filename
+
+        Returns:
+            Path to component file, or None if not found
+        """
         component_path = (
-            self.project_presets_dir
+            presets_dir
             / "default"
             / "components"
             / file_type.value
@@ -428,7 +670,11 @@ class TomlPresetRepository(AbstractPresetRepository):
             / file_name
         )
 
-        return component_path if component_path.exists() else None
+        return component_cache.get_or_resolve(
+            ("file", str(component_path)),
+            lambda: component_path if component_path.exists() else None,
+            watch=component_path,
+        )
 
     def clear_cache(self) -> None:
         """Clear the internal preset cache.
@@ -436,8 +682,102 @@ class TomlPresetRepository(AbstractPresetRepository):
         Useful when presets have been modified externally and need to be reloaded.
         """
         self._preset_cache.clear()
+        self._list_index.clear()
         self._cache_loaded = False
         self._load_errors.clear()
+        self._loaded_parts.clear()
+        self._source_files.clear()
+        self._load_stamps = None
+        self._builtin_presets.clear()
+        self._file_presets.clear()
+        self._file_errors.clear()
+        self._resolved_variables.clear()
+        self._inheritance_cycles.clear()
+        self._inheritance_errors.clear()
+        _template_content_cache.clear()
+        clear_compiled_cache()
+        clear_component_cache()
+
+    def refresh(self) -> None:
+        """Pick up preset files added, changed or removed since they were read.
+
+        Each user/project preset directory whose mtime is unchanged is checked
+        by stat'ing the files it held; otherwise it is listed again. Only the
+        files whose ``(mtime_ns, size)`` differ from the snapshot are
+        re-parsed (and only if their part was loaded), the presets they
+        defined or now define are re-resolved by source priority, and the
+        listing index and inheritance table are updated in place. Unlike
+        ``clear_cache()``, presets from unchanged files keep their cached
+        instances, and the built-in presets are not re-read.
+        """
+        stamps = self._load_stamps
+        if stamps is None:
+            return
+
+        affected: set[str] = set()
+        for source in (PresetSource.USER, PresetSource.PROJECT):
+            groups = self._source_files.get(source)
+            if groups is None:
+                # Not read yet, so the next lookup reads it fresh
+                continue
+
+            directory = self._source_dir(source)
+            old_files = [path for files in groups.values() for path in files]
+            current = preset_index.stamp_paths([directory])
+            if current[str(directory)] == stamps.get(str(directory)):
+                current.update(preset_index.stamp_paths(old_files))
+            else:
+                current = preset_index.stamp_sources([], [directory])
+            if all(stamps.get(path) == stamp for path, stamp in current.items()):
+                continue
+
+            new_files = [
+                Path(path)
+                for path, stamp in current.items()
+                if stamp is not None and path != str(directory)
+            ]
+            for path in set(old_files) - set(new_files):
+                current.pop(str(path), None)
+                stamps.pop(str(path), None)
+                self._file_errors.pop(path, None)
+                removed = self._file_presets.pop(path, None)
+                if removed is not None:
+                    affected.add(removed.id)
+
+            self._source_files[source] = _group_preset_files(new_files)
+            for path in new_files:
+                if stamps.get(str(path)) == current[str(path)]:
+                    continue
+                self._file_errors.pop(path, None)
+                changed = self._file_presets.pop(path, None)
+                if changed is not None:
+                    affected.add(changed.id)
+                part = (source, _preset_file_prefix(path))
+                if self._cache_loaded:
+                    self._loaded_parts.add(part)
+                if part in self._loaded_parts:
+                    added = self._load_preset_file(path, source)
+                    if added is not None:
+                        affected.add(added.id)
+            stamps.update(current)
+
+        for preset_id in sorted(affected):
+            self._reresolve(preset_id)
+        if affected and self._cache_loaded:
+            self._build_inheritance_table()
+
+    def stamp_sources(self) -> dict[str, Any]:
+        """Record the stat signature of every file a preset load reads.
+
+        Returns:
+            Stamps from ``preset_index.stamp_sources`` for the built-in preset
+            file and the user/project preset directories.
+        """
+        builtin_file = _get_builtin_presets_file()
+        return preset_index.stamp_sources(
+            [builtin_file] if builtin_file else [],
+            [self.user_presets_dir, self.project_presets_dir],
+        )
 
     def get_load_errors(self) -> list[str]:
         """Get any errors that occurred during preset loading.
@@ -446,13 +786,224 @@ class TomlPresetRepository(AbstractPresetRepository):
             List of error messages from preset loading failures.
         """
         self._ensure_cache_loaded()
-        return self._load_errors.copy()
+        return (
+            self._load_errors
+            + list(self._file_errors.values())
+            + self._inheritance_errors
+        )
+
+    def get_resolved_variables(self, preset: Preset) -> dict[str, Any] | None:
+        """Get a preset's variables merged along its inheritance chain.
+
+        Served from the inheritance table built when presets are loaded, so
+        the cost does not depend on the depth of the chain.
+
+        Args:
+            preset: Preset to resolve.
+
+        Returns:
+            Merged variables (child overrides parent), or None if the preset
+            is not the one stored in this repository (e.g. an unsaved copy).
+
+        Raises:
+            CircularDependencyError: If the preset's chain contains a cycle.
+        """
+        self._ensure_cache_loaded()
+        if self._preset_cache.get(preset.id) is not preset:
+            return None
+
+        cycle = self._inheritance_cycles.get(preset.id)
+        if cycle is not None:
+            raise CircularDependencyError(cycle)
+        return self._resolved_variables[preset.id].copy()
 
     def _ensure_cache_loaded(self) -> None:
         """Ensure presets are loaded into cache."""
         if not self._cache_loaded:
             self._load_all_presets()
 
+    def _lookup(self, preset_id: str) -> Preset | None:
+        """Find a preset, loading only the sources needed to answer.
+
+        The files named after the ID's file type are tried first. File names
+        are only a convention, so before a source is passed over the rest of
+        its files are parsed too; a preset stored in a file named after
+        another type is still found, and still overrides lower sources.
+
+        Args:
+            preset_id: Preset identifier.
+
+        Returns:
+            The highest-priority preset with this ID, or None.
+        """
+        # A valid persistent index answers every lookup without parsing
+        if not self._cache_loaded and not self._restore_from_index():
+            prefix = preset_id.split(":", 1)[0]
+            for source in (PresetSource.PROJECT, PresetSource.USER):
+                for part in (prefix, *self._list_source_files(source)):
+                    self._load_part(source, part)
+                    preset = self._preset_cache.get(preset_id)
+                    if preset is not None and preset.source == source:
+                        return preset
+            self._load_part(PresetSource.BUILT_IN, None)
+        return self._preset_cache.get(preset_id)
+
+    def _load_part(self, source: PresetSource, prefix: str | None) -> None:
+        """Parse the presets of one file type prefix from a source, once.
+
+        Files not named after a file type are parsed along with any prefix.
+        The built-in source is a single file and is always parsed whole.
+
+        Args:
+            source: Source to load from.
+            prefix: File type prefix of the preset IDs being looked up.
+        """
+        if self._load_stamps is None:
+            # Stamp before parsing so edits made during the load are noticed
+            self._load_stamps = self.stamp_sources()
+
+        parts = [None] if source == PresetSource.BUILT_IN else [None, prefix]
+        for part in parts:
+            if (source, part) in self._loaded_parts:
+                continue
+            self._loaded_parts.add((source, part))
+            if source == PresetSource.BUILT_IN:
+                self._load_builtin_presets()
+            else:
+                self._load_preset_files(
+                    self._list_source_files(source).get(part, []), source
+                )
+
+    def _list_source_files(self, source: PresetSource) -> dict[str | None, list[Path]]:
+        """List a preset directory's TOML files grouped by file type prefix.
+
+        Args:
+            source: USER or PROJECT.
+
+        Returns:
+            Files per file type prefix (None for files not named after one).
+        """
+        groups = self._source_files.get(source)
+        if groups is None:
+            directory = self._source_dir(source)
+            groups = _group_preset_files(
+                list(directory.glob("*.toml")) if directory.is_dir() else []
+            )
+            self._source_files[source] = groups
+        return groups
+
+    def _source_dir(self, source: PresetSource) -> Path:
+        """Get the preset directory of the USER or PROJECT source."""
+        if source == PresetSource.USER:
+            return self.user_presets_dir
+        return self.project_presets_dir
+
+    def _track_file(
+        self, preset_file: Path, source: PresetSource, preset: Preset | None
+    ) -> None:
+        """Record a preset file written or deleted through this repository.
+
+        Keeps the file listing and snapshot current, so ``refresh()`` does
+        not mistake the repository's own writes for external changes.
+
+        Args:
+            preset_file: Written or deleted preset file.
+            source: Source the file belongs to.
+            preset: Preset now stored in the file, or None if it was deleted.
+        """
+        self._file_errors.pop(preset_file, None)
+        groups = self._source_files.get(source)
+        files = (
+            groups.setdefault(_preset_file_prefix(preset_file), [])
+            if groups is not None
+            else None
+        )
+        if preset is None:
+            self._file_presets.pop(preset_file, None)
+            if files is not None and preset_file in files:
+                files.remove(preset_file)
+            if self._load_stamps is not None:
+                self._load_stamps.pop(str(preset_file), None)
+        else:
+            self._file_presets[preset_file] = preset
+            if files is not None and preset_file not in files:
+                bisect.insort(files, preset_file)
+
+        if self._load_stamps is not None:
+            self._load_stamps.update(
+                preset_index.stamp_paths(
+                    [preset_file.parent] + ([preset_file] if preset else [])
+                )
+            )
+
+    def _reresolve(self, preset_id: str) -> None:
+        """Re-pick the cached preset for an ID after its files changed.
+
+        Loads the parts of every source the ID could come from, then caches
+        the preset from the highest-priority source (the last file wins within
+        a source), or drops the ID if no source defines it any more.
+
+        Args:
+            preset_id: ID whose defining files were added, changed or removed.
+        """
+        prefix = preset_id.split(":", 1)[0]
+        for source in (PresetSource.PROJECT, PresetSource.USER):
+            self._load_part(source, prefix)
+        self._load_part(PresetSource.BUILT_IN, None)
+
+        # Candidates in override order: built-in, then user and project files
+        candidates = list(self._builtin_presets)
+        for source in (PresetSource.USER, PresetSource.PROJECT):
+            paths = sorted(
+                path
+                for files in self._list_source_files(source).values()
+                for path in files
+            )
+            candidates.extend(
+                preset
+                for path in paths
+                if (preset := self._file_presets.get(path)) is not None
+            )
+        winner = next(
+            (preset for preset in reversed(candidates) if preset.id == preset_id),
+            None,
+        )
+
+        if winner is None:
+            self._preset_cache.pop(preset_id, None)
+            if self._cache_loaded:
+                self._list_index.remove(preset_id)
+        else:
+            self._preset_cache[preset_id] = winner
+            if self._cache_loaded:
+                self._list_index.add(winner)
+
+    def _cache_preset(self, preset: Preset) -> None:
+        """Cache a loaded preset unless a higher-priority source defines it.
+
+        Args:
+            preset: Preset with its source set.
+        """
+        existing = self._preset_cache.get(preset.id)
+        if (
+            existing is None
+            or _SOURCE_PRIORITY[existing.source] <= _SOURCE_PRIORITY[preset.source]
+        ):
+            self._preset_cache[preset.id] = preset
+
+    def _update_indexes(self, preset: Preset) -> None:
+        """Refresh the listing index and inheritance table after a change.
+
+        Both only exist once every preset is loaded; until then there is
+        nothing to update.
+
+        Args:
+            preset: Added or updated preset.
+        """
+        if self._cache_loaded:
+            self._list_index.add(preset)
+            self._build_inheritance_table()
+
     def _validate_preset_id(self, preset_id: str) -> None:
         """Validate preset ID doesn't contain path traversal characters.
 
@@ -470,24 +1021,167 @@ class TomlPresetRepository(AbstractPresetRepository):
             )
 
     def _load_all_presets(self) -> None:
-        """Load presets from all sources into cache."""
-        # Built-in presets are loaded first (lowest priority)
-        # User presets can override built-in
-        # Project presets can override user and built-in
+        """Load presets from all sources into cache.
+
+        Presets come from the persistent preset index when none of their
+        source files changed and no lookup has parsed presets yet (so presets
+        already handed out stay the cached instances); otherwise the parts
+        not yet parsed are parsed and, if that produced no errors, the index
+        is updated.
+        """
+        if self._restore_from_index():
+            return
+
+        self._parse_all_presets()
+        builtin_file = _get_builtin_presets_file()
+        if (
+            builtin_file
+            and self._load_stamps
+            and not self._load_errors
+            and not self._file_errors
+        ):
+            # The index only speeds up the next load, so failures are fine
+            with contextlib.suppress(FileWriteError):
+                presets = self._builtin_presets + list(self._file_presets.values())
+                origins: list[str | None] = [None] * len(self._builtin_presets)
+                origins.extend(str(path) for path in self._file_presets)
+                preset_index.save_presets(
+                    preset_index.index_key(self._index_directories()),
+                    self._load_stamps,
+                    presets,
+                    origins,
+                )
+        self._finish_load()
 
-        # Load built-in presets
-        self._load_builtin_presets()
+    def _index_directories(self) -> list[Path]:
+        """Get the preset directories the persistent index is keyed by."""
+        return [self.user_presets_dir, self.project_presets_dir]
 
-        # Load user presets
-        if self.user_presets_dir.exists():
-            self._load_from_directory(self.user_presets_dir, PresetSource.USER)
+    def _restore_from_index(self) -> bool:
+        """Load every preset from the persistent index, if it is still valid.
 
-        # Load project presets (highest priority)
-        if self.project_presets_dir.exists():
-            self._load_from_directory(self.project_presets_dir, PresetSource.PROJECT)
+        Only attempted before anything was parsed, so presets already handed
+        out stay the cached instances.
 
+        Returns:
+            True if the presets were restored from the index.
+        """
+        if self._loaded_parts or not _get_builtin_presets_file():
+            return False
+
+        directories = self._index_directories()
+        entry = preset_index.load_entry(preset_index.index_key(directories))
+        # Entries store paths as spelled when saved; only restore them when
+        # they match this repository's, so the snapshot stays usable
+        if entry is None or not all(str(d) in entry[0] for d in directories):
+            return False
+
+        self._restore_index_entry(*entry)
+        self._finish_load()
+        return True
+
+    def _finish_load(self) -> None:
+        """Build the listing index and inheritance table of a full load."""
+        self._list_index.clear()
+        for preset in self._preset_cache.values():
+            self._list_index.add(preset)
+        self._build_inheritance_table()
         self._cache_loaded = True
 
+    def _restore_index_entry(
+        self,
+        sources: dict[str, Any],
+        presets: list[Preset],
+        origins: list[str | None],
+    ) -> None:
+        """Restore the load state from a persistent index entry.
+
+        The entry's stamps become the snapshot and its file listing the
+        directory listings, so ``refresh()`` works the same as after parsing.
+
+        Args:
+            sources: Stamps the entry was validated against.
+            presets: Indexed presets in load order.
+            origins: File each preset was parsed from (None for built-in).
+        """
+        self._load_stamps = dict(sources)
+        for preset, origin in zip(presets, origins, strict=True):
+            if origin is None:
+                self._builtin_presets.append(preset)
+            else:
+                self._file_presets[Path(origin)] = preset
+            self._cache_preset(preset)
+
+        self._loaded_parts.add((PresetSource.BUILT_IN, None))
+        for source in (PresetSource.USER, PresetSource.PROJECT):
+            directory = self._source_dir(source)
+            files = [
+                Path(path)
+                for path, stamp in sources.items()
+                if stamp is not None and Path(path).parent == directory
+            ]
+            groups = _group_preset_files(files)
+            self._source_files[source] = groups
+            self._loaded_parts.update((source, prefix) for prefix in groups)
+            self._loaded_parts.add((source, None))
+
+    def _parse_all_presets(self) -> None:
+        """Parse every part of every source not parsed yet into cache."""
+        # User presets override built-in ones and project presets override
+        # both; _cache_preset applies that whatever order parts load in
+        self._load_part(PresetSource.BUILT_IN, None)
+        for source in (PresetSource.USER, PresetSource.PROJECT):
+            for prefix in self._list_source_files(source):
+                self._load_part(source, prefix)
+
+    def _build_inheritance_table(self) -> None:
+        """Flatten preset inheritance into merged variables per preset.
+
+        Presets are visited parents first (a topological order of the
+        ``extends`` graph), so each preset is merged onto its already
+        flattened parent in one step. A preset whose parent does not exist
+        keeps its own variables. Presets left unvisited are in, or extend,
+        an inheritance cycle; their chain is recorded instead and each cycle
+        is reported once through ``get_load_errors()``.
+        """
+        children: dict[str, list[Preset]] = {}
+        pending: deque[Preset] = deque()
+        for preset in self._preset_cache.values():
+            if preset.extends and preset.extends in self._preset_cache:
+                children.setdefault(preset.extends, []).append(preset)
+            else:
+                pending.append(preset)
+
+        resolved: dict[str, dict[str, Any]] = {}
+        while pending:
+            preset = pending.popleft()
+            parent_vars = resolved.get(preset.extends or "", {})
+            resolved[preset.id] = {**parent_vars, **preset.variables}
+            pending.extend(children.get(preset.id, ()))
+
+        cycles: dict[str, list[str]] = {}
+        errors: list[str] = []
+        reported: set[frozenset[str]] = set()
+        for preset_id in [pid for pid in self._preset_cache if pid not in resolved]:
+            # Unresolved presets always extend another unresolved preset
+            chain: list[str] = []
+            positions: dict[str, int] = {}
+            current = preset_id
+            while current not in positions:
+                positions[current] = len(chain)
+                chain.append(current)
+                current = self._preset_cache[current].extends or ""
+            cycles[preset_id] = [*chain, current]
+
+            cycle = chain[positions[current] :]
+            if frozenset(cycle) not in reported:
+                reported.add(frozenset(cycle))
+                errors.append(str(CircularDependencyError([*cycle, current])))
+
+        self._resolved_variables = resolved
+        self._inheritance_cycles = cycles
+        self._inheritance_errors = sorted(errors)
+
     def _load_builtin_presets(self) -> None:
         """Load built-in presets from package data TOML file."""
         from importlib.resources import files
@@ -505,57 +1199,78 @@ class TomlPresetRepository(AbstractPresetRepository):
 
                 preset = Preset.from_dict(preset_data)
                 preset.source = PresetSource.BUILT_IN
-                self._preset_cache[preset.id] = preset
+                self._builtin_presets.append(preset)
+                self._cache_preset(preset)
 
         except (ImportError, AttributeError, FileNotFoundError, TypeError) as e:
             self._load_errors.append(f"Failed to load built-in presets: {e}")
 
-    def _load_from_directory(self, directory: Path, source: PresetSource) -> None:
-        """Load all preset TOML files from a directory.
+    def _load_preset_files(
+        self, preset_files: list[Path], source: PresetSource
+    ) -> None:
+        """Load preset TOML files from a preset directory.
 
         Args:
-            directory: Directory containing preset TOML files.
+            preset_files: Preset TOML files to load.
             source: Source to assign to loaded presets.
         """
-        for preset_file in directory.glob("*.toml"):
-            try:
-                with open(preset_file, "rb") as f:
-                    data = tomllib.load(f)
+        for preset_file in preset_files:
+            self._load_preset_file(preset_file, source)
 
-                # Skip files without a [preset] section (e.g., ConfigTemplateManager files)
-                if "preset" not in data:
-                    continue
+    def _load_preset_file(
+        self, preset_file: Path, source: PresetSource
+    ) -> Preset | None:
+        """Load one preset TOML file into cache.
 
-                preset_data = data.get("preset", {})
+        Args:
+            preset_file: Preset TOML file to load.
+            source: Source to assign to the loaded preset.
 
-                # Validate required keys before deserialization
-                required_keys = ["id", "type", "name"]
-                if not all(key in preset_data for key in required_keys):
-                    error_msg = f"Missing required keys in {preset_file}"
-                    self._load_errors.append(error_msg)
-                    continue
+        Returns:
+            The loaded preset, or None if the file holds no valid preset
+            (errors are recorded for ``get_load_errors()``).
+        """
+        try:
+            with open(preset_file, "rb") as f:
+                data = tomllib.load(f)
 
-                preset = Preset.from_dict(preset_data)
-                preset.source = source
-
-                # Add to cache (overwrites if already exists = priority)
-                self._preset_cache[preset.id] = preset
-
-            except OSError as e:
-                # File system errors
-                error_msg = f"Failed to read preset file {preset_file}: {e}"
-                self._load_errors.append(error_msg)
-            except (KeyError, ValueError, TypeError) as e:
-                # Invalid preset data
-                error_msg = f"Invalid preset data in {preset_file}: {e}"
-                self._load_errors.append(error_msg)
-            except Exception as e:
-                # Unexpected errors
-                error_msg = (
-                    f"Unexpected error loading preset from {preset_file}: "
-                    f"{type(e).__name__}: {e}"
-                )
-                self._load_errors.append(error_msg)
+            # Skip files without a [preset] section (e.g., ConfigTemplateManager files)
+            if "preset" not in data:
+                return None
+
+            preset_data = data.get("preset", {})
+
+            # Validate required keys before deserialization
+            required_keys = ["id", "type", "name"]
+            if not all(key in preset_data for key in required_keys):
+                error_msg = f"Missing required keys in {preset_file}"
+                self._file_errors[preset_file] = error_msg
+                return None
+
+            preset = Preset.from_dict(preset_data)
+            preset.source = source
+
+            # Add to cache (overrides lower-priority sources)
+            self._file_presets[preset_file] = preset
+            self._cache_preset(preset)
+            return preset
+
+        except OSError as e:
+            # File system errors
+            error_msg = f"Failed to read preset file {preset_file}: {e}"
+            self._file_errors[preset_file] = error_msg
+        except (KeyError, ValueError, TypeError) as e:
+            # Invalid preset data
+            error_msg = f"Invalid preset data in {preset_file}: {e}"
+            self._file_errors[preset_file] = error_msg
+        except Exception as e:
+            # Unexpected errors
+            error_msg = (
+                f"Unexpected error loading preset from {preset_file}: "
+                f"{type(e).__name__}: {e}"
+            )
+            self._file_errors[preset_file] = error_msg
+        return None
 
 
 class FakePresetRepository(AbstractPresetRepository):
@@ -638,3 +1353,81 @@ class FakePresetRepository(AbstractPresetRepository):
     def clear_cache(self) -> None:
         """Clear all presets from memory."""
         self._presets.clear()
+
+    def refresh(self) -> None:
+        """Do nothing; in-memory presets cannot change externally."""
+
+
+def _get_builtin_presets_file() -> Path | None:
+    """Locate the built-in preset file on disk.
+
+    Returns:
+        Path to ``builtin_presets.toml``, or None if the package data is not
+        a regular file (e.g. inside a zip), in which case it is not indexed.
+    """
+    from importlib.resources import files
+
+    try:
+        builtin_file = files("presets").joinpath("builtin_presets.toml")
+    except (ImportError, AttributeError, FileNotFoundError, TypeError):
+        return None
+    if not hasattr(builtin_file, "__fspath__"):
+        return None
+    path = Path(builtin_file)  # type: ignore[arg-type]
+    return path if path.is_file() else None
+
+
+def _preset_file_prefix(preset_file: Path) -> str | None:
+    """Get the file type a preset file is named after.
+
+    Args:
+        preset_file: Preset TOML file.
+
+    Returns:
+        File type prefix of the file name, or None if it has none.
+    """
+    return next(
+        (p for p in _FILE_TYPE_PREFIXES if preset_file.stem.startswith(f"{p}_")),
+        None,
+    )
+
+
+def _group_preset_files(preset_files: list[Path]) -> dict[str | None, list[Path]]:
+    """Group preset files by the file type they are named after.
+
+    Args:
+        preset_files: Preset TOML files.
+
+    Returns:
+        Sorted files per file type prefix (None for files not named after one).
+    """
+    groups: dict[str | None, list[Path]] = {}
+    for preset_file in sorted(preset_files):
+        groups.setdefault(_preset_file_prefix(preset_file), []).append(preset_file)
+    return groups
+
+
+def _read_template_cached(template_path: Path) -> str:
+    """Read a template file through the in-process content cache.
+
+    Args:
+        template_path: Template file to read.
+
+    Returns:
+        Template content as string.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    resolved = str(template_path.resolve())
+    stat = template_path.stat()
+
+    cached = _template_content_cache.get(resolved)
+    if cached is not None:
+        mtime_ns, size, content = cached
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            return content
+
+    content = template_path.read_text(encoding="utf-8")
+    _template_content_cache.set(resolved, (stat.st_mtime_ns, stat.st_size, content))
+    return content
@@ -13,8 +13,13 @@ from claudefig.services import (
     component_discovery_service,
     config_service,
     file_instance_service,
+    fleet_service,
+    gitignore_service,
+    manifest_service,
+    mcp_registration_service,
     preset_definition_loader,
     preset_service,
+    search_service,
     structure_validator,
     validation_service,
 )
@@ -23,8 +28,13 @@ __all__ = [
     "component_discovery_service",
     "config_service",
     "file_instance_service",
+    "fleet_service",
+    "gitignore_service",
+    "manifest_service",
+    "mcp_registration_service",
     "preset_definition_loader",
     "preset_service",
+    "search_service",
     "structure_validator",
     "validation_service",
 ]
@@ -16,6 +16,7 @@ from typing import Any, cast
 
 from claudefig.models import ValidationResult
 from claudefig.repositories import AbstractConfigRepository
+from claudefig.utils.paths import COPY_STRATEGIES
 
 # Schema version for claudefig configuration
 SCHEMA_VERSION = "2.0"
@@ -44,10 +45,16 @@ VALID_CONFIG_KEYS: dict[str, type] = {
     "claudefig.template_source": str,
     "init.overwrite_existing": bool,
     "init.create_backup": bool,
+    "init.copy_strategy": str,
     "custom.template_dir": str,
     "custom.presets_dir": str,
 }
 
+# Allowed values for config keys that only accept a fixed set of choices
+CONFIG_KEY_CHOICES: dict[str, tuple[str, ...]] = {
+    "init.copy_strategy": COPY_STRATEGIES,
+}
+
 
 def validate_config_key(key: str, value: Any) -> ValidationResult:
     """Validate a config key and value before setting.
@@ -81,6 +88,11 @@ def validate_config_key(key: str, value: Any) -> ValidationResult:
             f"Invalid type for '{key}': expected {expected_type.__name__}, "
             f"got {type(value).__name__}"
         )
+    elif key in CONFIG_KEY_CHOICES and value not in CONFIG_KEY_CHOICES[key]:
+        result.add_error(
+            f"Invalid value for '{key}': '{value}'. "
+            f"Valid values: {', '.join(CONFIG_KEY_CHOICES[key])}"
+        )
 
     return result
 
@@ -0,0 +1,225 @@
+"""Fleet service for initializing or syncing many repositories at once.
+
+Fleet mode drives ``Initializer`` for a list of repositories from a single
+process pool. Each worker process loads presets, the component loader chain
+and template content once and reuses them for every repository it handles,
+so per-repository cost is limited to reading that repository's config and
+writing its files.
+"""
+
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+from claudefig.exceptions import FileReadError
+from claudefig.logging_config import get_logger
+from claudefig.models import FleetRepoResult
+
+logger = get_logger("services.fleet")
+
+FLEET_MODES = ("init", "sync")
+
+# Shared preset objects of the current worker process (see _init_worker)
+_worker_state: dict[str, Any] = {}
+
+
+def read_repos_file(repos_file: Path) -> list[Path]:
+    """Read repository paths from a repos file.
+
+    The file lists one repository per line. Blank lines and lines starting
+    with ``#`` are ignored, relative paths are resolved against the file's
+    directory and duplicates are dropped (keeping the first occurrence).
+
+    Args:
+        repos_file: Path to the repos file.
+
+    Returns:
+        Resolved repository paths, in file order.
+
+    Raises:
+        FileReadError: If the file cannot be read.
+    """
+    try:
+        lines = repos_file.read_text(encoding="utf-8").splitlines()
+    except OSError as e:
+        raise FileReadError(str(repos_file), str(e)) from e
+
+    repos: list[Path] = []
+    seen: set[Path] = set()
+    for line in lines:
+        entry = line.strip()
+        if not entry or entry.startswith("#"):
+            continue
+
+        repo_path = Path(entry).expanduser()
+        if not repo_path.is_absolute():
+            repo_path = repos_file.parent / repo_path
+        repo_path = repo_path.resolve()
+
+        if repo_path not in seen:
+            seen.add(repo_path)
+            repos.append(repo_path)
+
+    return repos
+
+
+def _init_worker() -> None:
+    """Prepare a worker process: silence output and warm preset caches."""
+    from claudefig import initializer, registry
+    from claudefig.component_loaders import create_component_loader_chain
+
+    # Per-repository output would interleave across workers; results are
+    # reported by the parent instead
+    initializer.console.quiet = True
+
+    # The manager wraps the shared repository, so one listing warms both
+    preset_manager = registry.get_preset_manager()
+    preset_repo = registry.get_preset_repository()
+    preset_manager.list_presets()
+    create_component_loader_chain()
+
+    _worker_state["preset_manager"] = preset_manager
+    _worker_state["preset_repo"] = preset_repo
+
+
+def _jobs_per_worker(max_workers: int) -> int:
+    """Split the CPU budget between fleet worker processes.
+
+    Each worker would otherwise generate files on a thread pool as large as
+    the CPU count, oversubscribing the machine by a factor of max_workers.
+
+    Args:
+        max_workers: Number of worker processes.
+
+    Returns:
+        Generation threads per worker (at least 1).
+    """
+    return max(1, (os.cpu_count() or 1) // max(1, max_workers))
+
+
+def process_repo(
+    repo_path: Path,
+    mode: str = "sync",
+    force: bool = False,
+    staged: bool = False,
+    jobs: int = 1,
+) -> FleetRepoResult:
+    """Initialize or sync a single repository.
+
+    Never raises: any failure is reported in the returned result.
+
+    Args:
+        repo_path: Repository root path.
+        mode: "init" or "sync". Sync requires an existing claudefig.toml.
+        force: Overwrite existing files.
+        staged: Stage all files and move them into place at the end.
+        jobs: Number of instances to generate concurrently within the
+            repository. Fleet workers already run in parallel, so this
+            defaults to 1.
+
+    Returns:
+        Result describing the outcome for the repository.
+    """
+    from claudefig.initializer import Initializer
+
+    start = time.perf_counter()
+
+    def result(success: bool, error: str | None = None, **counts) -> FleetRepoResult:
+        return FleetRepoResult(
+            repo_path=repo_path,
+            success=success,
+            duration=time.perf_counter() - start,
+            error=error,
+            **counts,
+        )
+
+    config_path = repo_path / "claudefig.toml"
+    if not repo_path.is_dir():
+        return result(False, "Repository directory not found")
+    if mode == "sync" and not config_path.exists():
+        return result(False, "claudefig.toml not found (run init first)")
+
+    try:
+        initializer = Initializer(
+            config_path=config_path,
+            preset_manager=_worker_state.get("preset_manager"),
+            preset_repo=_worker_state.get("preset_repo"),
+        )
+        success = initializer.initialize(
+            repo_path, force=force, skip_prompts=True, jobs=jobs, staged=staged
+        )
+    except Exception as e:
+        logger.debug(f"Fleet {mode} failed for {repo_path}: {e}", exc_info=True)
+        return result(False, str(e))
+
+    return result(
+        success,
+        None if success else "Completed with warnings",
+        files_written=initializer.files_written,
+        files_unchanged=initializer.files_unchanged,
+    )
+
+
+def run_fleet(
+    repos: list[Path],
+    mode: str = "sync",
+    jobs: int | None = None,
+    force: bool = False,
+    staged: bool = False,
+    on_result: Callable[[FleetRepoResult], None] | None = None,
+) -> list[FleetRepoResult]:
+    """Initialize or sync many repositories on a process pool.
+
+    Args:
+        repos: Repository root paths.
+        mode: "init" or "sync".
+        jobs: Number of worker processes (default: CPU count, capped at the
+            number of repositories).
+        force: Overwrite existing files.
+        staged: Stage all files per repository and move them into place at
+            the end.
+        on_result: Called with each result as soon as it completes.
+
+    Returns:
+        One result per repository, in the order of ``repos``.
+
+    Raises:
+        ValueError: If mode is not a valid fleet mode.
+    """
+    if mode not in FLEET_MODES:
+        raise ValueError(
+            f"Invalid fleet mode '{mode}'. Must be one of: {', '.join(FLEET_MODES)}"
+        )
+    if not repos:
+        return []
+
+    max_workers = min(len(repos), jobs or os.cpu_count() or 1)
+    worker_jobs = _jobs_per_worker(max_workers)
+    results: dict[int, FleetRepoResult] = {}
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker
+    ) as executor:
+        futures = {
+            executor.submit(
+                process_repo, repo_path, mode, force, staged, worker_jobs
+            ): index
+            for index, repo_path in enumerate(repos)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                repo_result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. it was killed)
+                repo_result = FleetRepoResult(
+                    repo_path=repos[index], success=False, error=str(e)
+                )
+            results[index] = repo_result
+            if on_result is not None:
+                on_result(repo_result)
+
+    return [results[index] for index in range(len(repos))]
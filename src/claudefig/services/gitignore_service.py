@@ -0,0 +1,120 @@
+"""Gitignore merge service for append-mode file instances.
+
+Entries generated by claudefig live in a delimited managed block::
+
+    # >>> claudefig >>>
+    .claude/
+    claudefig.toml
+    # <<< claudefig <<<
+
+Merging parses the existing file once, collects the patterns outside the
+block into a set, and rewrites only the block: it holds the template
+patterns that are not already ignored elsewhere in the file. Re-syncing
+updates the block in place, so it is never duplicated, and the rest of the
+file is left byte-for-byte unchanged.
+"""
+
+BLOCK_START = "# >>> claudefig >>>"
+BLOCK_END = "# <<< claudefig <<<"
+
+
+def _is_pattern(line: str) -> bool:
+    """Check whether a gitignore line is a pattern (not blank or a comment).
+
+    Args:
+        line: Stripped gitignore line.
+
+    Returns:
+        True if the line is a pattern.
+    """
+    return bool(line) and not line.startswith("#")
+
+
+def find_managed_block(lines: list[str]) -> tuple[int, int] | None:
+    """Find the managed block in a list of lines.
+
+    Args:
+        lines: Lines of the file, without line endings.
+
+    Returns:
+        Tuple of (start, end) indices where ``lines[start:end]`` is the
+        block including both markers, or None if there is no block. An
+        unterminated block extends to the end of the file.
+    """
+    start = None
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if start is None and stripped == BLOCK_START:
+            start = index
+        elif start is not None and stripped == BLOCK_END:
+            return start, index + 1
+
+    return None if start is None else (start, len(lines))
+
+
+def build_managed_block(entries: str, existing_patterns: set[str]) -> list[str]:
+    """Build the managed block for a set of template entries.
+
+    Args:
+        entries: Template content (one pattern or comment per line).
+        existing_patterns: Patterns already present outside the block.
+
+    Returns:
+        Block lines including markers, or an empty list if every pattern
+        is already ignored outside the block.
+    """
+    body: list[str] = []
+    seen = set(existing_patterns)
+    for line in entries.splitlines():
+        stripped = line.strip()
+        if not _is_pattern(stripped):
+            if stripped:
+                body.append(stripped)  # Keep template comments
+            continue
+        if stripped not in seen:
+            seen.add(stripped)
+            body.append(stripped)
+
+    if not any(_is_pattern(line) for line in body):
+        return []
+    return [BLOCK_START, *body, BLOCK_END]
+
+
+def merge_entries(existing: str | None, entries: str) -> str:
+    """Merge template entries into gitignore content.
+
+    Args:
+        existing: Current file content, or None if the file does not exist.
+        entries: Template entries to ensure are ignored.
+
+    Returns:
+        New file content. Equal to ``existing`` when nothing changed.
+    """
+    lines = existing.splitlines() if existing else []
+    block = find_managed_block(lines)
+    before, after = (lines[: block[0]], lines[block[1] :]) if block else (lines, [])
+
+    existing_patterns = {
+        stripped for line in before + after if _is_pattern(stripped := line.strip())
+    }
+    new_block = build_managed_block(entries, existing_patterns)
+
+    if block:
+        if not new_block:
+            # Nothing left to manage - drop the block and its separator line
+            while before and not before[-1].strip() and not after:
+                before.pop()
+        merged = before + new_block + after
+    elif new_block:
+        separator = [""] if any(line.strip() for line in before) else []
+        while before and not before[-1].strip():
+            before.pop()
+        merged = before + separator + new_block
+    else:
+        return existing or ""
+
+    newline = "\r\n" if existing and "\r\n" in existing else "\n"
+    new_content = newline.join(merged) + newline if merged else ""
+    if existing is not None and new_content.rstrip() == existing.rstrip():
+        return existing
+    return new_content
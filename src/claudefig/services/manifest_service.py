@@ -0,0 +1,253 @@
+"""Generation manifest service.
+
+The manifest (``.claude/.claudefig-manifest.json``) records, per file
+instance, a hash of the instance configuration plus the stat signature and
+content hash of every source component and generated output. ``sync`` uses
+it to skip instances whose inputs and outputs are unchanged since the last
+run, so only drifted files are read and rewritten.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from claudefig.exceptions import FileWriteError
+from claudefig.logging_config import get_logger
+from claudefig.models import FileInstance
+from claudefig.utils.hashing import hash_file, hash_text
+
+logger = get_logger("services.manifest")
+
+MANIFEST_FILENAME = ".claudefig-manifest.json"
+MANIFEST_VERSION = 1
+
+
+def get_manifest_path(repo_path: Path) -> Path:
+    """Get the manifest path for a repository.
+
+    Args:
+        repo_path: Repository root path.
+
+    Returns:
+        Path to the manifest file inside ``.claude/``.
+    """
+    return repo_path / ".claude" / MANIFEST_FILENAME
+
+
+def new_manifest() -> dict[str, Any]:
+    """Create an empty manifest.
+
+    Returns:
+        Manifest dictionary with no instance entries.
+    """
+    return {"version": MANIFEST_VERSION, "instances": {}}
+
+
+def load_manifest(repo_path: Path) -> dict[str, Any]:
+    """Load the manifest for a repository.
+
+    A missing, unreadable or outdated manifest is treated as empty, which
+    simply makes the next run regenerate everything.
+
+    Args:
+        repo_path: Repository root path.
+
+    Returns:
+        Manifest dictionary.
+    """
+    manifest_path = get_manifest_path(repo_path)
+    if not manifest_path.exists():
+        return new_manifest()
+
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return new_manifest()
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != MANIFEST_VERSION
+        or not isinstance(data.get("instances"), dict)
+    ):
+        logger.debug(f"Ignoring outdated manifest: {manifest_path}")
+        return new_manifest()
+
+    return data
+
+
+def save_manifest(repo_path: Path, manifest: dict[str, Any]) -> None:
+    """Save the manifest for a repository atomically.
+
+    Args:
+        repo_path: Repository root path.
+        manifest: Manifest dictionary to persist.
+
+    Raises:
+        FileWriteError: If the manifest cannot be written.
+    """
+    manifest_path = get_manifest_path(repo_path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=manifest_path.parent,
+            delete=False,
+            suffix=".tmp",
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            json.dump(manifest, tmp, indent=2, sort_keys=True)
+            tmp.write("\n")
+
+        tmp_path.replace(manifest_path)
+
+    except Exception as e:
+        if tmp_path and tmp_path.exists():
+            tmp_path.unlink()
+        raise FileWriteError(str(manifest_path), str(e)) from e
+
+
+def hash_instance(
+    instance: FileInstance, variables: dict[str, Any] | None = None
+) -> str:
+    """Hash the configuration of a file instance.
+
+    Args:
+        instance: File instance to hash.
+        variables: Template variables the instance is rendered with (preset
+            defaults, including inherited ones, merged with the instance's).
+
+    Returns:
+        Hex digest that changes whenever the instance configuration or its
+        template variables change.
+    """
+    data: dict[str, Any] = instance.to_dict()
+    if variables:
+        # Only hashed when present, so entries without variables stay valid
+        data = {"instance": data, "variables": variables}
+    return hash_text(json.dumps(data, sort_keys=True, default=str))
+
+
+def file_stamp(path: Path, content_hash: str | None = None) -> dict[str, Any]:
+    """Record the stat signature and content hash of a file.
+
+    Args:
+        path: File to stamp.
+        content_hash: Known content hash, to avoid re-reading the file.
+
+    Returns:
+        Dictionary with ``mtime_ns``, ``size`` and ``hash`` keys.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    stat = path.stat()
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "hash": content_hash or hash_file(path),
+    }
+
+
+def stamp_matches(path: Path, stamp: dict[str, Any]) -> bool:
+    """Check whether a file still matches a recorded stamp.
+
+    Matching stat signatures are trusted without reading the file. Only
+    when the size matches but the modification time differs is the file
+    hashed, e.g. after a checkout touched it without changing it.
+
+    Args:
+        path: File to check.
+        stamp: Stamp previously returned by ``file_stamp``.
+
+    Returns:
+        True if the file is unchanged, False otherwise.
+    """
+    try:
+        stat = path.stat()
+        if stat.st_size != stamp.get("size"):
+            return False
+        if stat.st_mtime_ns == stamp.get("mtime_ns"):
+            return True
+        return hash_file(path) == stamp.get("hash")
+    except OSError:
+        return False
+
+
+def is_instance_current(
+    entry: dict[str, Any] | None,
+    instance: FileInstance,
+    sources: list[Path],
+    repo_path: Path,
+    variables: dict[str, Any] | None = None,
+) -> bool:
+    """Check whether an instance is unchanged since it was last generated.
+
+    Args:
+        entry: Manifest entry for the instance, if any.
+        instance: File instance as currently configured.
+        sources: Source files the instance is generated from.
+        repo_path: Repository root path (outputs are stored relative to it).
+        variables: Template variables the instance would be rendered with.
+
+    Returns:
+        True if the configuration, the template variables, every source and
+        every output match the manifest entry, False otherwise.
+    """
+    if not entry or not sources:
+        return False
+
+    if entry.get("instance_hash") != hash_instance(instance, variables):
+        return False
+
+    recorded_sources = entry.get("sources", {})
+    if set(recorded_sources) != {str(source) for source in sources}:
+        return False
+
+    outputs = entry.get("outputs", {})
+    if not outputs:
+        return False
+
+    return all(
+        stamp_matches(source, recorded_sources[str(source)]) for source in sources
+    ) and all(
+        stamp_matches(repo_path / relpath, stamp) for relpath, stamp in outputs.items()
+    )
+
+
+def record_instance(
+    manifest: dict[str, Any],
+    instance: FileInstance,
+    sources: dict[Path, str | None],
+    outputs: dict[Path, str | None],
+    repo_path: Path,
+    variables: dict[str, Any] | None = None,
+) -> None:
+    """Record a generated instance in the manifest.
+
+    Args:
+        manifest: Manifest dictionary to update in place.
+        instance: File instance that was generated.
+        sources: Source files mapped to their content hash (None to compute).
+        outputs: Generated files mapped to their content hash (None to compute).
+        repo_path: Repository root path.
+        variables: Template variables the instance was rendered with.
+
+    Raises:
+        OSError: If a source or output file cannot be read.
+    """
+    manifest["instances"][instance.id] = {
+        "instance_hash": hash_instance(instance, variables),
+        "sources": {
+            str(source): file_stamp(source, content_hash)
+            for source, content_hash in sources.items()
+        },
+        "outputs": {
+            output.relative_to(repo_path).as_posix(): file_stamp(output, content_hash)
+            for output, content_hash in outputs.items()
+        },
+    }
@@ -0,0 +1,143 @@
+"""MCP registration cache service.
+
+The registration cache (``~/.claudefig/cache/mcp-registrations.json``)
+remembers, per repository, a hash of each MCP server configuration that was
+last registered successfully with ``claude mcp add-json``. ``setup-mcp`` and
+``init`` use it to skip servers whose configuration has not changed, without
+spawning a subprocess for them. Entries are kept per repository because
+``claude mcp add-json`` registers servers in the project's local scope.
+Saves re-read and update the cache under a lock file, so fleet workers
+setting up different repositories at once do not drop each other's entries.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from claudefig.exceptions import FileWriteError
+from claudefig.logging_config import get_logger
+from claudefig.user_config import get_cache_dir
+from claudefig.utils.hashing import hash_text
+from claudefig.utils.paths import exclusive_lock
+
+logger = get_logger("services.mcp_registration")
+
+REGISTRATION_CACHE_FILENAME = "mcp-registrations.json"
+REGISTRATION_LOCK_FILENAME = "mcp-registrations.lock"
+# Version 2: registrations now run in the repository directory; version 1
+# entries may record servers that were registered into another project
+REGISTRATION_CACHE_VERSION = 2
+
+
+def get_registration_cache_path() -> Path:
+    """Get the path of the MCP registration cache.
+
+    Returns:
+        Path to the cache file inside ``~/.claudefig/cache/``.
+    """
+    return get_cache_dir() / REGISTRATION_CACHE_FILENAME
+
+
+def hash_server_config(config: dict[str, Any]) -> str:
+    """Hash an MCP server configuration.
+
+    The configuration is serialized canonically, so formatting or key order
+    changes in the JSON file do not count as a change.
+
+    Args:
+        config: Parsed server configuration.
+
+    Returns:
+        Hex digest of the configuration.
+    """
+    return hash_text(json.dumps(config, sort_keys=True, separators=(",", ":")))
+
+
+def _load_cache(cache_path: Path) -> dict[str, Any]:
+    """Load the whole registration cache, treating problems as empty.
+
+    Args:
+        cache_path: Cache file path.
+
+    Returns:
+        Cache dictionary.
+    """
+    empty: dict[str, Any] = {"version": REGISTRATION_CACHE_VERSION, "projects": {}}
+    if not cache_path.exists():
+        return empty
+
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable MCP registration cache: {e}")
+        return empty
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != REGISTRATION_CACHE_VERSION
+        or not isinstance(data.get("projects"), dict)
+    ):
+        logger.debug(f"Ignoring outdated MCP registration cache: {cache_path}")
+        return empty
+
+    return data
+
+
+def load_registrations(repo_path: Path) -> dict[str, str]:
+    """Load the cached registrations for a repository.
+
+    Args:
+        repo_path: Repository root path.
+
+    Returns:
+        Mapping of server name to the hash of its registered configuration.
+    """
+    cache = _load_cache(get_registration_cache_path())
+    registrations = cache["projects"].get(str(repo_path.resolve()), {})
+    return dict(registrations) if isinstance(registrations, dict) else {}
+
+
+def save_registrations(repo_path: Path, registrations: dict[str, str]) -> None:
+    """Save the cached registrations for a repository atomically.
+
+    The cache is re-read under an exclusive lock right before it is
+    replaced, so entries other processes saved for other repositories are
+    preserved.
+
+    Args:
+        repo_path: Repository root path.
+        registrations: Mapping of server name to configuration hash.
+
+    Raises:
+        FileWriteError: If the cache cannot be written.
+    """
+    cache_path = get_registration_cache_path()
+    project_key = str(repo_path.resolve())
+
+    tmp_path = None
+    try:
+        with exclusive_lock(cache_path.parent / REGISTRATION_LOCK_FILENAME):
+            cache = _load_cache(cache_path)
+            if registrations:
+                cache["projects"][project_key] = dict(sorted(registrations.items()))
+            else:
+                cache["projects"].pop(project_key, None)
+
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=cache_path.parent,
+                delete=False,
+                suffix=".tmp",
+            ) as tmp:
+                tmp_path = Path(tmp.name)
+                json.dump(cache, tmp, indent=2, sort_keys=True)
+                tmp.write("\n")
+
+            tmp_path.replace(cache_path)
+
+    except Exception as e:
+        if tmp_path and tmp_path.exists():
+            tmp_path.unlink()
+        raise FileWriteError(str(cache_path), str(e)) from e
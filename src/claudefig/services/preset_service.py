@@ -5,6 +5,7 @@ separated from data access (repositories) and UI (CLI/TUI).
 """
 
 import re
+from pathlib import Path
 from typing import Any
 
 from claudefig.exceptions import (
@@ -16,6 +17,11 @@ from claudefig.exceptions import (
 )
 from claudefig.models import Preset, PresetSource, ValidationResult
 from claudefig.repositories import AbstractPresetRepository
+from claudefig.utils.templating import (
+    CompiledTemplate,
+    compile_template,
+    get_compiled_template,
+)
 
 
 def list_presets(
@@ -87,6 +93,36 @@ def create_preset(
     return preset
 
 
+def create_presets(
+    repo: AbstractPresetRepository,
+    presets: list[Preset],
+    source: PresetSource = PresetSource.USER,
+) -> list[Preset]:
+    """Create several presets in one write.
+
+    All presets are checked before any is saved, so a duplicate or invalid
+    ID leaves the repository unchanged.
+
+    Args:
+        repo: Preset repository to save to.
+        presets: Preset objects to create.
+        source: Where to store (USER or PROJECT, not BUILT_IN).
+
+    Returns:
+        The created presets.
+
+    Raises:
+        BuiltInModificationError: If trying to add to BUILT_IN source.
+        PresetExistsError: If a preset already exists or an ID repeats.
+    """
+    if source == PresetSource.BUILT_IN:
+        raise BuiltInModificationError("preset", "create")
+
+    repo.add_presets(presets, source)
+
+    return presets
+
+
 def delete_preset(repo: AbstractPresetRepository, preset_id: str) -> None:
     """Delete a preset.
 
@@ -112,6 +148,10 @@ def render_preset(
         {{ -> literal {
         }} -> literal }
 
+    The template is tokenized once into a compiled template, cached per
+    template file and modification time, so rendering is a single join.
+    Substituted values are inserted as-is and never re-expanded.
+
     Variables are merged with priority:
     1. Provided variables (highest)
     2. Preset default variables
@@ -129,30 +169,37 @@ def render_preset(
         FileNotFoundError: If template file doesn't exist.
         IOError: If template cannot be read.
     """
-    # Load template content
-    template_content = repo.get_template_content(preset)
+    template = _get_compiled_template(repo, preset)
 
     # Merge variables (provided overrides preset defaults)
     merged_vars = preset.variables.copy()
     if variables:
         merged_vars.update(variables)
 
-    # First, replace escaped braces with temporary placeholders
-    # Use null bytes which cannot appear in text files
-    escape_open = "\x00OPEN\x00"
-    escape_close = "\x00CLOSE\x00"
+    return template.render(merged_vars)
+
 
-    rendered = template_content.replace("{{", escape_open).replace("}}", escape_close)
+def _get_compiled_template(
+    repo: AbstractPresetRepository, preset: Preset
+) -> CompiledTemplate:
+    """Get the compiled template of a preset.
 
-    # Simple variable substitution: {variable_name} -> value
-    for var_name, var_value in merged_vars.items():
-        placeholder = f"{{{var_name}}}"
-        rendered = rendered.replace(placeholder, str(var_value))
+    Templates backed by a file are compiled once per (path, mtime) and
+    reused across calls; others are compiled from their content.
 
-    # Restore escaped braces as literal braces
-    rendered = rendered.replace(escape_open, "{").replace(escape_close, "}")
+    Args:
+        repo: Preset repository (to resolve and load the template).
+        preset: Preset whose template to compile.
 
-    return rendered
+    Returns:
+        Compiled template.
+    """
+    template_path = repo.get_template_path(preset)
+    if isinstance(template_path, Path):
+        return get_compiled_template(
+            template_path, lambda: repo.get_template_content(preset)
+        )
+    return compile_template(repo.get_template_content(preset))
 
 
 def extract_template_variables(template_content: str) -> set[str]:
@@ -259,7 +306,9 @@ def resolve_preset_variables(
     """Resolve preset variables including inheritance chain.
 
     If preset extends another preset, merge variables from parent(s).
-    Child variables override parent variables.
+    Child variables override parent variables. Repositories that flatten
+    inheritance when loading answer from that table without walking the
+    chain.
 
     Args:
         repo: Preset repository (to load parent presets).
@@ -272,8 +321,11 @@ def resolve_preset_variables(
     Raises:
         CircularDependencyError: If circular inheritance is detected.
     """
-    # Initialize visited set for cycle detection
+    # Use the repository's flattened inheritance table when it has one
     if _visited is None:
+        resolved = repo.get_resolved_variables(preset)
+        if resolved is not None:
+            return resolved
         _visited = set()
 
     # Check for circular dependency
@@ -0,0 +1,525 @@
+"""Search service for presets and components.
+
+The search index is an inverted index over the name, tags, type and
+description of every preset and of every component in the user's component
+directories (``component.toml`` provides component descriptions and tags).
+Query terms match indexed tokens exactly, as a prefix, or approximately
+through shared trigrams, and every term must match for an entry to be
+returned.
+
+Collecting the entries reads every ``component.toml``, so they are cached in
+``~/.claudefig/cache/search-index.json`` together with the stat signature of
+every file and directory they were collected from, and reused until one of
+them changes. Postings are rebuilt from the cached entries, which is faster
+than deserializing them.
+"""
+
+import bisect
+import contextlib
+import json
+import re
+import sys
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from claudefig import registry
+from claudefig.exceptions import FileWriteError
+from claudefig.logging_config import get_logger
+from claudefig.models import SearchEntry, SearchMatch
+from claudefig.repositories import preset_index
+from claudefig.repositories.preset_repository import TomlPresetRepository
+from claudefig.user_config import get_cache_dir, get_components_dir, get_user_config_dir
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+logger = get_logger("services.search")
+
+SEARCH_INDEX_FILENAME = "search-index.json"
+SEARCH_INDEX_VERSION = 1
+
+# Relevance of a token by the field it came from
+NAME_WEIGHT = 3.0
+TAG_WEIGHT = 2.0
+TYPE_WEIGHT = 1.0
+DESCRIPTION_WEIGHT = 1.0
+
+# Share of the field weight scored by prefix and trigram matches
+PREFIX_FACTOR = 0.8
+TRIGRAM_FACTOR = 0.5
+
+# Minimum trigram similarity for an approximate match
+TRIGRAM_THRESHOLD = 0.3
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def get_search_index_path() -> Path:
+    """Get the path of the search index cache.
+
+    Returns:
+        Path to the index file inside ``~/.claudefig/cache/``.
+    """
+    return get_cache_dir() / SEARCH_INDEX_FILENAME
+
+
+def get_component_roots() -> list[tuple[str, Path]]:
+    """Get the component directories that are indexed.
+
+    Returns:
+        ``(source, directory)`` pairs for global components and the default
+        preset's components, each containing one directory per type.
+    """
+    return [
+        ("global", get_components_dir()),
+        ("preset", get_user_config_dir() / "presets" / "default" / "components"),
+    ]
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        Tokens in order of appearance.
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(token: str) -> set[str]:
+    """Get the trigrams of a token, padded to mark its start and end.
+
+    Args:
+        token: Token to split.
+
+    Returns:
+        Set of three-character substrings.
+    """
+    padded = f"^{token}$"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Inverted index over search entries.
+
+    Postings map each token to the entries containing it and the weight of
+    the strongest field it appears in. The sorted vocabulary answers prefix
+    lookups with a binary search, and a trigram table over the vocabulary
+    answers approximate lookups for misspelled terms.
+    """
+
+    def __init__(self, entries: list[SearchEntry]):
+        """Initialize the index.
+
+        Args:
+            entries: Entries to index.
+        """
+        self.entries = entries
+        self._postings = self._build_postings(entries)
+        self._vocabulary = sorted(self._postings)
+        self._trigrams: dict[str, list[str]] | None = None
+
+    @staticmethod
+    def _build_postings(entries: list[SearchEntry]) -> dict[str, dict[int, float]]:
+        """Build postings for entries.
+
+        Args:
+            entries: Entries to index.
+
+        Returns:
+            Mapping of token to ``{entry position: weight}``.
+        """
+        postings: dict[str, dict[int, float]] = {}
+        for position, entry in enumerate(entries):
+            fields = [
+                (entry.name, NAME_WEIGHT),
+                (" ".join(entry.tags), TAG_WEIGHT),
+                (entry.file_type, TYPE_WEIGHT),
+                (entry.description, DESCRIPTION_WEIGHT),
+            ]
+            for text, weight in fields:
+                for token in tokenize(text):
+                    documents = postings.setdefault(token, {})
+                    if documents.get(position, 0.0) < weight:
+                        documents[position] = weight
+        return postings
+
+    def _get_trigrams(self) -> dict[str, list[str]]:
+        """Get the trigram table of the vocabulary, building it on first use."""
+        if self._trigrams is None:
+            table: dict[str, list[str]] = {}
+            for token in self._vocabulary:
+                for gram in trigrams(token):
+                    table.setdefault(gram, []).append(token)
+            self._trigrams = table
+        return self._trigrams
+
+    def _match_term(self, term: str) -> dict[int, float]:
+        """Score every entry matching one query term.
+
+        Exact token matches score the full field weight, tokens starting
+        with the term score ``PREFIX_FACTOR`` of it, and if neither exists,
+        tokens sharing enough trigrams with the term score ``TRIGRAM_FACTOR``
+        of it scaled by their similarity.
+
+        Args:
+            term: Tokenized query term.
+
+        Returns:
+            Mapping of entry position to its best score for the term.
+        """
+        candidates: dict[str, float] = {}
+        start = bisect.bisect_left(self._vocabulary, term)
+        for token in self._vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            candidates[token] = 1.0 if token == term else PREFIX_FACTOR
+
+        if not candidates and len(term) >= 3:
+            term_grams = trigrams(term)
+            shared: dict[str, int] = {}
+            table = self._get_trigrams()
+            for gram in term_grams:
+                for token in table.get(gram, ()):
+                    shared[token] = shared.get(token, 0) + 1
+            for token, count in shared.items():
+                similarity = count / len(term_grams | trigrams(token))
+                if similarity >= TRIGRAM_THRESHOLD:
+                    candidates[token] = TRIGRAM_FACTOR * similarity
+
+        scores: dict[int, float] = {}
+        for token, factor in candidates.items():
+            for position, weight in self._postings[token].items():
+                score = weight * factor
+                if scores.get(position, 0.0) < score:
+                    scores[position] = score
+        return scores
+
+    def search(
+        self,
+        query: str = "",
+        kind: str | None = None,
+        file_type: str | None = None,
+        sources: Iterable[str] | None = None,
+        limit: int | None = None,
+    ) -> list[SearchMatch]:
+        """Find entries matching every term of a query.
+
+        Args:
+            query: Search text; an empty query matches every entry.
+            kind: Only return entries of this kind ("preset" or "component").
+            file_type: Only return entries of this type.
+            sources: Only return entries from these sources.
+            limit: Maximum number of matches to return.
+
+        Returns:
+            Matches ordered by descending score, then kind, name and source.
+        """
+        source_filter = set(sources) if sources is not None else None
+        terms = tokenize(query)
+
+        scores: dict[int, float] | None = None
+        if not terms:
+            scores = dict.fromkeys(range(len(self.entries)), 0.0)
+        for term in terms:
+            term_scores = self._match_term(term)
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    position: score + term_scores[position]
+                    for position, score in scores.items()
+                    if position in term_scores
+                }
+            if not scores:
+                return []
+
+        matches = []
+        for position, score in (scores or {}).items():
+            entry = self.entries[position]
+            if (
+                (kind is None or entry.kind == kind)
+                and (file_type is None or entry.file_type == file_type)
+                and (source_filter is None or entry.source in source_filter)
+            ):
+                matches.append(SearchMatch(entry=entry, score=score))
+
+        matches.sort(
+            key=lambda m: (-m.score, m.entry.kind, m.entry.name, m.entry.source)
+        )
+        return matches[:limit] if limit is not None else matches
+
+
+def _load_component_metadata(metadata_file: Path) -> tuple[str, tuple[str, ...]]:
+    """Read the description and tags of a component.
+
+    Tags may be declared under ``[component.metadata]`` or ``[metadata]``.
+
+    Args:
+        metadata_file: Path to ``component.toml``.
+
+    Returns:
+        Tuple of (description, tags); empty if the file is missing or invalid.
+    """
+    if not metadata_file.is_file():
+        return "", ()
+
+    try:
+        with open(metadata_file, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        logger.debug(f"Failed to load component metadata from {metadata_file}: {e}")
+        return "", ()
+
+    component = data.get("component", {})
+    if not isinstance(component, dict):
+        component = {}
+    description = component.get("description", "")
+
+    tags: Any = []
+    for metadata in (component.get("metadata"), data.get("metadata")):
+        if isinstance(metadata, dict) and metadata.get("tags"):
+            tags = metadata["tags"]
+            break
+
+    return (
+        description if isinstance(description, str) else "",
+        tuple(tag for tag in tags if isinstance(tag, str))
+        if isinstance(tags, list)
+        else (),
+    )
+
+
+def _component_dirs(roots: list[tuple[str, Path]]) -> list[tuple[str, Path, Path]]:
+    """List the component directories below the component roots.
+
+    Args:
+        roots: ``(source, directory)`` pairs from ``get_component_roots``.
+
+    Returns:
+        ``(source, type directory, component directory)`` triples.
+    """
+    found = []
+    for source, root in roots:
+        if not root.is_dir():
+            continue
+        for type_dir in sorted(root.iterdir()):
+            if not type_dir.is_dir() or type_dir.name.startswith((".", "_")):
+                continue
+            for component_dir in sorted(type_dir.iterdir()):
+                if component_dir.is_dir() and not component_dir.name.startswith("."):
+                    found.append((source, type_dir, component_dir))
+    return found
+
+
+def collect_entries(
+    preset_repo: TomlPresetRepository,
+    component_roots: list[tuple[str, Path]] | None = None,
+) -> list[SearchEntry]:
+    """Collect search entries for all presets and components.
+
+    Args:
+        preset_repo: Repository to list presets from.
+        component_roots: Component directories; defaults to
+            ``get_component_roots()``.
+
+    Returns:
+        Preset entries followed by component entries.
+    """
+    entries = [
+        SearchEntry(
+            kind="preset",
+            id=preset.id,
+            name=preset.name,
+            file_type=preset.type.value,
+            source=preset.source.value,
+            description=preset.description,
+            tags=tuple(preset.tags),
+        )
+        for preset in preset_repo.list_presets()
+    ]
+
+    roots = component_roots if component_roots is not None else get_component_roots()
+    for source, type_dir, component_dir in _component_dirs(roots):
+        description, tags = _load_component_metadata(component_dir / "component.toml")
+        entries.append(
+            SearchEntry(
+                kind="component",
+                id=f"{type_dir.name}:{component_dir.name}",
+                name=component_dir.name,
+                file_type=type_dir.name,
+                source=source,
+                description=description,
+                tags=tags,
+                path=str(component_dir),
+            )
+        )
+
+    return entries
+
+
+def _stamp_sources(
+    preset_repo: TomlPresetRepository, roots: list[tuple[str, Path]]
+) -> dict[str, Any]:
+    """Record the stat signature of everything the index is built from.
+
+    Adding or removing a component changes its type directory's mtime,
+    adding a ``component.toml`` changes the component directory's mtime,
+    and editing one changes its own stamp.
+
+    Args:
+        preset_repo: Repository the preset entries come from.
+        roots: Component roots.
+
+    Returns:
+        Mapping of path to ``[mtime_ns, size]``, or None if it is missing.
+    """
+    paths = [root for _, root in roots]
+    for _, root in roots:
+        if root.is_dir():
+            paths.extend(path for path in sorted(root.iterdir()) if path.is_dir())
+    for _, _, component_dir in _component_dirs(roots):
+        paths.append(component_dir)
+        metadata_file = component_dir / "component.toml"
+        if metadata_file.exists():
+            paths.append(metadata_file)
+
+    sources = preset_repo.stamp_sources()
+    sources.update(preset_index.stamp_paths(paths))
+    return sources
+
+
+def _index_key(preset_repo: TomlPresetRepository, roots: list[tuple[str, Path]]) -> str:
+    """Build the key identifying the directories an index was built from."""
+    return preset_index.index_key(
+        [preset_repo.user_presets_dir, preset_repo.project_presets_dir]
+        + [root for _, root in roots]
+    )
+
+
+def _load_cached_index(key: str) -> SearchIndex | None:
+    """Load the cached entries into an index if none of their sources changed.
+
+    Args:
+        key: Key from ``_index_key``.
+
+    Returns:
+        Cached index, or None if there is no valid cache.
+    """
+    index_path = get_search_index_path()
+    if not index_path.exists():
+        return None
+
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable search index: {e}")
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != SEARCH_INDEX_VERSION
+        or data.get("key") != key
+        or not isinstance(data.get("sources"), dict)
+        or not preset_index.sources_match(data["sources"])
+    ):
+        return None
+
+    try:
+        return SearchIndex([SearchEntry.from_dict(entry) for entry in data["entries"]])
+    except (KeyError, TypeError, ValueError) as e:
+        logger.debug(f"Ignoring invalid search index: {e}")
+        return None
+
+
+def _save_cached_index(key: str, sources: dict[str, Any], index: SearchIndex) -> None:
+    """Save the entries of an index to the cache atomically.
+
+    Nothing is saved when a source was modified too recently to be trusted.
+
+    Args:
+        key: Key from ``_index_key``.
+        sources: Stamps taken before the index was built.
+        index: Built index.
+
+    Raises:
+        FileWriteError: If the cache cannot be written.
+    """
+    if preset_index.has_racy_sources(sources):
+        return
+
+    index_path = get_search_index_path()
+    tmp_path = None
+    try:
+        content = json.dumps(
+            {
+                "version": SEARCH_INDEX_VERSION,
+                "key": key,
+                "sources": sources,
+                "entries": [entry.to_dict() for entry in index.entries],
+            },
+            separators=(",", ":"),
+        )
+
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            encoding="utf-8",
+            dir=index_path.parent,
+            delete=False,
+            suffix=".tmp",
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            tmp.write(content)
+
+        tmp_path.replace(index_path)
+
+    except Exception as e:
+        if tmp_path and tmp_path.exists():
+            tmp_path.unlink()
+        raise FileWriteError(str(index_path), str(e)) from e
+
+
+def load_search_index(
+    preset_repo: TomlPresetRepository | None = None,
+    component_roots: list[tuple[str, Path]] | None = None,
+    rebuild: bool = False,
+) -> SearchIndex:
+    """Load the search index, from the cache when it is still valid.
+
+    Args:
+        preset_repo: Repository to index presets from; defaults to the
+            shared one from ``claudefig.registry``.
+        component_roots: Component directories; defaults to
+            ``get_component_roots()``.
+        rebuild: Ignore the cache and rebuild the index.
+
+    Returns:
+        Search index over all presets and components.
+    """
+    repo = preset_repo or registry.get_preset_repository()
+    roots = component_roots if component_roots is not None else get_component_roots()
+    key = _index_key(repo, roots)
+
+    if not rebuild:
+        cached = _load_cached_index(key)
+        if cached is not None:
+            return cached
+
+    # Stamp before building so edits made during the build are noticed
+    sources = _stamp_sources(repo, roots)
+    index = SearchIndex(collect_entries(repo, roots))
+
+    # Preset load errors would be missing from a cached index, so only cache
+    # complete builds; the cache only speeds up later loads anyway
+    if not repo.get_load_errors():
+        with contextlib.suppress(FileWriteError):
+            _save_cached_index(key, sources, index)
+
+    return index
@@ -14,6 +14,7 @@ from textual.widgets import Button, Footer, Header, Static
 from claudefig import __version__
 from claudefig.repositories.config_repository import TomlConfigRepository
 from claudefig.services import config_service
+from claudefig.tui.base import ConfigSaveScheduler
 from claudefig.tui.panels import ContentPanel
 
 
@@ -26,6 +27,7 @@ class MainScreen(App):
     # Type hints for attributes accessed by child widgets
     config_data: dict[str, Any]
     config_repo: TomlConfigRepository
+    config_saver: ConfigSaveScheduler
 
     # Load CSS from external files (split by feature)
     CSS_PATH = [
@@ -60,6 +62,12 @@ class MainScreen(App):
         else:
             self.config_data = config_service.DEFAULT_CONFIG.copy()
 
+        # Debounces config writes from screens; flushed before the app exits
+        self.config_saver = ConfigSaveScheduler(
+            self.set_timer, on_error=self._on_config_save_error
+        )
+        self._exit_save_failed = False
+
     def compose(self) -> ComposeResult:
         """Compose the application layout."""
         yield Header()
@@ -95,6 +103,38 @@ class MainScreen(App):
 
         self.query_one("#init", Button).focus()
 
+    def exit(
+        self,
+        result: Any = None,
+        return_code: int = 0,
+        message: Any = None,
+    ) -> None:
+        """Write pending config edits, then exit.
+
+        If the write fails the app stays open so the error can be seen;
+        exiting again discards the unsaved edits.
+        """
+        try:
+            self.config_saver.flush()
+        except Exception as e:
+            if not self._exit_save_failed:
+                self._exit_save_failed = True
+                self.notify(
+                    f"Error saving config: {e}. Quit again to discard changes.",
+                    severity="error",
+                )
+                return
+        super().exit(result, return_code, message)
+
+    def on_unmount(self) -> None:
+        """Write any config edits still pending when the app shuts down."""
+        with contextlib.suppress(Exception):
+            self.config_saver.flush()
+
+    def _on_config_save_error(self, error: Exception) -> None:
+        """Report a failed debounced config save."""
+        self.notify(f"Error saving config: {error}", severity="error")
+
     def on_key(self, event: Key) -> None:
         """Handle key events for navigation.
 
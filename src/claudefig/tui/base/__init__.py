@@ -12,6 +12,7 @@ from .navigation import (
     BaseNavigablePanel,
     BaseScreen,
 )
+from .save_scheduler import ConfigSaveScheduler
 
 __all__ = [
     "BaseHorizontalNavigablePanel",
@@ -19,6 +20,7 @@ __all__ = [
     "BaseNavigablePanel",
     "BaseScreen",
     "BackButtonMixin",
+    "ConfigSaveScheduler",
     "FileInstanceMixin",
     "ScrollNavigationMixin",
     "SystemUtilityMixin",
@@ -65,6 +65,8 @@ from textual.containers import Container, Horizontal, VerticalScroll
 from textual.events import DescendantFocus
 from textual.widgets import Button
 
+from claudefig.tui.base.save_scheduler import get_save_scheduler
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -130,6 +132,7 @@ class FileInstanceMixin:
 
     Provides:
     - sync_instances_to_config(): Sync instances dict to config and save
+    - flush_config_saves(): Write any debounced saves immediately
 
     Requires the screen to have:
     - self.config_data: dict[str, Any] - Configuration data dictionary
@@ -168,6 +171,10 @@ class FileInstanceMixin:
         2. Sync instances_dict → config_data (done here)
         3. Sync config_data → disk via repository (done here)
 
+        Inside a running app the disk write is debounced through the app's
+        ConfigSaveScheduler, so rapid edits are coalesced into one write;
+        without one the config is saved immediately.
+
         Call this method after ANY modification to instances_dict:
         - Adding an instance: instances_dict[id] = instance
         - Updating an instance: instances_dict[id] = updated_instance
@@ -192,16 +199,29 @@ class FileInstanceMixin:
         Raises:
             AttributeError: If screen doesn't have required attributes
         """
-        from claudefig.services import file_instance_service
+        from claudefig.services import config_service, file_instance_service
 
         # Step 2: Sync instances_dict → config_data
         instances_list = file_instance_service.save_instances_to_config(
             self.instances_dict
         )
-        self.config_data["files"] = instances_list
+        config_service.set_file_instances(self.config_data, instances_list)
 
         # Step 3: Sync config_data → disk via repository
-        self.config_repo.save(self.config_data)
+        scheduler = get_save_scheduler(self)
+        if scheduler is None:
+            config_service.save_config(self.config_data, self.config_repo)
+        else:
+            scheduler.schedule(self.config_data, self.config_repo)
+
+    def flush_config_saves(self) -> None:
+        """Write any debounced config saves to disk now.
+
+        Call this before leaving the screen or reading the config from disk.
+        """
+        scheduler = get_save_scheduler(self)
+        if scheduler is not None:
+            scheduler.flush()
 
 
 class ScrollNavigationMixin:
@@ -0,0 +1,141 @@
+"""Debounced, coalesced config saves for TUI screens.
+
+Every toggle, add or remove in the file instance screens rewrites the whole
+config file. Instead of saving on each edit, screens mark the config dirty
+with ``ConfigSaveScheduler.schedule()``. The first edit starts a short timer,
+later edits within the window only replace the pending data, and the config
+is written once when the timer fires. ``flush()`` writes pending configs
+immediately and is called when a screen is unmounted and when the app exits,
+so no edit is lost on exit.
+
+Example:
+    >>> scheduler = ConfigSaveScheduler(app.set_timer)
+    >>> scheduler.schedule(config_data, config_repo)  # starts the window
+    >>> scheduler.schedule(config_data, config_repo)  # coalesced
+    >>> scheduler.flush()  # written once
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol
+
+from claudefig.logging_config import get_logger
+from claudefig.services import config_service
+
+if TYPE_CHECKING:
+    from claudefig.repositories import AbstractConfigRepository
+
+logger = get_logger("tui.save_scheduler")
+
+# Seconds to collect edits before writing the config
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+
+class _Timer(Protocol):
+    """The part of ``textual.timer.Timer`` the scheduler uses."""
+
+    def stop(self) -> None: ...
+
+
+SetTimer = Callable[[float, Callable[[], None]], _Timer]
+
+
+class ConfigSaveScheduler:
+    """Coalesce config saves made within a short window.
+
+    Pending saves are tracked per config file, so edits from screens sharing
+    one config are written together.
+
+    Attributes:
+        delay: Seconds between the first unsaved edit and the write.
+    """
+
+    def __init__(
+        self,
+        set_timer: SetTimer,
+        delay: float = SAVE_DEBOUNCE_SECONDS,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            set_timer: Starts a one-shot timer, e.g. ``App.set_timer``
+            delay: Seconds to collect edits before writing
+            on_error: Called with the exception when a timed save fails
+        """
+        self.delay = delay
+        self._set_timer = set_timer
+        self._on_error = on_error
+        self._pending: dict[str, tuple[dict[str, Any], AbstractConfigRepository]] = {}
+        self._timer: _Timer | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Whether any config has edits not yet written."""
+        return bool(self._pending)
+
+    def schedule(
+        self, config_data: dict[str, Any], config_repo: AbstractConfigRepository
+    ) -> None:
+        """Mark a config dirty and write it when the current window ends.
+
+        Args:
+            config_data: Configuration data to save
+            config_repo: Repository to save it to
+        """
+        self._pending[str(config_repo.get_path())] = (config_data, config_repo)
+        if self._timer is None:
+            self._timer = self._set_timer(self.delay, self._on_timer)
+
+    def flush(self) -> None:
+        """Write every pending config now.
+
+        Configs that fail to save stay pending so a later flush retries them.
+
+        Raises:
+            Exception: The first save error, after every config was attempted.
+        """
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+        error: Exception | None = None
+        for key, (config_data, config_repo) in list(self._pending.items()):
+            try:
+                config_service.save_config(config_data, config_repo)
+            except Exception as e:
+                logger.warning(f"Failed to save config {key}: {e}")
+                error = error or e
+            else:
+                del self._pending[key]
+
+        if error is not None:
+            raise error
+
+    def _on_timer(self) -> None:
+        """Write pending configs when the window ends, reporting failures."""
+        self._timer = None
+        try:
+            self.flush()
+        except Exception as e:
+            if self._on_error is None:
+                raise
+            self._on_error(e)
+
+
+def get_save_scheduler(node: object) -> ConfigSaveScheduler | None:
+    """Find the save scheduler of the app a screen or widget belongs to.
+
+    Args:
+        node: Screen or widget, possibly not attached to a running app
+
+    Returns:
+        The app's scheduler, or None when there is no app or it has none.
+    """
+    try:
+        app = node.app  # type: ignore[attr-defined]
+    except Exception:
+        return None
+    scheduler = getattr(app, "config_saver", None)
+    return scheduler if isinstance(scheduler, ConfigSaveScheduler) else None
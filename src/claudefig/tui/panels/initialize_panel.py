@@ -18,6 +18,7 @@ from claudefig.exceptions import (
 from claudefig.repositories.config_repository import TomlConfigRepository
 from claudefig.services import config_service
 from claudefig.tui.base import BaseHorizontalNavigablePanel
+from claudefig.tui.base.save_scheduler import get_save_scheduler
 
 
 class InitializePanel(BaseHorizontalNavigablePanel):
@@ -152,6 +153,11 @@ class InitializePanel(BaseHorizontalNavigablePanel):
         config_path = Path.cwd() / "claudefig.toml"
 
         try:
+            # The initializer reads the config from disk, so write pending edits
+            scheduler = get_save_scheduler(self)
+            if scheduler is not None:
+                scheduler.flush()
+
             # Step 1: If no config exists, apply default preset first
             if not config_path.exists():
                 self.app.notify("Applying default preset...", severity="information")
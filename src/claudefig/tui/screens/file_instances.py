@@ -7,9 +7,11 @@ from typing import Any
 from textual import work
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.css.query import NoMatches
 from textual.events import Key
-from textual.widgets import Button, Label, Select, TabbedContent, TabPane
+from textual.widgets import Button, Input, Label, Select, TabbedContent, TabPane
 
+from claudefig import registry
 from claudefig.error_messages import ErrorMessages
 from claudefig.exceptions import (
     ConfigFileNotFoundError,
@@ -19,18 +21,18 @@ from claudefig.exceptions import (
 )
 from claudefig.models import FileInstance, FileType
 from claudefig.repositories.config_repository import TomlConfigRepository
-from claudefig.repositories.preset_repository import TomlPresetRepository
-from claudefig.services import config_service, file_instance_service
-from claudefig.tui.base import BaseScreen, SystemUtilityMixin
+from claudefig.services import file_instance_service, search_service
+from claudefig.tui.base import BaseScreen, FileInstanceMixin, SystemUtilityMixin
 from claudefig.tui.widgets.file_instance_item import FileInstanceItem
 from claudefig.user_config import get_components_dir
 
 
-class FileInstancesScreen(BaseScreen, SystemUtilityMixin):
+class FileInstancesScreen(BaseScreen, SystemUtilityMixin, FileInstanceMixin):
     """Screen for managing multi-instance file types with tabs.
 
     Inherits standard navigation bindings from BaseScreen with ScrollNavigationMixin
-    support for smart vertical/horizontal navigation.
+    support for smart vertical/horizontal navigation, and saves instance edits
+    through FileInstanceMixin.
     """
 
     # Class variables for state persistence across recompose
@@ -57,29 +59,52 @@ class FileInstancesScreen(BaseScreen, SystemUtilityMixin):
         self.config_data = config_data
         self.config_repo = config_repo
         self.instances_dict = instances_dict
-        self.preset_repo = TomlPresetRepository()
+        self.preset_repo = registry.get_preset_repository()
+        self._search_index: search_service.SearchIndex | None = None
 
-    def sync_instances_to_config(self) -> None:
-        """Sync instances dict to config and save to disk.
+    def _get_component_options(
+        self, file_type: FileType, query: str = ""
+    ) -> list[tuple[str, str]]:
+        """Build the component selector options for a file type.
 
-        This implements the state synchronization pattern:
-        1. Modify instances_dict (done by caller)
-        2. Sync instances → config (done here)
-        3. Sync config → disk (done here)
+        Components come from the search index, ranked by relevance to the
+        filter query when one is given.
+
+        Args:
+            file_type: File type whose components to list
+            query: Filter text typed by the user
+
+        Returns:
+            Select options of (label, "name|source")
         """
-        # Save instances to config format
-        instances_data = file_instance_service.save_instances_to_config(
-            self.instances_dict
+        if self._search_index is None:
+            self._search_index = search_service.load_search_index(self.preset_repo)
+
+        matches = self._search_index.search(
+            query,
+            kind="component",
+            file_type=file_type.value,
+            sources=("global", "preset"),
         )
-        config_service.set_file_instances(self.config_data, instances_data)
-
-        # Save config to disk
-        config_service.save_config(self.config_data, self.config_repo)
+        return [
+            (
+                f"+ Add {match.entry.name} ({match.entry.source[0]})",
+                f"{match.entry.name}|{match.entry.source}",
+            )
+            for match in matches
+        ]
 
     def on_mount(self) -> None:
         """Called when the widget is mounted. Restore focus state after recompose."""
         self.call_after_refresh(self.restore_focus)
 
+    def on_unmount(self) -> None:
+        """Write any pending config edits when leaving the screen."""
+        try:
+            self.flush_config_saves()
+        except Exception as e:
+            self.app.notify(f"Error saving config: {e}", severity="error")
+
     def on_descendant_focus(self, event) -> None:
         """Track which widget has focus for restoration after recompose."""
         import contextlib
@@ -238,6 +263,10 @@ class FileInstancesScreen(BaseScreen, SystemUtilityMixin):
                 FileType.STATUSLINE,
             ]
 
+            # Reload on every compose so components added meanwhile show up;
+            # the index is only rebuilt if a component directory changed
+            self._search_index = search_service.load_search_index(self.preset_repo)
+
             # Create tabbed content
             with TabbedContent(id="file-instances-tabs"):
                 for file_type in all_file_types:
@@ -252,73 +281,14 @@ class FileInstancesScreen(BaseScreen, SystemUtilityMixin):
                         # Component/Template selector
                         with Horizontal(classes="tab-actions"):
                             # Get available components from both global and preset sources
-                            from claudefig.user_config import (
-                                get_components_dir,
-                                get_user_config_dir,
-                            )
-
-                            components = []
-
-                            # Map file type to component directory (unified for all types)
-                            type_dirs = {
-                                FileType.CLAUDE_MD: "claude_md",
-                                FileType.GITIGNORE: "gitignore",
-                                FileType.COMMANDS: "commands",
-                                FileType.AGENTS: "agents",
-                                FileType.HOOKS: "hooks",
-                                FileType.OUTPUT_STYLES: "output_styles",
-                                FileType.MCP: "mcp",
-                                FileType.PLUGINS: "plugins",
-                                FileType.SKILLS: "skills",
-                                FileType.SETTINGS_JSON: "settings_json",
-                                FileType.SETTINGS_LOCAL_JSON: "settings_local_json",
-                                FileType.STATUSLINE: "statusline",
-                            }
-
-                            type_dir_name = type_dirs.get(file_type, file_type.value)
-
-                            # Scan global components: ~/.claudefig/components/{type}/
-                            components_dir = get_components_dir()
-                            global_type_dir = components_dir / type_dir_name
-
-                            if global_type_dir.exists():
-                                # All component types are folder-based (directories with files inside)
-                                components.extend(
-                                    [
-                                        (f"{item.name} (g)", item, "global")
-                                        for item in global_type_dir.iterdir()
-                                        if item.is_dir()
-                                    ]
-                                )
+                            component_options = self._get_component_options(file_type)
 
-                            # Scan preset components: ~/.claudefig/presets/default/components/{type}/
-                            user_config_dir = get_user_config_dir()
-                            default_preset_dir = user_config_dir / "presets" / "default"
-                            preset_type_dir = (
-                                default_preset_dir / "components" / type_dir_name
-                            )
-
-                            if preset_type_dir.exists():
-                                # All component types are folder-based
-                                components.extend(
-                                    [
-                                        (f"{item.name} (p)", item, "preset")
-                                        for item in preset_type_dir.iterdir()
-                                        if item.is_dir()
-                                    ]
+                            if component_options:
+                                yield Input(
+                                    placeholder="Filter...",
+                                    id=f"filter-add-{file_type.value}",
+                                    classes="component-filter",
                                 )
-
-                            if components:
-                                # Build options: (display_name, component_data)
-                                # Store component data as JSON string: "name|source"
-                                component_options = [
-                                    (
-                                        f"+ Add {display_name}",
-                                        f"{path.stem if not path.is_dir() else path.name}|{source}",
-                                    )
-                                    for display_name, path, source in components
-                                ]
-
                                 yield Select(
                                     options=component_options,
                                     prompt=f"Select a {'template' if is_single_instance else 'component'} to add...",
@@ -358,6 +328,21 @@ class FileInstancesScreen(BaseScreen, SystemUtilityMixin):
             # Back button
             yield from self.compose_back_button()
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Re-rank a component selector as its filter text changes."""
+        input_id = event.input.id
+        if not input_id or not input_id.startswith("filter-add-"):
+            return
+
+        file_type_value = input_id.replace("filter-add-", "")
+        try:
+            file_type = FileType(file_type_value)
+            select = self.query_one(f"#select-add-{file_type_value}", Select)
+        except (ValueError, NoMatches):
+            return
+
+        select.set_options(self._get_component_options(file_type, event.value))
+
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle component selection."""
         select_id = event.select.id
@@ -8,9 +8,9 @@ from textual.containers import VerticalScroll
 from textual.dom import DOMNode
 from textual.widgets import Button, Label, Static
 
+from claudefig import registry
 from claudefig.models import FileInstance, FileType
 from claudefig.repositories.config_repository import TomlConfigRepository
-from claudefig.repositories.preset_repository import TomlPresetRepository
 from claudefig.services import config_service, file_instance_service
 from claudefig.tui.base import BaseScreen
 from claudefig.tui.widgets import OverlayDropdown
@@ -51,7 +51,7 @@ class OverviewScreen(BaseScreen):
         self.config_data = config_data
         self.config_repo = config_repo
         self.instances_dict = instances_dict
-        self.preset_repo = TomlPresetRepository()
+        self.preset_repo = registry.get_preset_repository()
 
     def compose_screen_content(self) -> ComposeResult:
         """Compose the overview screen content."""
@@ -268,6 +268,9 @@ class OverviewScreen(BaseScreen):
         all_errors = []
         all_warnings = []
 
+        # Presets may have been edited on disk since they were loaded
+        self.preset_repo.refresh()
+
         for instance in self.instances_dict.values():
             # Only validate enabled instances
             if instance.enabled:
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from rich.console import Console
 
+from claudefig.component_loaders import clear_component_cache
 from claudefig.utils.paths import validate_not_symlink
 from claudefig.utils.platform import secure_mkdir
 
@@ -373,6 +374,7 @@ def _copy_default_preset_to_user(presets_dir: Path, verbose: bool = True) -> Non
             symlinks=False,
             ignore_dangling_symlinks=True,
         )
+        clear_component_cache()
 
         if verbose:
             console.print(f"[green]+[/green] Copied default preset to {dest_dir}")
@@ -517,6 +519,7 @@ def reset_user_config(force: bool = False) -> bool:
 
     try:
         shutil.rmtree(config_dir)
+        clear_component_cache()
         console.print("[green]User configuration reset successfully[/green]")
         console.print("Run claudefig again to reinitialize with defaults")
         return True
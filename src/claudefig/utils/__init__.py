@@ -1,13 +1,27 @@
 """Utility modules for claudefig.
 
 This package provides utility functions organized by category:
+- cache: In-process LRU caching
+- hashing: Content hashing
 - paths: Path handling and directory operations
 - platform: Platform detection and system operations
+- templating: Compiled template rendering
 - validation: Input validation (see services/validation_service.py)
 """
 
+# Caching utilities
+from claudefig.utils.cache import LRUCache
+
+# Hashing utilities
+from claudefig.utils.hashing import hash_file, hash_text
+
 # Path utilities
-from claudefig.utils.paths import ensure_directory, is_git_repository
+from claudefig.utils.paths import (
+    copy_file,
+    ensure_directory,
+    exclusive_lock,
+    is_git_repository,
+)
 
 # Platform utilities
 from claudefig.utils.platform import (
@@ -21,6 +35,9 @@ from claudefig.utils.platform import (
     run_platform_command,
 )
 
+# Templating utilities
+from claudefig.utils.templating import CompiledTemplate, compile_template
+
 __all__ = [
     # Platform
     "get_platform",
@@ -32,6 +49,16 @@ __all__ = [
     "get_editor_command",
     "run_platform_command",
     # Paths
+    "copy_file",
     "ensure_directory",
+    "exclusive_lock",
     "is_git_repository",
+    # Hashing
+    "hash_file",
+    "hash_text",
+    # Caching
+    "LRUCache",
+    # Templating
+    "CompiledTemplate",
+    "compile_template",
 ]
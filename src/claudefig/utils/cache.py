@@ -0,0 +1,100 @@
+"""In-process caching utilities for claudefig.
+
+This module provides a small thread-safe, bounded LRU cache used to avoid
+repeated disk reads within a single process, and the racy window shared by
+the caches that validate entries against file modification times.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+# Files modified this recently may change again without their mtime or size
+# changing on filesystems with coarse timestamps, so a matching stamp alone
+# does not prove they are unchanged
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe least-recently-used cache with a fixed maximum size.
+
+    Example:
+        >>> cache: LRUCache[str] = LRUCache(maxsize=2)
+        >>> cache.set("a", "1")
+        >>> cache.get("a")
+        '1'
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the
+                least recently used one.
+
+        Raises:
+            ValueError: If maxsize is less than 1
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: V | None = None) -> V | None:
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned if the key is not cached
+
+        Returns:
+            Cached value, or default if not found.
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Cache a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a key from the cache if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        """Check if a key is cached (without marking it as used)."""
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        """Get the number of cached entries."""
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,42 @@
+"""Content hashing utilities for claudefig.
+
+This module provides stable content hashes used to describe generated
+files, e.g. in generation plans.
+"""
+
+import hashlib
+from pathlib import Path
+
+# Read files in 1 MiB blocks when hashing
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def hash_text(text: str) -> str:
+    """Compute the SHA-256 hex digest of text encoded as UTF-8.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_HASH_BLOCK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
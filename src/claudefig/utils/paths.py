@@ -4,10 +4,38 @@ This module provides utilities for:
 - Directory creation and management
 - Git repository detection
 - Path resolution and validation
+- File copying with copy-on-write and hard link strategies
+- Inter-process locking through lock files
 """
 
+import contextlib
+import errno
+import os
+import shutil
+import sys
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
+# Supported copy strategies for copy_file()
+COPY_STRATEGIES = ("copy", "reflink", "hardlink", "auto")
+DEFAULT_COPY_STRATEGY = "auto"
+
+# ioctl request number for FICLONE (Linux, from <linux/fs.h>)
+_FICLONE = 0x40049409
+
+# Errors meaning "this filesystem/platform can't do that", not real failures
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.ENOSYS,
+    getattr(errno, "EOPNOTSUPP", errno.ENOSYS),
+    getattr(errno, "ENOTSUP", errno.ENOSYS),
+    errno.EBADF,
+}
+
 
 def ensure_directory(path: Path) -> None:
     """Ensure directory exists, create if it doesn't.
@@ -64,3 +92,187 @@ def validate_not_symlink(path: Path, context: str = "") -> None:
     if path.is_symlink():
         ctx = f" ({context})" if context else ""
         raise ValueError(f"Symbolic links are not allowed{ctx}: {path}")
+
+
+def copy_file(src: Path, dst: Path, strategy: str = DEFAULT_COPY_STRATEGY) -> str:
+    """Copy a file using the requested strategy, falling back to a plain copy.
+
+    Strategies:
+    - ``copy``: Regular copy with metadata (``shutil.copy2``)
+    - ``reflink``: Copy-on-write clone (FICLONE) on filesystems that support
+      it (btrfs, XFS), so no data blocks are duplicated
+    - ``hardlink``: Hard link to the source. Source and destination then
+      share content, so edits to one affect the other
+    - ``auto``: Try a reflink, then an in-kernel ``os.copy_file_range``,
+      then a regular copy
+
+    Any strategy that isn't supported by the platform or filesystem falls
+    back transparently to the next option.
+
+    Copies are written to a temporary file next to ``dst`` and renamed over
+    it, so an existing ``dst`` is replaced rather than truncated in place.
+    This matters when ``dst`` is a hard link to ``src`` (e.g. from an earlier
+    ``hardlink`` copy): writing through it would empty the source too.
+
+    Args:
+        src: Source file
+        dst: Destination file (overwritten if it exists)
+        strategy: One of ``COPY_STRATEGIES``
+
+    Returns:
+        Name of the strategy that was actually used ("copy", "reflink",
+        "hardlink" or "copy_file_range").
+
+    Raises:
+        ValueError: If strategy is unknown
+        OSError: If the file cannot be copied at all
+    """
+    if strategy not in COPY_STRATEGIES:
+        raise ValueError(
+            f"Unknown copy strategy '{strategy}'. "
+            f"Valid strategies: {', '.join(COPY_STRATEGIES)}"
+        )
+
+    if strategy == "hardlink" and _try_hardlink(src, dst):
+        return "hardlink"
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=dst.parent, prefix=f".{dst.name}.", suffix=".claudefig-copy"
+    )
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        used = _copy_to_new_file(src, tmp_path, strategy)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return used
+
+
+def _copy_to_new_file(src: Path, dst: Path, strategy: str) -> str:
+    """Copy src into dst, a file that no other path refers to.
+
+    Returns:
+        Name of the strategy that was used.
+    """
+    if strategy in ("reflink", "auto") and _try_reflink(src, dst):
+        shutil.copystat(src, dst)
+        return "reflink"
+
+    if strategy == "auto" and _try_copy_file_range(src, dst):
+        shutil.copystat(src, dst)
+        return "copy_file_range"
+
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+def _try_hardlink(src: Path, dst: Path) -> bool:
+    """Replace dst with a hard link to src.
+
+    Links to a temporary name first, so an existing dst is replaced
+    atomically.
+
+    Returns:
+        True if the link was created, False if hard links aren't possible.
+    """
+    tmp_path = dst.with_name(f".{dst.name}.claudefig-link")
+    try:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        os.link(src, tmp_path)
+        os.replace(tmp_path, dst)
+        return True
+    except OSError:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        return False
+
+
+def _try_reflink(src: Path, dst: Path) -> bool:
+    """Clone src into dst with the FICLONE ioctl.
+
+    Returns:
+        True if the clone succeeded, False if reflinks aren't supported.
+
+    Raises:
+        OSError: If dst cannot be opened for writing
+    """
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError as e:
+            if e.errno in _UNSUPPORTED_ERRNOS:
+                return False
+            raise
+    return True
+
+
+def _try_copy_file_range(src: Path, dst: Path) -> bool:
+    """Copy src into dst with ``os.copy_file_range`` (kernel-side copy).
+
+    Returns:
+        True if the copy succeeded, False if copy_file_range isn't available.
+
+    Raises:
+        OSError: If dst cannot be opened or the copy fails midway
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return False
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            try:
+                copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            except OSError as e:
+                if e.errno in _UNSUPPORTED_ERRNOS:
+                    return False
+                raise
+            if copied == 0:
+                break
+            remaining -= copied
+    return True
+
+
+@contextlib.contextmanager
+def exclusive_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive inter-process lock on a lock file.
+
+    Blocks until no other process or thread holds the lock. The lock file is
+    created if needed and left in place, so it can be reused.
+
+    Args:
+        lock_path: Path of the lock file
+
+    Raises:
+        OSError: If the lock file cannot be opened or locked
+    """
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            # Lock the first byte; LK_LOCK retries for about 10 seconds
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -5,12 +5,16 @@ This module provides cross-platform utilities for:
 - Opening files in system editors
 - Opening folders in file explorers
 - Getting platform-specific paths and commands
+- Running external commands concurrently
 """
 
+import asyncio
 import contextlib
 import os
 import platform
+import signal
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -347,3 +351,106 @@ def run_platform_command(
         capture_output=True,
         timeout=timeout,
     )
+
+
+CommandOutcome = subprocess.CompletedProcess | Exception
+
+
+def run_commands_concurrently(
+    commands: list[list[str]],
+    max_concurrency: int = 4,
+    timeout: float | None = 30,
+    cwd: Path | None = None,
+) -> list[CommandOutcome]:
+    """Run external commands concurrently on a bounded asyncio subprocess pool.
+
+    At most ``max_concurrency`` commands run at once, each with its own
+    timeout. A command that times out is killed; the others keep running.
+
+    Args:
+        commands: Commands to run (argument lists, not shell strings)
+        max_concurrency: Maximum number of concurrently running commands
+        timeout: Per-command timeout in seconds (None for no timeout)
+        cwd: Working directory for the commands (default: the current one)
+
+    Returns:
+        One outcome per command, in the same order: a CompletedProcess with
+        decoded stdout/stderr, or the exception raised for that command
+        (``subprocess.TimeoutExpired``, ``FileNotFoundError`` if the
+        executable is missing, or another ``OSError``).
+
+    Example:
+        >>> outcomes = run_commands_concurrently([["echo", "a"], ["echo", "b"]])
+        >>> [o.stdout for o in outcomes]
+        ['a\\n', 'b\\n']
+    """
+    if not commands:
+        return []
+
+    async def run_all() -> list[CommandOutcome]:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_one(cmd: list[str]) -> CommandOutcome:
+            async with semaphore:
+                try:
+                    return await _run_command_async(cmd, timeout, cwd)
+                except (OSError, subprocess.TimeoutExpired) as e:
+                    return e
+
+        return list(await asyncio.gather(*(run_one(cmd) for cmd in commands)))
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_all())
+
+    # Called from inside a running event loop (e.g. the TUI) - use a fresh
+    # loop on a helper thread instead of nesting loops
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, run_all()).result()
+
+
+async def _run_command_async(
+    cmd: list[str], timeout: float | None, cwd: Path | None = None
+) -> subprocess.CompletedProcess:
+    """Run a single command as an asyncio subprocess.
+
+    Args:
+        cmd: Command to run
+        timeout: Timeout in seconds (None for no timeout)
+        cwd: Working directory for the command (default: the current one)
+
+    Returns:
+        CompletedProcess with decoded stdout and stderr.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds the timeout
+        OSError: If the command cannot be started
+    """
+    # On POSIX, start each command in its own session so a timeout can kill
+    # any children it spawned too (they would otherwise keep the pipes open)
+    posix = not is_windows()
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        start_new_session=posix,
+        cwd=cwd,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            if posix:
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        await process.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout or 0) from None
+
+    return subprocess.CompletedProcess(
+        cmd,
+        process.returncode if process.returncode is not None else -1,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
@@ -0,0 +1,250 @@
+"""Compiled template rendering for claudefig.
+
+Templates use ``{variable}`` placeholders, with ``{{`` and ``}}`` as escapes
+for literal braces. A template is tokenized once into literal and variable
+segments, so rendering is a single join instead of one full-text replace
+per variable. Compiled templates of files are cached per path and
+invalidated when the file's mtime or size changes. Large template files are
+rendered in chunks straight to disk instead of being held in memory.
+"""
+
+import os
+import re
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from claudefig.utils.cache import LRUCache
+
+# Number of compiled template files kept in memory
+COMPILED_TEMPLATE_CACHE_SIZE = 256
+
+# Template files at least this large are rendered by streaming them to disk
+STREAMING_RENDER_THRESHOLD = 1024 * 1024
+
+# Characters read per chunk when streaming a template
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# "{{" and "}}" pair up left to right, like a left-to-right replace would.
+# A placeholder's closing brace followed by another "}" belongs to a "}}"
+# escape instead, so "{name}}" is not a placeholder.
+_TOKEN_PATTERN = re.compile(r"\{\{|\}\}|\{([^{}]*)\}(?!\})")
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template tokenized into literal and variable segments.
+
+    Each segment is a ``(text, is_variable)`` pair. Adjacent literals are
+    merged, and escapes are already resolved in literal text.
+    """
+
+    segments: tuple[tuple[str, bool], ...]
+
+    @property
+    def variables(self) -> set[str]:
+        """Names of all placeholders in the template."""
+        return {text for text, is_variable in self.segments if is_variable}
+
+    def render(self, variables: Mapping[str, Any]) -> str:
+        """Render the template.
+
+        Placeholders without a value are kept as written (``{name}``).
+
+        Args:
+            variables: Values to substitute, converted with ``str()``.
+
+        Returns:
+            Rendered text.
+        """
+        return "".join(
+            (str(variables[text]) if text in variables else f"{{{text}}}")
+            if is_variable
+            else text
+            for text, is_variable in self.segments
+        )
+
+
+def compile_template(content: str) -> CompiledTemplate:
+    """Tokenize template content into a compiled template.
+
+    Args:
+        content: Template text.
+
+    Returns:
+        Compiled template.
+
+    Example:
+        >>> compile_template("{{literal}} {name}!").render({"name": "World"})
+        '{literal} World!'
+    """
+    segments: list[tuple[str, bool]] = []
+    literal: list[str] = []
+    position = 0
+
+    for match in _TOKEN_PATTERN.finditer(content):
+        literal.append(content[position : match.start()])
+        token = match.group(0)
+        if token == "{{":
+            literal.append("{")
+        elif token == "}}":
+            literal.append("}")
+        else:
+            if any(literal):
+                segments.append(("".join(literal), False))
+            literal = []
+            segments.append((match.group(1), True))
+        position = match.end()
+
+    literal.append(content[position:])
+    if any(literal):
+        segments.append(("".join(literal), False))
+
+    return CompiledTemplate(tuple(segments))
+
+
+_compiled_cache: LRUCache[tuple[int, int, CompiledTemplate]] = LRUCache(
+    maxsize=COMPILED_TEMPLATE_CACHE_SIZE
+)
+_compile_lock = threading.Lock()
+
+
+def get_compiled_template(
+    path: Path, load_content: Callable[[], str] | None = None
+) -> CompiledTemplate:
+    """Get the compiled template for a file, compiling it only when changed.
+
+    Args:
+        path: Template file path (the cache key).
+        load_content: Reads the template content on a cache miss. Defaults
+            to reading ``path`` as UTF-8.
+
+    Returns:
+        Compiled template.
+
+    Raises:
+        OSError: If the file cannot be read (or whatever load_content raises).
+    """
+    key = str(path.resolve())
+    try:
+        stat = path.stat()
+    except OSError:
+        # Let the loader report a missing or unreadable file its own way
+        content = load_content() if load_content else path.read_text(encoding="utf-8")
+        return compile_template(content)
+
+    cached = _get_cached(key, stat)
+    if cached is not None:
+        return cached
+
+    # Threads rendering the same template wait for a single compilation
+    with _compile_lock:
+        cached = _get_cached(key, stat)
+        if cached is not None:
+            return cached
+
+        content = load_content() if load_content else path.read_text(encoding="utf-8")
+        template = compile_template(content)
+        _compiled_cache.set(key, (stat.st_mtime_ns, stat.st_size, template))
+        return template
+
+
+def _get_cached(key: str, stat: os.stat_result) -> CompiledTemplate | None:
+    """Return the cached template for key if it matches the file's stat."""
+    cached = _compiled_cache.get(key)
+    if cached is None:
+        return None
+    mtime_ns, size, template = cached
+    if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+        return template
+    return None
+
+
+def clear_compiled_cache() -> None:
+    """Drop all cached compiled templates."""
+    _compiled_cache.clear()
+
+
+def render_template_file(
+    source: Path,
+    destination: Path,
+    variables: Mapping[str, Any] | None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> None:
+    """Render a template file to a destination without loading it whole.
+
+    The template is read in chunks; each chunk is rendered up to the last
+    point where no placeholder or escape can continue into the next chunk,
+    and the rest is carried over. Output goes to a temporary file next to
+    the destination, which is renamed into place once complete, so the
+    destination is never left half-written.
+
+    Args:
+        source: Template file to render.
+        destination: File to write.
+        variables: Values to substitute, or None to copy the template
+            verbatim (escapes included).
+        chunk_size: Characters read per chunk.
+
+    Raises:
+        OSError: If the template cannot be read or the destination written.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=destination.parent, prefix=f".{destination.name}.", suffix=".tmp"
+    )
+    try:
+        with (
+            open(source, encoding="utf-8") as src,
+            os.fdopen(fd, "w", encoding="utf-8") as dst,
+        ):
+            if variables is None:
+                while chunk := src.read(chunk_size):
+                    dst.write(chunk)
+            else:
+                carry = ""
+                while chunk := src.read(chunk_size):
+                    buffer = carry + chunk
+                    cut = _find_chunk_boundary(buffer)
+                    dst.write(compile_template(buffer[:cut]).render(variables))
+                    carry = buffer[cut:]
+                dst.write(compile_template(carry).render(variables))
+        os.replace(tmp_name, destination)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _find_chunk_boundary(buffer: str) -> int:
+    """Find where a chunk can be rendered without knowing what follows.
+
+    Tokens never contain braces except at their ends, so only the last
+    brace in the buffer can belong to a token that continues into the next
+    chunk: an unmatched ``{`` may start a placeholder or ``{{``, a trailing
+    unmatched ``}`` may start ``}}``, and a placeholder ending the buffer
+    may still be followed by ``}`` (which makes it literal text).
+
+    Args:
+        buffer: Carried-over text followed by the latest chunk.
+
+    Returns:
+        Index up to which the buffer tokenizes the same as the full stream.
+    """
+    last_brace = max(buffer.rfind("{"), buffer.rfind("}"))
+    if last_brace == -1:
+        return len(buffer)
+    if buffer[last_brace] == "}" and last_brace < len(buffer) - 1:
+        return len(buffer)
+
+    # Escapes pair up from the left, so tokenize the whole buffer; only the
+    # last token can contain the last brace
+    tokens = deque(_TOKEN_PATTERN.finditer(buffer), maxlen=1)
+    last_token = tokens[0] if tokens else None
+    if last_token is None or last_token.end() <= last_brace:
+        return last_brace  # Unmatched brace
+    if last_token.group(1) is not None:
+        return last_token.start()  # Placeholder pending the next character
+    return len(buffer)  # Completed "{{" or "}}" escape
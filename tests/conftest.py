@@ -7,6 +7,12 @@ from pathlib import Path
 import pytest
 from pytest_factoryboy import register
 
+from claudefig import registry
+from claudefig.component_loaders import clear_component_cache
+from claudefig.repositories import preset_index
+from claudefig.repositories.config_repository import clear_config_cache
+from claudefig.services import mcp_registration_service, search_service
+
 # Import and register factories for automatic fixture creation
 from tests.factories import FileInstanceFactory, PresetDefinitionFactory, PresetFactory
 
@@ -17,6 +23,75 @@ register(PresetFactory)
 register(PresetDefinitionFactory)
 
 
+@pytest.fixture(autouse=True)
+def clear_component_resolution_cache():
+    """Clear the process-wide component resolution cache around each test.
+
+    Tests create and mock component directories freely, so resolutions
+    memoized by one test must not leak into the next.
+    """
+    clear_component_cache()
+    yield
+    clear_component_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolate_mcp_registration_cache(tmp_path_factory, monkeypatch):
+    """Keep the MCP registration cache out of the real home directory.
+
+    Each test gets its own empty cache, so registrations recorded by one
+    test never cause another to skip a server.
+    """
+    cache_path = tmp_path_factory.mktemp("cache") / "mcp-registrations.json"
+    monkeypatch.setattr(
+        mcp_registration_service, "get_registration_cache_path", lambda: cache_path
+    )
+    return cache_path
+
+
+@pytest.fixture(autouse=True)
+def isolate_preset_index(tmp_path_factory, monkeypatch):
+    """Keep the persistent preset index out of the real home directory.
+
+    Each test starts without an index, so presets indexed by one test are
+    never served to another.
+    """
+    index_path = tmp_path_factory.mktemp("cache") / "preset-index.json"
+    monkeypatch.setattr(preset_index, "get_preset_index_path", lambda: index_path)
+    return index_path
+
+
+@pytest.fixture(autouse=True)
+def isolate_search_index(tmp_path_factory, monkeypatch):
+    """Keep the search index cache out of the real home directory.
+
+    Each test starts without a cached index, so entries collected by one
+    test are never served to another.
+    """
+    index_path = tmp_path_factory.mktemp("cache") / "search-index.json"
+    monkeypatch.setattr(search_service, "get_search_index_path", lambda: index_path)
+    return index_path
+
+
+@pytest.fixture(autouse=True)
+def isolate_registry():
+    """Give each test its own scope of shared repositories and managers.
+
+    Shared instances keep their caches, so presets loaded or modified by one
+    test must not be handed to the next.
+    """
+    with registry.scope():
+        yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_config_cache():
+    """Start each test with an empty config load cache."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
 @pytest.fixture
 def temp_component_dir(tmp_path: Path) -> Path:
     """Create temporary component directory with test components.
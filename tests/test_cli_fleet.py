@@ -0,0 +1,97 @@
+"""Tests for fleet CLI commands."""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from claudefig.cli import main
+from claudefig.models import FleetRepoResult
+
+
+@pytest.fixture
+def cli_runner():
+    """Create a CLI runner for testing."""
+    return CliRunner()
+
+
+@pytest.fixture
+def repos_file(tmp_path):
+    """Create a repos file listing two repositories."""
+    path = tmp_path / "repos.txt"
+    path.write_text("# fleet\nrepo-a\nrepo-b\n", encoding="utf-8")
+    return path
+
+
+class TestFleetSync:
+    """Tests for 'claudefig fleet sync' command."""
+
+    @patch("claudefig.services.fleet_service.run_fleet")
+    def test_sync_prints_summary(self, mock_run_fleet, cli_runner, repos_file):
+        """Test that results are summarized per repository."""
+        repo_a = (repos_file.parent / "repo-a").resolve()
+        repo_b = (repos_file.parent / "repo-b").resolve()
+        mock_run_fleet.return_value = [
+            FleetRepoResult(repo_a, True, files_written=3, duration=0.5),
+            FleetRepoResult(repo_b, True, files_unchanged=2, duration=0.1),
+        ]
+
+        result = cli_runner.invoke(
+            main, ["fleet", "sync", "--repos-file", str(repos_file), "-j", "4"]
+        )
+
+        assert result.exit_code == 0
+        assert "Fleet Summary" in result.output
+        assert "2/2 repositories succeeded, 3 file(s) written" in result.output
+        args, kwargs = mock_run_fleet.call_args
+        assert args[0] == [repo_a, repo_b]
+        assert kwargs["mode"] == "sync"
+        assert kwargs["jobs"] == 4
+
+    @patch("claudefig.services.fleet_service.run_fleet")
+    def test_sync_fails_if_any_repository_failed(
+        self, mock_run_fleet, cli_runner, repos_file
+    ):
+        """Test that a failed repository makes the command fail."""
+        mock_run_fleet.return_value = [
+            FleetRepoResult(repos_file.parent / "repo-a", True),
+            FleetRepoResult(repos_file.parent / "repo-b", False, error="boom"),
+        ]
+
+        result = cli_runner.invoke(
+            main, ["fleet", "sync", "--repos-file", str(repos_file)]
+        )
+
+        assert result.exit_code != 0
+        assert "1/2 repositories succeeded" in result.output
+
+    def test_sync_empty_repos_file(self, cli_runner, tmp_path):
+        """Test that an empty repos file is reported without running."""
+        repos_file = tmp_path / "repos.txt"
+        repos_file.write_text("# nothing yet\n", encoding="utf-8")
+
+        result = cli_runner.invoke(
+            main, ["fleet", "sync", "--repos-file", str(repos_file)]
+        )
+
+        assert result.exit_code == 0
+        assert "No repositories listed" in result.output
+
+
+class TestFleetInit:
+    """Tests for 'claudefig fleet init' command."""
+
+    @patch("claudefig.services.fleet_service.run_fleet")
+    def test_init_passes_mode_and_flags(self, mock_run_fleet, cli_runner, repos_file):
+        """Test that init runs the fleet in init mode with the given flags."""
+        mock_run_fleet.return_value = []
+
+        cli_runner.invoke(
+            main,
+            ["fleet", "init", "--repos-file", str(repos_file), "--force", "--staged"],
+        )
+
+        kwargs = mock_run_fleet.call_args.kwargs
+        assert kwargs["mode"] == "init"
+        assert kwargs["force"] is True
+        assert kwargs["staged"] is True
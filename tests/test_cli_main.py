@@ -304,3 +304,76 @@ class TestMainGroup:
                 assert (
                     "Warning" in result.output or "cannot use" in result.output.lower()
                 )
+
+
+class TestSync:
+    """Tests for 'claudefig sync' command."""
+
+    def test_sync_without_config_aborts(self, cli_runner, tmp_path):
+        """Test that sync requires an existing claudefig.toml."""
+        result = cli_runner.invoke(main, ["sync", "--path", str(tmp_path)])
+
+        assert result.exit_code != 0
+
+    def test_sync_dry_run_writes_nothing(self, cli_runner, tmp_path):
+        """Test that --dry-run shows the plan without writing files."""
+        (tmp_path / "claudefig.toml").write_text(
+            """[claudefig]
+schema_version = "2.0"
+
+[[files]]
+id = "gitignore-default"
+type = "gitignore"
+preset = "gitignore:default"
+path = ".gitignore"
+enabled = true
+""",
+            encoding="utf-8",
+        )
+
+        result = cli_runner.invoke(main, ["sync", "--path", str(tmp_path), "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "append" in result.output
+        assert "Dry run" in result.output
+        assert not (tmp_path / ".gitignore").exists()
+
+
+class TestSearch:
+    """Tests for 'claudefig search' command."""
+
+    def test_search_finds_presets(self, cli_runner):
+        """Test that presets are found by type and name."""
+        with patch(
+            "claudefig.services.search_service.get_component_roots", return_value=[]
+        ):
+            result = cli_runner.invoke(main, ["search", "gitignore", "python"])
+
+        assert result.exit_code == 0
+        assert "gitignore:python" in result.output
+
+    def test_search_filters_by_kind(self, cli_runner, tmp_path):
+        """Test that --kind restricts results to components."""
+        (tmp_path / "gitignore" / "python-extra").mkdir(parents=True)
+
+        with patch(
+            "claudefig.services.search_service.get_component_roots",
+            return_value=[("global", tmp_path)],
+        ):
+            result = cli_runner.invoke(
+                main, ["search", "python", "--kind", "component"]
+            )
+
+        assert result.exit_code == 0
+        assert "gitignore:python-extra" in result.output
+        assert "Python-specific" not in result.output
+
+    def test_search_without_matches(self, cli_runner):
+        """Test the message shown when nothing matches."""
+        with patch(
+            "claudefig.services.search_service.get_component_roots", return_value=[]
+        ):
+            result = cli_runner.invoke(main, ["search", "zzzqqq"])
+
+        assert result.exit_code == 0
+        assert "No matching" in result.output
@@ -1,16 +1,27 @@
 """Tests for component loading using Chain of Responsibility pattern."""
 
+import os
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 from claudefig.component_loaders import (
     ComponentLoader,
+    ComponentResolutionCache,
     GlobalComponentLoader,
     PresetComponentLoader,
+    clear_component_cache,
+    component_cache,
     create_component_loader_chain,
 )
 
 
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate a directory's mtime outside the racy window."""
+    old = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(old, old))
+
+
 class TestComponentLoaderBase:
     """Tests for base ComponentLoader class."""
 
@@ -187,3 +198,97 @@ class TestComponentLoaderChain:
         result = chain.load("default", "claude_md", "test")
 
         assert result is None
+
+
+class TestComponentResolutionCache:
+    """Tests for memoized component resolution."""
+
+    def test_get_or_resolve_caches_hits_and_misses(self):
+        """Test that the resolver only runs once per key, even for misses."""
+        cache = ComponentResolutionCache()
+        resolver = Mock(return_value=None)
+
+        assert cache.get_or_resolve("missing", resolver) is None
+        assert cache.get_or_resolve("missing", resolver) is None
+
+        resolver.assert_called_once()
+        assert len(cache) == 1
+
+    def test_chain_is_shared_per_process(self):
+        """Test that the default chain is only built once."""
+        assert create_component_loader_chain() is create_component_loader_chain()
+
+    @patch("claudefig.user_config.get_components_dir")
+    def test_chain_resolution_costs_one_check_per_key(
+        self, mock_get_components_dir, tmp_path
+    ):
+        """Test that repeated lookups don't touch the filesystem again."""
+        mock_get_components_dir.return_value = tmp_path
+        (tmp_path / "claude_md" / "shared").mkdir(parents=True)
+        chain = create_component_loader_chain()
+
+        with patch.object(Path, "exists", autospec=True, return_value=True) as exists:
+            first = chain.load("missing-preset", "claude_md", "shared")
+            calls = exists.call_count
+            for _ in range(50):
+                assert chain.load("missing-preset", "claude_md", "shared") == first
+
+        assert exists.call_count == calls
+
+    @patch("claudefig.user_config.get_components_dir")
+    def test_clear_component_cache_picks_up_new_components(
+        self, mock_get_components_dir, tmp_path
+    ):
+        """Test that a cached miss is forgotten after invalidation."""
+        mock_get_components_dir.return_value = tmp_path
+        _age(tmp_path)
+        chain = create_component_loader_chain()
+
+        assert chain.load("missing-preset", "claude_md", "new") is None
+        clear_component_cache()
+        (tmp_path / "claude_md" / "new").mkdir(parents=True)
+
+        assert chain.load("missing-preset", "claude_md", "new") == (
+            tmp_path / "claude_md" / "new"
+        )
+        assert len(component_cache) > 0
+
+    def test_watched_miss_is_cached_while_directory_unchanged(self, tmp_path):
+        """Test that a watched miss costs one stat, not a resolve, per lookup."""
+        cache = ComponentResolutionCache()
+        _age(tmp_path)
+        resolver = Mock(return_value=None)
+        watch = tmp_path / "claude_md" / "new"
+
+        assert cache.get_or_resolve("key", resolver, watch=watch) is None
+        assert cache.get_or_resolve("key", resolver, watch=watch) is None
+
+        resolver.assert_called_once()
+
+    @patch("claudefig.user_config.get_components_dir")
+    def test_component_added_by_hand_is_found_without_invalidation(
+        self, mock_get_components_dir, tmp_path
+    ):
+        """Test that a global component created after a miss is found."""
+        mock_get_components_dir.return_value = tmp_path
+        _age(tmp_path)
+        chain = create_component_loader_chain()
+
+        assert chain.load("missing-preset", "claude_md", "new") is None
+        (tmp_path / "claude_md" / "new").mkdir(parents=True)
+
+        assert chain.load("missing-preset", "claude_md", "new") == (
+            tmp_path / "claude_md" / "new"
+        )
+
+    def test_recently_modified_directory_miss_not_cached(self, tmp_path):
+        """Test that misses under a just-modified directory are re-resolved."""
+        cache = ComponentResolutionCache()
+        resolver = Mock(return_value=None)
+        watch = tmp_path / "claude_md" / "new"
+
+        cache.get_or_resolve("key", resolver, watch=watch)
+        cache.get_or_resolve("key", resolver, watch=watch)
+
+        assert resolver.call_count == 2
+        assert len(cache) == 0
@@ -1,7 +1,10 @@
 """Tests for config repository implementations."""
 
+import os
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import tomli_w
@@ -9,6 +12,7 @@ import tomli_w
 from claudefig.exceptions import (
     ConfigFileNotFoundError,
 )
+from claudefig.repositories import config_repository
 from claudefig.repositories.config_repository import (
     FakeConfigRepository,
     TomlConfigRepository,
@@ -217,6 +221,154 @@ class TestTomlConfigRepository:
                 repo.delete()
 
 
+class TestConfigLoadCache:
+    """Test the parsed-document cache behind TomlConfigRepository.load()."""
+
+    @staticmethod
+    def _write(path: Path, data: dict, age_seconds: int = 60) -> None:
+        """Write a config and backdate it outside the racy window."""
+        with open(path, "wb") as f:
+            tomli_w.dump(data, f)
+        old = time.time_ns() - age_seconds * 1_000_000_000
+        os.utime(path, ns=(old, old))
+
+    def test_second_load_does_not_reparse(self, tmp_path):
+        """Test an unchanged file is served from the cache."""
+        config_path = tmp_path / "config.toml"
+        self._write(config_path, {"claudefig": {"version": "2.0"}})
+        repo = TomlConfigRepository(config_path)
+        repo.load()
+
+        with patch.object(
+            config_repository.tomllib, "loads", side_effect=AssertionError
+        ):
+            assert repo.load() == {"claudefig": {"version": "2.0"}}
+
+    def test_cache_shared_between_repositories(self, tmp_path):
+        """Test repositories for the same path share the parsed document."""
+        config_path = tmp_path / "config.toml"
+        self._write(config_path, {"key": "value"})
+        TomlConfigRepository(config_path).load()
+
+        with patch.object(
+            config_repository.tomllib, "loads", side_effect=AssertionError
+        ):
+            assert TomlConfigRepository(config_path).load() == {"key": "value"}
+
+    def test_mutating_result_does_not_affect_cache(self, tmp_path):
+        """Test each load returns an independent copy."""
+        config_path = tmp_path / "config.toml"
+        self._write(config_path, {"files": [{"id": "a", "enabled": True}]})
+        repo = TomlConfigRepository(config_path)
+
+        first = repo.load()
+        first["files"][0]["enabled"] = False
+        first["files"].append({"id": "b"})
+        first["extra"] = {}
+
+        assert repo.load() == {"files": [{"id": "a", "enabled": True}]}
+
+    def test_external_change_is_reloaded(self, tmp_path):
+        """Test a file changed behind the repository's back is re-parsed."""
+        config_path = tmp_path / "config.toml"
+        self._write(config_path, {"key": "old"}, age_seconds=120)
+        repo = TomlConfigRepository(config_path)
+        assert repo.load() == {"key": "old"}
+
+        # Same size, different mtime
+        self._write(config_path, {"key": "new"}, age_seconds=60)
+        assert repo.load() == {"key": "new"}
+
+    def test_recently_modified_file_is_revalidated(self, tmp_path):
+        """Test files inside the racy window are checked by content hash."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('key = "old"\n')
+        repo = TomlConfigRepository(config_path)
+        assert repo.load() == {"key": "old"}
+
+        # Same size and mtime, as a coarse timestamp would report
+        stat = config_path.stat()
+        config_path.write_text('key = "new"\n')
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert repo.load() == {"key": "new"}
+
+    def test_recently_modified_unchanged_file_is_not_reparsed(self, tmp_path):
+        """Test a racy entry whose content still matches is reused."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text('key = "value"\n')
+        repo = TomlConfigRepository(config_path)
+        repo.load()
+
+        with patch.object(
+            config_repository.tomllib, "loads", side_effect=AssertionError
+        ):
+            assert repo.load() == {"key": "value"}
+
+    def test_save_seeds_cache(self, tmp_path):
+        """Test loading a just-saved config does not parse the file."""
+        config_path = tmp_path / "config.toml"
+        self._write(config_path, {"key": "value1"})
+        repo = TomlConfigRepository(config_path)
+        repo.load()
+
+        repo.save({"key": "value2", "files": ("a", "b")})
+
+        with patch.object(
+            config_repository.tomllib, "loads", side_effect=AssertionError
+        ):
+            assert repo.load() == {"key": "value2", "files": ["a", "b"]}
+
+    def test_save_seeded_entry_sees_external_rewrite(self, tmp_path):
+        """Test a same-stamp rewrite after a save is still picked up."""
+        config_path = tmp_path / "config.toml"
+        repo = TomlConfigRepository(config_path)
+        repo.save({"key": "old"})
+
+        stat = config_path.stat()
+        config_path.write_text('key = "new"\n')
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert repo.load() == {"key": "new"}
+
+    def test_spellings_of_same_file_share_entry(self, tmp_path, monkeypatch):
+        """Test that relative, symlinked and absolute paths share one entry."""
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        (tmp_path / "link").symlink_to(real_dir, target_is_directory=True)
+        config_path = real_dir / "config.toml"
+        self._write(config_path, {"key": "value1"})
+        monkeypatch.chdir(real_dir)
+
+        absolute = TomlConfigRepository(config_path)
+        linked = TomlConfigRepository(config_path)
+        linked.config_path = tmp_path / "link" / "config.toml"
+        relative = TomlConfigRepository(config_path)
+        relative.config_path = Path("config.toml")
+        for repo in (absolute, linked, relative):
+            repo.load()
+
+        assert len(config_repository._config_cache) == 1
+
+        linked.save({"key": "value2"})
+
+        assert len(config_repository._config_cache) == 1
+        assert relative.load() == {"key": "value2"}
+
+    def test_delete_invalidates_cache(self, tmp_path):
+        """Test deleting drops the cached document."""
+        config_path = tmp_path / "config.toml"
+        self._write(config_path, {"key": "value"})
+        repo = TomlConfigRepository(config_path)
+        repo.load()
+
+        repo.delete()
+
+        assert str(repo.config_path) not in config_repository._config_cache
+        with pytest.raises(ConfigFileNotFoundError):
+            repo.load()
+
+
 class TestFakeConfigRepository:
     """Test FakeConfigRepository in-memory implementation."""
 
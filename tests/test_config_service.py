@@ -573,6 +573,23 @@ class TestValidateConfigSchema:
         assert not result.has_errors
 
 
+class TestValidateConfigKey:
+    """Tests for validate_config_key function."""
+
+    def test_valid_copy_strategy(self):
+        """Test that a supported copy strategy is accepted."""
+        result = config_service.validate_config_key("init.copy_strategy", "reflink")
+
+        assert result.valid
+
+    def test_invalid_copy_strategy(self):
+        """Test that an unknown copy strategy is rejected."""
+        result = config_service.validate_config_key("init.copy_strategy", "rsync")
+
+        assert not result.valid
+        assert "Valid values" in result.errors[0]
+
+
 class TestConfigSingleton:
     """Test get_config_singleton() and reload_config_singleton()."""
 
@@ -57,6 +57,27 @@ class TestConfigTemplateManagerInit:
         assert len(preset_dirs) == 0
 
 
+class TestCopyFile:
+    """Tests for copying component files into presets."""
+
+    def test_copy_over_hardlinked_file_keeps_source(self, tmp_path):
+        """Test that re-copying onto a hard link doesn't empty the source."""
+        source = tmp_path / "component.md"
+        source.write_text("# Built-in component", encoding="utf-8")
+        dest = tmp_path / "preset" / "component.md"
+        dest.parent.mkdir()
+
+        ConfigTemplateManager(
+            global_presets_dir=tmp_path / "global", copy_strategy="hardlink"
+        )._copy_file(source, dest)
+        ConfigTemplateManager(
+            global_presets_dir=tmp_path / "global", copy_strategy="auto"
+        )._copy_file(source, dest)
+
+        assert source.read_text(encoding="utf-8") == "# Built-in component"
+        assert dest.read_text(encoding="utf-8") == "# Built-in component"
+
+
 class TestListGlobalPresets:
     """Tests for list_global_presets method."""
 
@@ -0,0 +1,143 @@
+"""Tests for the fleet service."""
+
+from unittest.mock import patch
+
+import pytest
+
+from claudefig.exceptions import FileReadError
+from claudefig.models import FleetRepoResult
+from claudefig.services import fleet_service
+
+GITIGNORE_CONFIG = """[claudefig]
+schema_version = "2.0"
+
+[[files]]
+id = "gitignore-default"
+type = "gitignore"
+preset = "gitignore:default"
+path = ".gitignore"
+"""
+
+
+def _make_repo(path, configured=True):
+    """Create a repository directory, optionally with a gitignore config."""
+    path.mkdir(parents=True)
+    (path / ".git").mkdir()
+    if configured:
+        (path / "claudefig.toml").write_text(GITIGNORE_CONFIG, encoding="utf-8")
+    return path
+
+
+class TestReadReposFile:
+    """Tests for read_repos_file."""
+
+    def test_skips_comments_and_blank_lines(self, tmp_path):
+        """Test that only repository lines are returned, in order."""
+        repos_file = tmp_path / "repos.txt"
+        repos_file.write_text(
+            f"# fleet\n\n{tmp_path / 'b'}\n  {tmp_path / 'a'}  \n", encoding="utf-8"
+        )
+
+        assert fleet_service.read_repos_file(repos_file) == [
+            (tmp_path / "b").resolve(),
+            (tmp_path / "a").resolve(),
+        ]
+
+    def test_relative_paths_and_duplicates(self, tmp_path):
+        """Test that relative paths resolve against the file and dedupe."""
+        repos_file = tmp_path / "lists" / "repos.txt"
+        repos_file.parent.mkdir()
+        repos_file.write_text("../repo\n../repo/\n", encoding="utf-8")
+
+        assert fleet_service.read_repos_file(repos_file) == [
+            (tmp_path / "repo").resolve()
+        ]
+
+    def test_missing_file(self, tmp_path):
+        """Test that an unreadable repos file raises FileReadError."""
+        with pytest.raises(FileReadError):
+            fleet_service.read_repos_file(tmp_path / "missing.txt")
+
+
+class TestProcessRepo:
+    """Tests for process_repo."""
+
+    def test_missing_repository(self, tmp_path):
+        """Test that a missing directory is reported, not raised."""
+        result = fleet_service.process_repo(tmp_path / "missing")
+
+        assert result.success is False
+        assert "not found" in result.error
+
+    def test_sync_requires_config(self, tmp_path):
+        """Test that sync fails for repositories without claudefig.toml."""
+        repo = _make_repo(tmp_path / "repo", configured=False)
+
+        result = fleet_service.process_repo(repo, mode="sync")
+
+        assert result.success is False
+        assert "claudefig.toml" in result.error
+        assert not (repo / ".gitignore").exists()
+
+    def test_generates_sequentially_by_default(self, tmp_path):
+        """Test that workers don't start a CPU-sized thread pool each."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "claudefig.toml").write_text("", encoding="utf-8")
+
+        with patch(
+            "claudefig.initializer.Initializer.initialize", return_value=True
+        ) as initialize:
+            fleet_service.process_repo(repo, mode="sync")
+
+        assert initialize.call_args.kwargs["jobs"] == 1
+
+    def test_jobs_per_worker_splits_cpu_budget(self):
+        """Test that worker threads times workers stays within the CPU count."""
+        with patch("claudefig.services.fleet_service.os.cpu_count", return_value=8):
+            assert fleet_service._jobs_per_worker(8) == 1
+            assert fleet_service._jobs_per_worker(2) == 4
+            assert fleet_service._jobs_per_worker(16) == 1
+
+    def test_sync_counts_written_and_unchanged_files(self, tmp_path):
+        """Test that results report written files, then up-to-date files."""
+        repo = _make_repo(tmp_path / "repo")
+
+        first = fleet_service.process_repo(repo, mode="sync")
+        second = fleet_service.process_repo(repo, mode="sync")
+
+        assert first.success is True
+        assert (first.files_written, first.files_unchanged) == (1, 0)
+        assert (second.files_written, second.files_unchanged) == (0, 1)
+        assert (repo / ".gitignore").exists()
+
+
+class TestRunFleet:
+    """Tests for run_fleet."""
+
+    def test_results_keep_repository_order(self, tmp_path):
+        """Test that a process pool syncs every repository in order."""
+        repos = [
+            _make_repo(tmp_path / "one"),
+            tmp_path / "missing",
+            _make_repo(tmp_path / "two"),
+        ]
+        reported: list[FleetRepoResult] = []
+
+        results = fleet_service.run_fleet(
+            repos, mode="sync", jobs=2, on_result=reported.append
+        )
+
+        assert [result.repo_path for result in results] == repos
+        assert [result.success for result in results] == [True, False, True]
+        assert len(reported) == 3
+        assert (tmp_path / "two" / ".gitignore").exists()
+
+    def test_empty_repository_list(self):
+        """Test that no repositories produce no results."""
+        assert fleet_service.run_fleet([]) == []
+
+    def test_invalid_mode(self, tmp_path):
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Invalid fleet mode"):
+            fleet_service.run_fleet([tmp_path], mode="deploy")
@@ -0,0 +1,96 @@
+"""Tests for the gitignore merge service."""
+
+from claudefig.services import gitignore_service
+from claudefig.services.gitignore_service import BLOCK_END, BLOCK_START
+
+TEMPLATE = "# claudefig files\n.claude/\nCLAUDE.md\nclaudefig.toml"
+
+
+class TestMergeEntries:
+    """Tests for merge_entries."""
+
+    def test_new_file(self):
+        """Test that a new file contains just the managed block."""
+        content = gitignore_service.merge_entries(None, TEMPLATE)
+
+        assert content == (
+            f"{BLOCK_START}\n# claudefig files\n.claude/\nCLAUDE.md\n"
+            f"claudefig.toml\n{BLOCK_END}\n"
+        )
+
+    def test_appends_only_missing_patterns(self):
+        """Test that patterns already ignored are not repeated in the block."""
+        existing = "node_modules/\nCLAUDE.md\n"
+
+        content = gitignore_service.merge_entries(existing, TEMPLATE)
+
+        assert content.startswith(existing + "\n" + BLOCK_START)
+        assert content.count("CLAUDE.md") == 1
+        assert ".claude/\nclaudefig.toml\n" + BLOCK_END in content
+
+    def test_remerge_is_unchanged(self):
+        """Test that merging the same entries again changes nothing."""
+        merged = gitignore_service.merge_entries("dist/\n", TEMPLATE)
+
+        assert gitignore_service.merge_entries(merged, TEMPLATE) is merged
+
+    def test_updates_block_in_place(self):
+        """Test that changed entries replace the block without moving it."""
+        merged = gitignore_service.merge_entries("dist/\n", TEMPLATE)
+        merged += "build/\n"
+
+        content = gitignore_service.merge_entries(merged, ".claude/\n.env")
+
+        assert content.count(BLOCK_START) == 1
+        assert "claudefig.toml" not in content
+        assert content.endswith(f".claude/\n.env\n{BLOCK_END}\nbuild/\n")
+        assert content.startswith("dist/\n")
+
+    def test_drops_block_when_everything_is_ignored(self):
+        """Test that the block is removed once its patterns exist elsewhere."""
+        merged = gitignore_service.merge_entries("dist/\n", ".env")
+        merged = ".env\n" + merged
+
+        assert gitignore_service.merge_entries(merged, ".env") == ".env\ndist/\n"
+
+    def test_legacy_entries_without_block(self):
+        """Test that files with unmarked claudefig entries are left alone."""
+        existing = f"dist/\n\n{TEMPLATE}\n"
+
+        assert gitignore_service.merge_entries(existing, TEMPLATE) == existing
+
+    def test_deduplicates_template_patterns(self):
+        """Test that duplicate patterns in the template appear once."""
+        content = gitignore_service.merge_entries(None, ".env\n.env\n")
+
+        assert content == f"{BLOCK_START}\n.env\n{BLOCK_END}\n"
+
+    def test_preserves_crlf_line_endings(self):
+        """Test that CRLF files keep their line endings."""
+        content = gitignore_service.merge_entries("dist/\r\n", ".env")
+
+        assert content == f"dist/\r\n\r\n{BLOCK_START}\r\n.env\r\n{BLOCK_END}\r\n"
+
+    def test_large_file(self):
+        """Test merging into a file with many existing patterns."""
+        existing = "".join(f"generated/file-{i}.txt\n" for i in range(20000))
+
+        content = gitignore_service.merge_entries(
+            existing, "generated/file-19999.txt\n.env"
+        )
+
+        assert content == f"{existing}\n{BLOCK_START}\n.env\n{BLOCK_END}\n"
+
+
+class TestFindManagedBlock:
+    """Tests for find_managed_block."""
+
+    def test_no_block(self):
+        """Test that files without markers have no block."""
+        assert gitignore_service.find_managed_block(["dist/"]) is None
+
+    def test_unterminated_block_extends_to_end(self):
+        """Test that a missing end marker extends the block to the end."""
+        lines = ["dist/", BLOCK_START, ".env"]
+
+        assert gitignore_service.find_managed_block(lines) == (1, 3)
@@ -1,5 +1,8 @@
 """Tests for the Initializer class."""
 
+import os
+import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -7,6 +10,8 @@ import pytest
 
 from claudefig.config import Config
 from claudefig.initializer import Initializer
+from claudefig.models import FileInstance, FileType, OperationType
+from claudefig.utils.hashing import hash_text
 
 
 @pytest.fixture
@@ -342,7 +347,31 @@ class TestCopyTemplateFile:
 class TestSetupMcpServers:
     """Tests for Initializer.setup_mcp_servers method."""
 
-    @patch("subprocess.run")
+    @pytest.fixture
+    def mock_subprocess(self):
+        """Patch the concurrent runner, passing each command through a mock.
+
+        The working directory of the last batch is recorded as ``cwd``.
+        """
+        command_mock = Mock()
+        command_mock.cwd = None
+
+        def run_commands(commands, max_concurrency=4, timeout=None, cwd=None):
+            command_mock.cwd = cwd
+            outcomes = []
+            for cmd in commands:
+                try:
+                    outcomes.append(command_mock(cmd))
+                except Exception as e:
+                    outcomes.append(e)
+            return outcomes
+
+        with patch(
+            "claudefig.initializer.run_commands_concurrently",
+            side_effect=run_commands,
+        ):
+            yield command_mock
+
     def test_setup_mcp_servers_claude_not_installed(self, mock_subprocess, tmp_path):
         """Test MCP setup when claude CLI is not installed."""
         initializer = Initializer()
@@ -362,7 +391,6 @@ class TestSetupMcpServers:
         assert result is False
         mock_subprocess.assert_called_once()
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_invalid_json(self, mock_subprocess, tmp_path):
         """Test MCP setup with invalid JSON in config file."""
         initializer = Initializer()
@@ -380,7 +408,6 @@ class TestSetupMcpServers:
         # subprocess should not be called due to JSON validation failure
         mock_subprocess.assert_not_called()
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_timeout(
         self, mock_subprocess, tmp_path
     ):  # Removed mock_config
@@ -406,7 +433,6 @@ class TestSetupMcpServers:
         assert result is False
         mock_subprocess.assert_called_once()
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_command_fails(self, mock_subprocess, tmp_path):
         """Test MCP setup when claude command returns non-zero exit code."""
         initializer = Initializer()
@@ -429,7 +455,6 @@ class TestSetupMcpServers:
         assert result is False
         mock_subprocess.assert_called_once()
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_success(
         self, mock_subprocess, tmp_path
     ):  # Removed mock_config
@@ -467,6 +492,18 @@ class TestSetupMcpServers:
         assert "server1" in server_names
         assert "server2" in server_names
 
+    def test_setup_mcp_servers_runs_in_repo(self, mock_subprocess, tmp_path):
+        """Test that 'claude mcp add-json' runs in the repository, not the cwd."""
+        initializer = Initializer()
+        mcp_dir = tmp_path / ".claude" / "mcp"
+        mcp_dir.mkdir(parents=True)
+        (mcp_dir / "server.json").write_text('{"command": "s"}', encoding="utf-8")
+        mock_subprocess.return_value = Mock(returncode=0, stderr="")
+
+        assert initializer.setup_mcp_servers(tmp_path) is True
+
+        assert mock_subprocess.cwd == tmp_path
+
     def test_setup_mcp_servers_no_directory(self, tmp_path):  # Removed mock_config
         """Test MCP setup when .claude/mcp directory doesn't exist."""
         initializer = Initializer()
@@ -489,7 +526,6 @@ class TestSetupMcpServers:
         # Should return False with informative message
         assert result is False
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_partial_success(self, mock_subprocess, tmp_path):
         """Test MCP setup when some servers succeed and some fail."""
         initializer = Initializer()
@@ -521,7 +557,6 @@ class TestSetupMcpServers:
         assert result is True
         assert mock_subprocess.call_count == 2
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_with_mcp_json(self, mock_subprocess, tmp_path):
         """Test MCP setup with standard .mcp.json file."""
         initializer = Initializer()
@@ -546,7 +581,6 @@ class TestSetupMcpServers:
         call_args = mock_subprocess.call_args[0][0]
         assert call_args[3] == ".mcp"  # Server name from .mcp.json
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_both_patterns(self, mock_subprocess, tmp_path):
         """Test MCP setup with both .mcp.json and .claude/mcp/*.json files."""
         initializer = Initializer()
@@ -573,7 +607,6 @@ class TestSetupMcpServers:
         assert result is True
         assert mock_subprocess.call_count == 2
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_http_transport_valid(self, mock_subprocess, tmp_path):
         """Test MCP setup with valid HTTP transport configuration."""
         initializer = Initializer()
@@ -599,7 +632,6 @@ class TestSetupMcpServers:
         assert result is True
         mock_subprocess.assert_called_once()
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_http_transport_missing_url(
         self, mock_subprocess, tmp_path
     ):
@@ -619,7 +651,6 @@ class TestSetupMcpServers:
         # Subprocess should not be called
         mock_subprocess.assert_not_called()
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_stdio_transport_missing_command(
         self, mock_subprocess, tmp_path
     ):
@@ -639,7 +670,6 @@ class TestSetupMcpServers:
         # Subprocess should not be called
         mock_subprocess.assert_not_called()
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_invalid_transport_type(self, mock_subprocess, tmp_path):
         """Test MCP setup fails with invalid transport type."""
         initializer = Initializer()
@@ -659,7 +689,6 @@ class TestSetupMcpServers:
         # Subprocess should not be called
         mock_subprocess.assert_not_called()
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_sse_transport_deprecation_warning(
         self, mock_subprocess, tmp_path, capsys
     ):
@@ -688,7 +717,6 @@ class TestSetupMcpServers:
         mock_subprocess.assert_called_once()
         # Note: Console output testing would require capturing rich console output
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_http_non_https_warning(
         self, mock_subprocess, tmp_path, capsys
     ):
@@ -716,7 +744,6 @@ class TestSetupMcpServers:
         assert result is True
         mock_subprocess.assert_called_once()
 
-    @patch("subprocess.run")
     def test_setup_mcp_servers_hardcoded_credentials_warning(
         self, mock_subprocess, tmp_path, capsys
     ):
@@ -744,6 +771,145 @@ class TestSetupMcpServers:
         assert result is True
         mock_subprocess.assert_called_once()
 
+    def _write_server(self, repo_path, name, config):
+        mcp_dir = repo_path / ".claude" / "mcp"
+        mcp_dir.mkdir(parents=True, exist_ok=True)
+        (mcp_dir / f"{name}.json").write_text(config, encoding="utf-8")
+
+    def test_setup_mcp_servers_skips_cached_registration(
+        self, mock_subprocess, tmp_path
+    ):
+        """Test that an unchanged, registered server is not re-registered."""
+        self._write_server(tmp_path, "github", '{"command": "npx"}')
+        mock_subprocess.return_value = Mock(returncode=0, stderr="")
+
+        assert Initializer().setup_mcp_servers(tmp_path) is True
+        assert Initializer().setup_mcp_servers(tmp_path) is True
+
+        mock_subprocess.assert_called_once()
+
+    def test_setup_mcp_servers_reregisters_changed_config(
+        self, mock_subprocess, tmp_path
+    ):
+        """Test that editing a server config triggers a new registration."""
+        self._write_server(tmp_path, "github", '{"command": "npx"}')
+        mock_subprocess.return_value = Mock(returncode=0, stderr="")
+        Initializer().setup_mcp_servers(tmp_path)
+
+        # Reformatting alone does not count as a change
+        self._write_server(tmp_path, "github", '{ "command" : "npx" }')
+        Initializer().setup_mcp_servers(tmp_path)
+        assert mock_subprocess.call_count == 1
+
+        self._write_server(tmp_path, "github", '{"command": "uvx"}')
+        Initializer().setup_mcp_servers(tmp_path)
+        assert mock_subprocess.call_count == 2
+
+    def test_setup_mcp_servers_refresh_ignores_cache(self, mock_subprocess, tmp_path):
+        """Test that refresh re-registers servers even if cached."""
+        self._write_server(tmp_path, "github", '{"command": "npx"}')
+        mock_subprocess.return_value = Mock(returncode=0, stderr="")
+
+        Initializer().setup_mcp_servers(tmp_path)
+        Initializer().setup_mcp_servers(tmp_path, refresh=True)
+
+        assert mock_subprocess.call_count == 2
+
+    def test_setup_mcp_servers_failed_registration_not_cached(
+        self, mock_subprocess, tmp_path
+    ):
+        """Test that a failed registration is retried on the next run."""
+        self._write_server(tmp_path, "github", '{"command": "npx"}')
+        mock_subprocess.return_value = Mock(returncode=1, stderr="failed")
+        assert Initializer().setup_mcp_servers(tmp_path) is False
+
+        mock_subprocess.return_value = Mock(returncode=0, stderr="")
+        assert Initializer().setup_mcp_servers(tmp_path) is True
+
+        assert mock_subprocess.call_count == 2
+
+
+@pytest.fixture
+def stub_claude(tmp_path, monkeypatch):
+    """Put a stub 'claude' executable first on PATH.
+
+    The stub sleeps for a second, then fails for servers named 'bad*' and
+    hangs for servers named 'slow*'. Every invocation is logged.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log_file = tmp_path / "claude-calls.log"
+    script = bin_dir / "claude"
+    script.write_text(
+        "#!/bin/sh\n"
+        f'echo "$3" >> "{log_file}"\n'
+        'case "$3" in\n'
+        '  bad*) echo "invalid server" >&2; exit 1 ;;\n'
+        "  slow*) sleep 30 ;;\n"
+        "esac\n"
+        "sleep 1\n",
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    return log_file
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="stub uses a POSIX shell script")
+class TestSetupMcpServersConcurrency:
+    """Tests for concurrent MCP registration against a stub 'claude' CLI."""
+
+    def _write_servers(self, repo_path, names):
+        mcp_dir = repo_path / ".claude" / "mcp"
+        mcp_dir.mkdir(parents=True)
+        for name in names:
+            (mcp_dir / f"{name}.json").write_text(
+                f'{{"command": "{name}"}}', encoding="utf-8"
+            )
+
+    def test_registrations_run_concurrently(self, tmp_path, stub_claude):
+        """Test that servers are registered in parallel, not one after another."""
+        repo = tmp_path / "repo"
+        self._write_servers(repo, ["alpha", "beta", "gamma", "delta"])
+
+        start = time.monotonic()
+        result = Initializer().setup_mcp_servers(repo, jobs=4)
+        elapsed = time.monotonic() - start
+
+        assert result is True
+        assert sorted(stub_claude.read_text().split()) == [
+            "alpha",
+            "beta",
+            "delta",
+            "gamma",
+        ]
+        # Four one-second registrations run sequentially would take 4s
+        assert elapsed < 3
+
+    def test_aggregates_failures_and_timeouts(self, tmp_path, stub_claude):
+        """Test that failing and hanging servers are reported per server."""
+        repo = tmp_path / "repo"
+        self._write_servers(repo, ["good", "bad-server", "slow-server"])
+
+        with patch("claudefig.initializer.console") as mock_console:
+            result = Initializer().setup_mcp_servers(repo, timeout=2)
+
+        output = "\n".join(str(c.args[0]) for c in mock_console.print.call_args_list)
+        assert result is True
+        assert "Added MCP server: good" in output
+        assert "Failed to add bad-server: invalid server" in output
+        assert "Timeout adding slow-server" in output
+        assert "Added 1 MCP server(s)" in output
+        assert "1 failed, 1 timed out" in output
+
+    def test_claude_not_on_path(self, tmp_path, monkeypatch):
+        """Test that a missing 'claude' executable aborts the setup."""
+        repo = tmp_path / "repo"
+        self._write_servers(repo, ["alpha"])
+        monkeypatch.setenv("PATH", str(tmp_path / "empty-bin"))
+
+        assert Initializer().setup_mcp_servers(repo) is False
+
 
 class TestInitializeTemplateErrors:
     """Tests for template error handling during initialization."""
@@ -885,3 +1051,641 @@ class TestInitializeTemplateErrors:
         captured = capsys.readouterr()
         # Should mention template not found (actual message may vary)
         assert "Template" in captured.out or "template" in captured.out
+
+
+@pytest.fixture
+def many_instances_config(tmp_path):
+    """Create a config file with many CLAUDE.md instances at distinct paths."""
+    entries = []
+    for i in range(12):
+        entries.append(
+            f"""[[files]]
+id = "claude-md-{i:02d}"
+type = "claude_md"
+preset = "claude_md:default"
+path = "docs/{i:02d}/CLAUDE.md"
+enabled = true
+"""
+        )
+    config_file = tmp_path / "claudefig.toml"
+    config_file.write_text(
+        '[claudefig]\nschema_version = "2.0"\n\n' + "\n".join(entries),
+        encoding="utf-8",
+    )
+    return config_file
+
+
+class TestParallelGeneration:
+    """Tests for parallel instance generation in Initializer.initialize."""
+
+    @patch("claudefig.initializer.is_git_repository", return_value=True)
+    def test_parallel_generation_creates_all_files(
+        self, mock_is_git, many_instances_config, tmp_path
+    ):
+        """Test that every instance is generated when using multiple jobs."""
+        initializer = Initializer(config_path=many_instances_config)
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.return_value = "# Generated"
+        initializer.preset_repo = mock_preset_repo
+
+        result = initializer.initialize(tmp_path, jobs=4)
+
+        assert result is True
+        for i in range(12):
+            generated = tmp_path / "docs" / f"{i:02d}" / "CLAUDE.md"
+            assert generated.read_text(encoding="utf-8") == "# Generated"
+
+    @patch("claudefig.initializer.is_git_repository", return_value=True)
+    def test_parallel_generation_reports_in_instance_order(
+        self, mock_is_git, many_instances_config, tmp_path, capsys
+    ):
+        """Test that console output follows instance sort order."""
+        initializer = Initializer(config_path=many_instances_config)
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.return_value = "# Generated"
+        initializer.preset_repo = mock_preset_repo
+
+        initializer.initialize(tmp_path, jobs=8)
+
+        output = capsys.readouterr().out.replace("\n", "")
+        positions = [output.find(f"{i:02d}/CLAUDE.md") for i in range(12)]
+        assert all(position >= 0 for position in positions)
+        assert positions == sorted(positions)
+
+    def test_parallel_generation_tracks_files_in_order(
+        self, many_instances_config, tmp_path
+    ):
+        """Test that rollback tracking is replayed in instance order."""
+        initializer = Initializer(config_path=many_instances_config)
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.return_value = "# Generated"
+        initializer.preset_repo = mock_preset_repo
+
+        instances = [
+            FileInstance.from_dict(data) for data in initializer.config_data["files"]
+        ]
+        plan = initializer._build_plan(instances, tmp_path, force=False, jobs=4)
+        results = initializer.apply_plan(plan, jobs=4)
+
+        assert results == [True] * 12
+        assert initializer._created_files == [
+            tmp_path / instance.path for instance in instances
+        ]
+
+    def test_single_job_matches_parallel_results(self, many_instances_config, tmp_path):
+        """Test that jobs=1 generates the same files sequentially."""
+        initializer = Initializer(config_path=many_instances_config)
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.return_value = "# Generated"
+        initializer.preset_repo = mock_preset_repo
+
+        instances = [
+            FileInstance.from_dict(data) for data in initializer.config_data["files"]
+        ]
+        plan = initializer._build_plan(instances, tmp_path, force=False, jobs=1)
+        results = initializer.apply_plan(plan, jobs=1)
+
+        assert results == [True] * 12
+        assert len(initializer._created_files) == 12
+
+
+class TestGenerationPlan:
+    """Tests for the plan/apply split in Initializer."""
+
+    def test_plan_does_not_touch_disk(self, many_instances_config, tmp_path):
+        """Test that planning describes writes without performing them."""
+        initializer = Initializer(config_path=many_instances_config)
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.return_value = "# Generated"
+        initializer.preset_repo = mock_preset_repo
+
+        plan = initializer.plan(tmp_path)
+
+        assert len(plan.instances) == 12
+        assert not plan.errors
+        assert all(op.type == OperationType.WRITE for op in plan.operations)
+        assert all(
+            op.content_hash == hash_text("# Generated") for op in plan.operations
+        )
+        assert not (tmp_path / "docs").exists()
+
+    def test_plan_skips_existing_files_without_force(
+        self, many_instances_config, tmp_path
+    ):
+        """Test that existing destinations are skipped unless force is set."""
+        initializer = Initializer(config_path=many_instances_config)
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.return_value = "# Generated"
+        initializer.preset_repo = mock_preset_repo
+        existing = tmp_path / "docs" / "00" / "CLAUDE.md"
+        existing.parent.mkdir(parents=True)
+        existing.write_text("keep", encoding="utf-8")
+
+        plan = initializer.plan(tmp_path)
+        forced_plan = initializer.plan(tmp_path, force=True)
+
+        assert plan.instances[0].skipped == (existing,)
+        assert plan.instances[0].operations == ()
+        assert forced_plan.instances[0].operations[0].destination == existing
+
+    def test_plan_records_errors(self, many_instances_config, tmp_path):
+        """Test that planning failures are recorded instead of raised."""
+        from claudefig.exceptions import TemplateNotFoundError
+
+        initializer = Initializer(config_path=many_instances_config)
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.side_effect = TemplateNotFoundError(
+            "claude_md:default"
+        )
+        initializer.preset_repo = mock_preset_repo
+
+        plan = initializer.plan(tmp_path, jobs=1)
+
+        assert len(plan.errors) == 12
+        assert "Template file not found" in plan.errors[0].error
+
+    @pytest.mark.parametrize("force", [False, True])
+    def test_plan_rejects_conflicting_single_file_destinations(self, tmp_path, force):
+        """Test that two single-file instances on one path conflict up front."""
+        initializer = Initializer(config_path=tmp_path / "claudefig.toml")
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.return_value = "# Generated"
+        initializer.preset_repo = mock_preset_repo
+        instances = [
+            FileInstance(
+                id=f"claude-md-{i}",
+                type=FileType.CLAUDE_MD,
+                preset="claude_md:default",
+                path=path,
+            )
+            for i, path in enumerate(["CLAUDE.md", "./CLAUDE.md"])
+        ]
+
+        plan = initializer._build_plan(instances, tmp_path, force=force, jobs=1)
+
+        assert not plan.instances[0].has_error
+        assert plan.instances[1].operations == ()
+        assert "Conflicting destination" in plan.instances[1].error
+        assert "claude-md-0" in plan.instances[1].error
+
+    def test_plan_is_immutable(self, many_instances_config, tmp_path):
+        """Test that generation plans cannot be modified after planning."""
+        from dataclasses import FrozenInstanceError
+
+        initializer = Initializer(config_path=many_instances_config)
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.return_value = "# Generated"
+        initializer.preset_repo = mock_preset_repo
+
+        plan = initializer.plan(tmp_path, jobs=1)
+
+        with pytest.raises(FrozenInstanceError):
+            plan.force = True  # type: ignore[misc]
+
+
+@pytest.fixture
+def manifest_config(tmp_path):
+    """Create a config with an append-mode and a directory file instance."""
+    config_file = tmp_path / "claudefig.toml"
+    config_file.write_text(
+        """[claudefig]
+schema_version = "2.0"
+
+[[files]]
+id = "gitignore-default"
+type = "gitignore"
+preset = "gitignore:default"
+path = ".gitignore"
+
+[[files]]
+id = "mcp-stdio"
+type = "mcp"
+preset = "mcp:stdio-local"
+path = ".claude/mcp-docs"
+""",
+        encoding="utf-8",
+    )
+    return config_file
+
+
+class TestGenerationManifest:
+    """Tests for manifest-based incremental sync."""
+
+    def test_initialize_writes_manifest(self, manifest_config, git_repo):
+        """Test that initialization records generated instances."""
+        from claudefig.services import manifest_service
+
+        initializer = Initializer(config_path=manifest_config)
+        assert initializer.initialize(git_repo, force=True, skip_prompts=True)
+
+        manifest = manifest_service.load_manifest(git_repo)
+        assert set(manifest["instances"]) == {"gitignore-default", "mcp-stdio"}
+        entry = manifest["instances"]["mcp-stdio"]
+        assert list(entry["outputs"]) == [".claude/mcp-docs/README.md"]
+        assert len(entry["sources"]) == 1
+
+    def test_sync_skips_unchanged_instances(self, manifest_config, git_repo):
+        """Test that a second run neither reads templates nor rewrites files."""
+        Initializer(config_path=manifest_config).initialize(
+            git_repo, force=True, skip_prompts=True
+        )
+        readme = git_repo / ".claude" / "mcp-docs" / "README.md"
+        mtime_ns = readme.stat().st_mtime_ns
+
+        initializer = Initializer(config_path=manifest_config)
+        with patch.object(
+            initializer.preset_repo,
+            "get_template_content",
+            wraps=initializer.preset_repo.get_template_content,
+        ) as spy:
+            plan = initializer.plan(git_repo, force=True)
+            result = initializer.initialize(git_repo, force=True, skip_prompts=True)
+
+        assert result is True
+        assert len(plan.unchanged) == 2
+        assert plan.operations == []
+        spy.assert_not_called()
+        assert readme.stat().st_mtime_ns == mtime_ns
+
+    def test_sync_rewrites_drifted_output(self, manifest_config, git_repo):
+        """Test that an edited output is regenerated on the next forced run."""
+        Initializer(config_path=manifest_config).initialize(
+            git_repo, force=True, skip_prompts=True
+        )
+        readme = git_repo / ".claude" / "mcp-docs" / "README.md"
+        original = readme.read_text(encoding="utf-8")
+        readme.write_text("edited", encoding="utf-8")
+
+        initializer = Initializer(config_path=manifest_config)
+        plan = initializer.plan(git_repo, force=True)
+        initializer.initialize(git_repo, force=True, skip_prompts=True)
+
+        assert [p.instance_id for p in plan.unchanged] == ["gitignore-default"]
+        assert readme.read_text(encoding="utf-8") == original
+
+
+class TestGitignoreMerge:
+    """Tests for merging gitignore entries into a managed block."""
+
+    def test_resync_updates_block_in_place(self, manifest_config, git_repo):
+        """Test that re-syncing keeps a single block and user entries."""
+        from claudefig.services.gitignore_service import BLOCK_START
+
+        gitignore = git_repo / ".gitignore"
+        gitignore.write_text("node_modules/\nCLAUDE.md\n", encoding="utf-8")
+
+        Initializer(config_path=manifest_config).initialize(git_repo, skip_prompts=True)
+        with open(gitignore, "a", encoding="utf-8") as f:
+            f.write("dist/\n")
+        Initializer(config_path=manifest_config).initialize(git_repo, skip_prompts=True)
+
+        content = gitignore.read_text(encoding="utf-8")
+        assert content.count(BLOCK_START) == 1
+        assert content.count("CLAUDE.md") == 1
+        assert content.startswith("node_modules/\nCLAUDE.md\n")
+        assert content.endswith("dist/\n")
+
+
+class TestAppendCoalescing:
+    """Tests for coalescing appends to a shared destination."""
+
+    def _gitignore_instances(self, count):
+        return [
+            FileInstance(
+                id=f"gitignore-{i}",
+                type=FileType.GITIGNORE,
+                preset="gitignore:default",
+                path=".gitignore",
+            )
+            for i in range(count)
+        ]
+
+    def _initializer(self, tmp_path, contents):
+        initializer = Initializer(config_path=tmp_path / "claudefig.toml")
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_content.side_effect = contents
+        mock_preset_repo.get_template_path.return_value = None
+        initializer.preset_repo = mock_preset_repo
+        return initializer
+
+    def test_plan_merges_appends_into_first_instance(self, tmp_path):
+        """Test that shared appends become a single operation."""
+        initializer = self._initializer(tmp_path, [".env", "dist/"])
+
+        plan = initializer._build_plan(
+            self._gitignore_instances(2), tmp_path, force=False, jobs=1
+        )
+
+        assert [op.content for op in plan.operations] == [".env\ndist/"]
+        assert plan.instances[1].coalesced_into == "gitignore-0"
+        assert not plan.errors
+
+    def test_apply_reads_and_writes_destination_once(self, tmp_path):
+        """Test that coalesced appends touch the file a single time."""
+        from claudefig.services import gitignore_service
+
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules/\n", encoding="utf-8")
+        initializer = self._initializer(tmp_path, [".env", "dist/", ".env"])
+        plan = initializer._build_plan(
+            self._gitignore_instances(3), tmp_path, force=False, jobs=1
+        )
+
+        with patch.object(
+            gitignore_service,
+            "merge_entries",
+            wraps=gitignore_service.merge_entries,
+        ) as mock_merge:
+            results = initializer.apply_plan(plan, jobs=1)
+
+        assert results == [True, True, True]
+        mock_merge.assert_called_once()
+        content = gitignore.read_text(encoding="utf-8")
+        assert content.count(".env") == 1
+        assert "dist/" in content
+
+    def test_coalesced_instances_share_lead_failure(self, tmp_path):
+        """Test that a failed merged write fails every coalesced instance."""
+        initializer = self._initializer(tmp_path, [".env", "dist/"])
+        plan = initializer._build_plan(
+            self._gitignore_instances(2), tmp_path, force=False, jobs=1
+        )
+
+        with patch.object(
+            initializer, "_append_entries", side_effect=OSError("disk full")
+        ):
+            results = initializer.apply_plan(plan, jobs=1)
+
+        assert results == [False, False]
+
+
+class TestTemplateVariables:
+    """Tests for rendering preset and instance variables during generation."""
+
+    def _initializer(self, tmp_path, template, preset_variables):
+        from tests.factories import PresetFactory
+
+        template_file = tmp_path / "template.md"
+        template_file.write_text(template, encoding="utf-8")
+        initializer = Initializer(config_path=tmp_path / "claudefig.toml")
+        initializer.preset_manager = MagicMock()
+        initializer.preset_manager.get_preset.return_value = PresetFactory(
+            id="claude_md:default", variables=preset_variables
+        )
+        mock_preset_repo = MagicMock()
+        mock_preset_repo.get_template_path.return_value = template_file
+        # No inheritance table: variables are resolved by walking ``extends``
+        mock_preset_repo.get_resolved_variables.return_value = None
+        mock_preset_repo.get_template_content.side_effect = lambda preset: (
+            template_file.read_text(encoding="utf-8")
+        )
+        initializer.preset_repo = mock_preset_repo
+        return initializer
+
+    def _instances(self, variables_list):
+        return [
+            FileInstance(
+                id=f"claude-md-{i}",
+                type=FileType.CLAUDE_MD,
+                preset="claude_md:default",
+                path=f"docs/{i}/CLAUDE.md",
+                variables=variables,
+            )
+            for i, variables in enumerate(variables_list)
+        ]
+
+    def test_instance_variables_override_preset_defaults(self, tmp_path):
+        """Test that instance variables are layered over preset defaults."""
+        initializer = self._initializer(
+            tmp_path, "# {name} ({language})", {"name": "Default", "language": "Go"}
+        )
+        instances = self._instances([{"name": "API", "component_name": "default"}, {}])
+
+        plan = initializer._build_plan(instances, tmp_path, force=False, jobs=1)
+
+        assert [op.content for op in plan.operations] == [
+            "# API (Go)",
+            "# Default (Go)",
+        ]
+
+    def test_template_is_compiled_once_per_file(self, tmp_path):
+        """Test that instances sharing a template only load it once."""
+        initializer = self._initializer(tmp_path, "# {name}", {})
+        instances = self._instances([{"name": f"service-{i}"} for i in range(20)])
+
+        plan = initializer._build_plan(instances, tmp_path, force=False, jobs=4)
+
+        assert [op.content for op in plan.operations] == [
+            f"# service-{i}" for i in range(20)
+        ]
+        initializer.preset_repo.get_template_content.assert_called_once()
+
+    def test_template_without_variables_is_written_verbatim(self, tmp_path):
+        """Test that literal braces survive when there is nothing to render."""
+        template = '{{"hooks": {}}}'
+        initializer = self._initializer(tmp_path, template, {})
+        instances = self._instances([{"component_name": "default"}])
+
+        plan = initializer._build_plan(instances, tmp_path, force=False, jobs=1)
+
+        assert plan.operations[0].content == template
+
+    def test_inherited_preset_variables_are_used(self, tmp_path):
+        """Test that variables inherited through extends are rendered."""
+        from tests.factories import PresetFactory
+
+        initializer = self._initializer(tmp_path, "# {name} ({language})", {})
+        parent = PresetFactory(
+            id="claude_md:base", variables={"name": "Base", "language": "Go"}
+        )
+        initializer.preset_manager.get_preset.return_value = PresetFactory(
+            id="claude_md:default",
+            extends="claude_md:base",
+            variables={"name": "Child"},
+        )
+        initializer.preset_repo.get_preset.return_value = parent
+        instances = self._instances([{}])
+
+        plan = initializer._build_plan(instances, tmp_path, force=False, jobs=1)
+
+        assert plan.operations[0].content == "# Child (Go)"
+
+    def test_changed_preset_variables_invalidate_manifest(self, tmp_path):
+        """Test that editing a preset's variables regenerates its outputs."""
+        from claudefig.services import manifest_service
+        from tests.factories import PresetFactory
+
+        initializer = self._initializer(tmp_path, "Hello {name}", {"name": "Alice"})
+        instances = self._instances([{}])
+        manifest = manifest_service.new_manifest()
+
+        plan = initializer._build_plan(instances, tmp_path, force=True, jobs=1)
+        initializer.instances_dict = {i.id: i for i in instances}
+        initializer._save_manifest(manifest, plan, initializer.apply_plan(plan))
+
+        unchanged = initializer._build_plan(
+            instances, tmp_path, force=True, jobs=1, manifest=manifest
+        )
+        assert unchanged.instances[0].unchanged
+
+        initializer.preset_manager.get_preset.return_value = PresetFactory(
+            id="claude_md:default", variables={"name": "Bob"}
+        )
+        plan = initializer._build_plan(
+            instances, tmp_path, force=True, jobs=1, manifest=manifest
+        )
+
+        assert not plan.instances[0].unchanged
+        assert plan.operations[0].content == "Hello Bob"
+
+    def test_large_templates_are_streamed(self, tmp_path, monkeypatch):
+        """Test that templates above the threshold are rendered while applying."""
+        import claudefig.initializer as initializer_module
+
+        monkeypatch.setattr(initializer_module, "STREAMING_RENDER_THRESHOLD", 1)
+        initializer = self._initializer(
+            tmp_path, "# {name} {{x}}\n" * 100, {"name": "Default"}
+        )
+        instances = self._instances([{"name": "API"}])
+
+        plan = initializer._build_plan(instances, tmp_path, force=False, jobs=1)
+        results = initializer.apply_plan(plan, jobs=1)
+
+        assert [op.type for op in plan.operations] == [OperationType.RENDER]
+        assert results == [True]
+        initializer.preset_repo.get_template_content.assert_not_called()
+        output = tmp_path / "docs" / "0" / "CLAUDE.md"
+        assert output.read_text(encoding="utf-8") == "# API {x}\n" * 100
+
+
+class TestStagedInitialization:
+    """Tests for staged, all-or-nothing initialization."""
+
+    def test_staged_initialize_commits_all_files(self, manifest_config, git_repo):
+        """Test that staged files end up in place and staging is removed."""
+        from claudefig.initializer import STAGING_DIR_PREFIX
+
+        initializer = Initializer(config_path=manifest_config)
+        result = initializer.initialize(git_repo, skip_prompts=True, staged=True)
+
+        assert result is True
+        assert (git_repo / ".gitignore").exists()
+        assert (git_repo / ".claude" / "mcp-docs" / "README.md").exists()
+        assert not list(git_repo.glob(f"{STAGING_DIR_PREFIX}*"))
+        assert not list((git_repo / ".claude").glob(f"{STAGING_DIR_PREFIX}*"))
+
+    def test_staged_initialize_preserves_existing_gitignore(
+        self, manifest_config, git_repo
+    ):
+        """Test that appends read the real file and commit the merged result."""
+        gitignore = git_repo / ".gitignore"
+        gitignore.write_text("node_modules/\n", encoding="utf-8")
+
+        initializer = Initializer(config_path=manifest_config)
+        initializer.initialize(git_repo, skip_prompts=True, staged=True)
+
+        content = gitignore.read_text(encoding="utf-8")
+        assert content.startswith("node_modules/\n")
+        assert "claudefig.toml" in content
+
+    def test_staged_failure_leaves_repository_untouched(
+        self, manifest_config, git_repo
+    ):
+        """Test that a failing instance discards every staged file."""
+        from claudefig.exceptions import InitializationRollbackError
+        from claudefig.initializer import STAGING_DIR_PREFIX
+
+        initializer = Initializer(config_path=manifest_config)
+        with (
+            patch("claudefig.initializer.copy_file", side_effect=OSError("disk full")),
+            pytest.raises(InitializationRollbackError),
+        ):
+            initializer.initialize(git_repo, force=True, skip_prompts=True, staged=True)
+
+        assert not (git_repo / ".gitignore").exists()
+        assert not (git_repo / ".claude" / "mcp-docs").exists()
+        assert not list((git_repo / ".claude").glob(f"{STAGING_DIR_PREFIX}*"))
+        assert not list(git_repo.glob(f"{STAGING_DIR_PREFIX}*"))
+
+    def test_staging_dir_created_under_claude_dir(self, manifest_config, git_repo):
+        """Test that files are staged under .claude/, not the repository root."""
+        from claudefig.initializer import STAGING_DIR_PREFIX
+
+        seen: list[Path] = []
+        initializer = Initializer(config_path=manifest_config)
+        original = initializer._commit_staging_dir
+
+        def record(staging_dir, repo_path):
+            seen.append(staging_dir)
+            original(staging_dir, repo_path)
+
+        with patch.object(initializer, "_commit_staging_dir", side_effect=record):
+            initializer.initialize(git_repo, skip_prompts=True, staged=True)
+
+        assert len(seen) == 1
+        assert seen[0].parent == git_repo / ".claude"
+        assert seen[0].name.startswith(STAGING_DIR_PREFIX)
+
+    def test_stale_staging_dirs_removed(self, manifest_config, git_repo):
+        """Test that staging dirs left by a crashed run are cleaned up."""
+        from claudefig.initializer import STAGING_DIR_PREFIX
+
+        stale = git_repo / ".claude" / f"{STAGING_DIR_PREFIX}crashed"
+        (stale / "docs").mkdir(parents=True)
+        (stale / "docs" / "partial.md").write_text("x", encoding="utf-8")
+        legacy = git_repo / f"{STAGING_DIR_PREFIX}legacy"
+        legacy.mkdir()
+
+        initializer = Initializer(config_path=manifest_config)
+        initializer.initialize(git_repo, skip_prompts=True, staged=True)
+
+        assert not stale.exists()
+        assert not legacy.exists()
+        assert not (git_repo / "docs" / "partial.md").exists()
+
+    def test_staged_rejects_plan_errors(self, manifest_config, git_repo):
+        """Test that any planning error aborts staged mode before writing."""
+        from claudefig.exceptions import InitializationRollbackError
+
+        with open(manifest_config, "a", encoding="utf-8") as f:
+            f.write(
+                '\n[[files]]\nid = "broken"\ntype = "claude_md"\n'
+                'preset = "claude_md:missing"\npath = "CLAUDE.md"\n'
+            )
+
+        initializer = Initializer(config_path=manifest_config)
+        with pytest.raises(InitializationRollbackError):
+            initializer.initialize(git_repo, force=True, skip_prompts=True, staged=True)
+
+        assert not (git_repo / ".gitignore").exists()
+
+
+class TestCopyStrategy:
+    """Tests for the configurable component copy strategy."""
+
+    def test_copy_strategy_from_config(self, manifest_config, git_repo):
+        """Test that component files are copied with the configured strategy."""
+        content = manifest_config.read_text(encoding="utf-8")
+        manifest_config.write_text(
+            content + '\n[init]\ncopy_strategy = "hardlink"\n', encoding="utf-8"
+        )
+        initializer = Initializer(config_path=manifest_config)
+
+        with patch("claudefig.initializer.copy_file") as mock_copy:
+            initializer.initialize(git_repo, skip_prompts=True)
+
+        assert initializer.copy_strategy == "hardlink"
+        assert mock_copy.call_args.args[2] == "hardlink"
+
+    def test_invalid_copy_strategy_uses_default(self, manifest_config):
+        """Test that an unknown strategy falls back to the default."""
+        from claudefig.utils.paths import DEFAULT_COPY_STRATEGY
+
+        content = manifest_config.read_text(encoding="utf-8")
+        manifest_config.write_text(
+            content + '\n[init]\ncopy_strategy = "rsync"\n', encoding="utf-8"
+        )
+
+        initializer = Initializer(config_path=manifest_config)
+
+        assert initializer.copy_strategy == DEFAULT_COPY_STRATEGY
@@ -0,0 +1,190 @@
+"""Tests for the generation manifest service."""
+
+import os
+
+from claudefig.models import FileInstance, FileType
+from claudefig.services import manifest_service
+
+
+def _instance(**overrides) -> FileInstance:
+    """Create a CLAUDE.md file instance for manifest tests."""
+    data = {
+        "id": "claude_md-default",
+        "type": FileType.CLAUDE_MD,
+        "preset": "claude_md:default",
+        "path": "CLAUDE.md",
+    }
+    data.update(overrides)
+    return FileInstance(**data)
+
+
+def _record(tmp_path, instance=None):
+    """Generate a fake output and record it in a new manifest."""
+    source = tmp_path / "template.md"
+    source.write_text("# Template", encoding="utf-8")
+    output = tmp_path / "CLAUDE.md"
+    output.write_text("# Template", encoding="utf-8")
+
+    manifest = manifest_service.new_manifest()
+    manifest_service.record_instance(
+        manifest, instance or _instance(), {source: None}, {output: None}, tmp_path
+    )
+    return manifest, source, output
+
+
+class TestLoadSaveManifest:
+    """Tests for manifest persistence."""
+
+    def test_load_missing_manifest(self, tmp_path):
+        """Test that a missing manifest loads as empty."""
+        assert manifest_service.load_manifest(tmp_path) == {
+            "version": manifest_service.MANIFEST_VERSION,
+            "instances": {},
+        }
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Test that a saved manifest loads back unchanged."""
+        manifest, _, _ = _record(tmp_path)
+
+        manifest_service.save_manifest(tmp_path, manifest)
+
+        assert manifest_service.get_manifest_path(tmp_path).exists()
+        assert manifest_service.load_manifest(tmp_path) == manifest
+
+    def test_load_corrupt_manifest(self, tmp_path):
+        """Test that an unreadable manifest loads as empty."""
+        manifest_path = manifest_service.get_manifest_path(tmp_path)
+        manifest_path.parent.mkdir()
+        manifest_path.write_text("{not json", encoding="utf-8")
+
+        assert manifest_service.load_manifest(tmp_path)["instances"] == {}
+
+    def test_load_outdated_manifest(self, tmp_path):
+        """Test that a manifest from another version loads as empty."""
+        manifest_path = manifest_service.get_manifest_path(tmp_path)
+        manifest_path.parent.mkdir()
+        manifest_path.write_text('{"version": 0, "instances": {"x": {}}}')
+
+        assert manifest_service.load_manifest(tmp_path)["instances"] == {}
+
+
+class TestStampMatches:
+    """Tests for file stamp comparison."""
+
+    def test_unchanged_file_matches(self, tmp_path):
+        """Test that an untouched file matches its stamp."""
+        path = tmp_path / "file.txt"
+        path.write_text("content", encoding="utf-8")
+
+        assert manifest_service.stamp_matches(path, manifest_service.file_stamp(path))
+
+    def test_touched_file_with_same_content_matches(self, tmp_path):
+        """Test that a new mtime alone falls back to comparing hashes."""
+        path = tmp_path / "file.txt"
+        path.write_text("content", encoding="utf-8")
+        stamp = manifest_service.file_stamp(path)
+        os.utime(path, ns=(stamp["mtime_ns"] + 10**9, stamp["mtime_ns"] + 10**9))
+
+        assert manifest_service.stamp_matches(path, stamp)
+
+    def test_modified_file_does_not_match(self, tmp_path):
+        """Test that changed content is detected even with the same size."""
+        path = tmp_path / "file.txt"
+        path.write_text("content", encoding="utf-8")
+        stamp = manifest_service.file_stamp(path)
+        path.write_text("CONTENT", encoding="utf-8")
+        os.utime(path, ns=(stamp["mtime_ns"] + 10**9, stamp["mtime_ns"] + 10**9))
+
+        assert not manifest_service.stamp_matches(path, stamp)
+
+    def test_missing_file_does_not_match(self, tmp_path):
+        """Test that a deleted file never matches."""
+        path = tmp_path / "file.txt"
+        path.write_text("content", encoding="utf-8")
+        stamp = manifest_service.file_stamp(path)
+        path.unlink()
+
+        assert not manifest_service.stamp_matches(path, stamp)
+
+
+class TestIsInstanceCurrent:
+    """Tests for instance freshness checks."""
+
+    def test_current_instance(self, tmp_path):
+        """Test that an unchanged instance is current."""
+        manifest, source, _ = _record(tmp_path)
+        entry = manifest["instances"]["claude_md-default"]
+
+        assert manifest_service.is_instance_current(
+            entry, _instance(), [source], tmp_path
+        )
+
+    def test_missing_entry(self, tmp_path):
+        """Test that an instance without an entry is never current."""
+        assert not manifest_service.is_instance_current(
+            None, _instance(), [tmp_path / "template.md"], tmp_path
+        )
+
+    def test_changed_instance_config(self, tmp_path):
+        """Test that changing instance variables invalidates the entry."""
+        manifest, source, _ = _record(tmp_path)
+        entry = manifest["instances"]["claude_md-default"]
+
+        assert not manifest_service.is_instance_current(
+            entry, _instance(variables={"name": "x"}), [source], tmp_path
+        )
+
+    def test_changed_template_variables(self, tmp_path):
+        """Test that changing the merged preset variables invalidates the entry."""
+        source = tmp_path / "template.md"
+        source.write_text("Hello {name}", encoding="utf-8")
+        output = tmp_path / "CLAUDE.md"
+        output.write_text("Hello Alice", encoding="utf-8")
+        manifest = manifest_service.new_manifest()
+        manifest_service.record_instance(
+            manifest,
+            _instance(),
+            {source: None},
+            {output: None},
+            tmp_path,
+            variables={"name": "Alice"},
+        )
+        entry = manifest["instances"]["claude_md-default"]
+
+        assert manifest_service.is_instance_current(
+            entry, _instance(), [source], tmp_path, {"name": "Alice"}
+        )
+        assert not manifest_service.is_instance_current(
+            entry, _instance(), [source], tmp_path, {"name": "Bob"}
+        )
+
+    def test_changed_source(self, tmp_path):
+        """Test that editing the source component invalidates the entry."""
+        manifest, source, _ = _record(tmp_path)
+        entry = manifest["instances"]["claude_md-default"]
+        source.write_text("# Template v2", encoding="utf-8")
+
+        assert not manifest_service.is_instance_current(
+            entry, _instance(), [source], tmp_path
+        )
+
+    def test_added_source(self, tmp_path):
+        """Test that a new source file invalidates the entry."""
+        manifest, source, _ = _record(tmp_path)
+        entry = manifest["instances"]["claude_md-default"]
+        extra = tmp_path / "extra.md"
+        extra.write_text("extra", encoding="utf-8")
+
+        assert not manifest_service.is_instance_current(
+            entry, _instance(), [source, extra], tmp_path
+        )
+
+    def test_drifted_output(self, tmp_path):
+        """Test that an edited output invalidates the entry."""
+        manifest, source, output = _record(tmp_path)
+        entry = manifest["instances"]["claude_md-default"]
+        output.write_text("# Edited by hand", encoding="utf-8")
+
+        assert not manifest_service.is_instance_current(
+            entry, _instance(), [source], tmp_path
+        )
@@ -0,0 +1,98 @@
+"""Tests for the MCP registration cache service."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from claudefig.services import mcp_registration_service
+
+
+class TestHashServerConfig:
+    """Tests for hash_server_config."""
+
+    def test_key_order_does_not_matter(self):
+        """Test that equivalent configs hash identically."""
+        assert mcp_registration_service.hash_server_config(
+            {"command": "npx", "args": ["-y"]}
+        ) == mcp_registration_service.hash_server_config(
+            {"args": ["-y"], "command": "npx"}
+        )
+
+    def test_changed_config_changes_hash(self):
+        """Test that a changed value produces a different hash."""
+        assert mcp_registration_service.hash_server_config(
+            {"command": "npx"}
+        ) != mcp_registration_service.hash_server_config({"command": "uvx"})
+
+
+class TestLoadSaveRegistrations:
+    """Tests for registration cache persistence."""
+
+    def test_load_missing_cache(self, tmp_path):
+        """Test that a missing cache loads as empty."""
+        assert mcp_registration_service.load_registrations(tmp_path) == {}
+
+    def test_roundtrip(self, tmp_path):
+        """Test that saved registrations load back for the same repository."""
+        mcp_registration_service.save_registrations(tmp_path, {"github": "abc"})
+
+        assert mcp_registration_service.load_registrations(tmp_path) == {
+            "github": "abc"
+        }
+
+    def test_repositories_are_kept_separate(self, tmp_path):
+        """Test that each repository has its own registrations."""
+        repo_a = tmp_path / "a"
+        repo_b = tmp_path / "b"
+        mcp_registration_service.save_registrations(repo_a, {"github": "abc"})
+        mcp_registration_service.save_registrations(repo_b, {"notion": "def"})
+
+        assert mcp_registration_service.load_registrations(repo_a) == {"github": "abc"}
+        assert mcp_registration_service.load_registrations(repo_b) == {"notion": "def"}
+
+    def test_saving_empty_registrations_removes_repository(self, tmp_path):
+        """Test that an empty mapping drops the repository entry."""
+        mcp_registration_service.save_registrations(tmp_path, {"github": "abc"})
+        mcp_registration_service.save_registrations(tmp_path, {})
+
+        assert mcp_registration_service.load_registrations(tmp_path) == {}
+
+    def test_corrupt_cache_is_ignored(self, tmp_path, isolate_mcp_registration_cache):
+        """Test that an unreadable cache is treated as empty and replaced."""
+        isolate_mcp_registration_cache.write_text("{not json", encoding="utf-8")
+
+        assert mcp_registration_service.load_registrations(tmp_path) == {}
+
+        mcp_registration_service.save_registrations(tmp_path, {"github": "abc"})
+        assert mcp_registration_service.load_registrations(tmp_path) == {
+            "github": "abc"
+        }
+
+    def test_concurrent_saves_keep_every_repository(self, tmp_path):
+        """Test that parallel saves for different repositories all survive."""
+        load_cache = mcp_registration_service._load_cache
+
+        def slow_load_cache(cache_path):
+            # Widen the read-modify-write window so unlocked saves would race
+            cache = load_cache(cache_path)
+            time.sleep(0.05)
+            return cache
+
+        repos = [tmp_path / f"repo{i}" for i in range(4)]
+        with patch.object(mcp_registration_service, "_load_cache", slow_load_cache):
+            threads = [
+                threading.Thread(
+                    target=mcp_registration_service.save_registrations,
+                    args=(repo, {"github": repo.name}),
+                )
+                for repo in repos
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        for repo in repos:
+            assert mcp_registration_service.load_registrations(repo) == {
+                "github": repo.name
+            }
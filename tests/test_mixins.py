@@ -452,6 +452,40 @@ class TestFileInstanceMixin:
         # Verify
         assert save_called is True
 
+    def test_sync_instances_to_config_uses_app_scheduler(self, mixin_instance):
+        """Test saves are debounced through the app's scheduler when present."""
+        from claudefig.tui.base import ConfigSaveScheduler
+
+        timers = []
+        scheduler = ConfigSaveScheduler(
+            lambda delay, callback: timers.append(callback) or Mock()
+        )
+        mixin_instance.app = Mock(config_saver=scheduler)
+
+        mixin_instance.sync_instances_to_config()
+        mixin_instance.sync_instances_to_config()
+
+        mixin_instance.config_repo.save.assert_not_called()
+        assert len(timers) == 1
+
+        mixin_instance.flush_config_saves()
+        mixin_instance.config_repo.save.assert_called_once_with(
+            mixin_instance.config_data
+        )
+
+    def test_file_instances_screen_shares_mixin_sync(self):
+        """Test the file instances screen saves through the mixin."""
+        from claudefig.tui.screens.file_instances import FileInstancesScreen
+
+        assert (
+            FileInstancesScreen.sync_instances_to_config
+            is FileInstanceMixin.sync_instances_to_config
+        )
+        assert (
+            FileInstancesScreen.flush_config_saves
+            is FileInstanceMixin.flush_config_saves
+        )
+
     def test_sync_instances_to_config_missing_attributes(self):
         """Test sync_instances_to_config with missing attributes."""
 
@@ -0,0 +1,195 @@
+"""Tests for the persistent preset index."""
+
+import os
+import time
+from unittest.mock import patch
+
+from claudefig.models import PresetSource
+from claudefig.repositories import preset_index
+from claudefig.repositories.preset_repository import TomlPresetRepository
+from tests.factories import PresetFactory
+
+
+def _age(*paths):
+    """Move modification times out of the racy window."""
+    old = time.time_ns() - 10 * preset_index.RACY_WINDOW_NS
+    for path in paths:
+        os.utime(path, ns=(old, old))
+
+
+def _write_preset(directory, name):
+    preset_file = directory / f"claude_md_{name}.toml"
+    preset_file.write_text(
+        f'[preset]\nid = "claude_md:{name}"\ntype = "claude_md"\nname = "{name}"\n',
+        encoding="utf-8",
+    )
+    return preset_file
+
+
+class TestLoadSavePresets:
+    """Tests for index persistence and validation."""
+
+    def _save(self, tmp_path, presets):
+        preset_dir = tmp_path / "presets"
+        preset_dir.mkdir(exist_ok=True)
+        preset_file = _write_preset(preset_dir, "indexed")
+        _age(preset_file, preset_dir)
+        key = preset_index.index_key([preset_dir])
+        sources = preset_index.stamp_sources([], [preset_dir])
+        preset_index.save_presets(key, sources, presets)
+        return key, preset_dir, preset_file
+
+    def test_roundtrip(self, tmp_path):
+        """Test that saved presets load back while sources are unchanged."""
+        preset = PresetFactory(id="claude_md:indexed", variables={"a": 1}, tags=["x"])
+
+        key, _, _ = self._save(tmp_path, [preset])
+
+        assert preset_index.load_presets(key) == [preset]
+
+    def test_missing_index(self, tmp_path):
+        """Test that a missing index has no presets."""
+        assert preset_index.load_presets(preset_index.index_key([tmp_path])) is None
+
+    def test_edited_file_invalidates_entry(self, tmp_path):
+        """Test that editing an indexed preset file invalidates the entry."""
+        key, _, preset_file = self._save(tmp_path, [PresetFactory()])
+
+        preset_file.write_text("# edited", encoding="utf-8")
+
+        assert preset_index.load_presets(key) is None
+
+    def test_added_file_invalidates_entry(self, tmp_path):
+        """Test that adding a preset file invalidates the entry."""
+        key, preset_dir, _ = self._save(tmp_path, [PresetFactory()])
+
+        _write_preset(preset_dir, "new")
+
+        assert preset_index.load_presets(key) is None
+
+    def test_recently_modified_sources_are_not_indexed(self, tmp_path):
+        """Test that sources inside the racy window are not trusted."""
+        preset_dir = tmp_path / "presets"
+        preset_dir.mkdir()
+        _write_preset(preset_dir, "fresh")
+        key = preset_index.index_key([preset_dir])
+
+        preset_index.save_presets(
+            key, preset_index.stamp_sources([], [preset_dir]), [PresetFactory()]
+        )
+
+        assert preset_index.load_presets(key) is None
+
+    def test_keeps_bounded_number_of_entries(self, tmp_path):
+        """Test that the least recently saved entries are dropped."""
+        with patch.object(preset_index, "PRESET_INDEX_MAX_ENTRIES", 2):
+            keys = []
+            for i in range(3):
+                directory = tmp_path / f"dir{i}"
+                directory.mkdir()
+                _age(directory)
+                key = preset_index.index_key([directory])
+                preset_index.save_presets(
+                    key, preset_index.stamp_sources([], [directory]), []
+                )
+                keys.append(key)
+
+        assert preset_index.load_presets(keys[0]) is None
+        assert preset_index.load_presets(keys[2]) == []
+
+
+class TestRepositoryIndex:
+    """Tests for TomlPresetRepository loading through the index."""
+
+    def _repo(self, tmp_path):
+        return TomlPresetRepository(
+            user_presets_dir=tmp_path / "user",
+            project_presets_dir=tmp_path / "project",
+        )
+
+    def test_second_load_uses_index(self, tmp_path):
+        """Test that an unchanged setup is loaded without parsing TOML."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        _age(_write_preset(user_dir, "mine"), user_dir)
+        first = self._repo(tmp_path).list_presets()
+
+        repo = self._repo(tmp_path)
+        with patch.object(
+            repo, "_parse_all_presets", side_effect=AssertionError("parsed")
+        ):
+            second = repo.list_presets()
+
+        assert second == first
+        mine = repo.get_preset("claude_md:mine")
+        assert mine is not None
+        assert mine.source == PresetSource.USER
+
+    def test_changes_fall_back_to_parsing(self, tmp_path):
+        """Test that a new preset file is picked up."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        _age(_write_preset(user_dir, "mine"), user_dir)
+        self._repo(tmp_path).list_presets()
+
+        _write_preset(user_dir, "added")
+
+        assert self._repo(tmp_path).get_preset("claude_md:added") is not None
+
+    def test_refresh_after_index_load(self, tmp_path):
+        """Test that a repository loaded from the index refreshes incrementally."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        kept_file = _write_preset(user_dir, "kept")
+        _age(kept_file, user_dir)
+        self._repo(tmp_path).list_presets()
+
+        repo = self._repo(tmp_path)
+        with patch.object(
+            repo, "_parse_all_presets", side_effect=AssertionError("parsed")
+        ):
+            repo.list_presets()
+        kept = repo.get_preset("claude_md:kept")
+
+        _write_preset(user_dir, "added")
+        with patch.object(
+            repo, "_load_preset_file", wraps=repo._load_preset_file
+        ) as load_file:
+            repo.refresh()
+
+        load_file.assert_called_once_with(
+            user_dir / "claude_md_added.toml", PresetSource.USER
+        )
+        assert repo.get_preset("claude_md:kept") is kept
+        assert repo.exists("claude_md:added")
+
+    def test_load_errors_are_not_indexed(self, tmp_path, isolate_preset_index):
+        """Test that failed loads are reparsed so errors are reported again."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        broken = user_dir / "broken.toml"
+        broken.write_text("invalid toml {{{", encoding="utf-8")
+        _age(broken, user_dir)
+
+        assert self._repo(tmp_path).get_load_errors()
+        assert not isolate_preset_index.exists()
+        assert self._repo(tmp_path).get_load_errors()
+
+    def test_lookup_on_warm_index_parses_nothing(self, tmp_path):
+        """Test that a lookup and variable resolution use the index alone."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        _age(_write_preset(user_dir, "mine"), user_dir)
+        self._repo(tmp_path).list_presets()
+
+        repo = self._repo(tmp_path)
+        with (
+            patch.object(repo, "_load_part", side_effect=AssertionError("parsed")),
+            patch.object(
+                repo, "_parse_all_presets", side_effect=AssertionError("parsed")
+            ),
+        ):
+            mine = repo.get_preset("claude_md:mine")
+            assert mine is not None
+            assert repo.get_resolved_variables(mine) is not None
+            assert repo.get_preset("claude_md:default") is not None
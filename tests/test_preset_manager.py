@@ -7,6 +7,7 @@ import tomli_w
 
 from claudefig.exceptions import (
     BuiltInModificationError,
+    CircularDependencyError,
     PresetExistsError,
     PresetNotFoundError,
     TemplateNotFoundError,
@@ -501,6 +502,28 @@ class TestPresetEdgeCases:
         assert len(presets2) == initial_count
         assert manager._cache_loaded is True
 
+    def test_inheritance_cycle_is_detected_at_load(self, preset_manager, tmp_path):
+        """Test that cycles are reported by validation and the cycle check."""
+        user_dir = tmp_path / "user_presets"
+        for name, parent in (("a", "b"), ("b", "a")):
+            preset_data = {
+                "preset": {
+                    "id": f"claude_md:{name}",
+                    "type": "claude_md",
+                    "name": name,
+                    "extends": f"claude_md:{parent}",
+                }
+            }
+            with open(user_dir / f"claude_md_{name}.toml", "wb") as f:
+                tomli_w.dump(preset_data, f)
+
+        errors = preset_manager.validate_preset_inheritance()
+
+        assert any("claude_md:a -> claude_md:b" in error for error in errors)
+        with pytest.raises(CircularDependencyError):
+            preset_manager.check_circular_dependency("claude_md:a")
+        preset_manager.check_circular_dependency("claude_md:default")
+
     def test_render_preset_missing_template_file(self, tmp_path):
         """Test rendering preset when template file doesn't exist."""
         nonexistent_template = tmp_path / "does_not_exist.md"
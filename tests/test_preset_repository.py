@@ -1,12 +1,18 @@
 """Tests for preset repository implementations."""
 
+import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from claudefig.exceptions import (
     BuiltInModificationError,
+    CircularDependencyError,
+    FileReadError,
+    FileWriteError,
+    InvalidPresetNameError,
     PresetExistsError,
     PresetNotFoundError,
 )
@@ -207,6 +213,46 @@ class TestTomlPresetRepository:
 
             assert content == "# Template Content"
 
+    def test_get_template_content_is_cached(self, tmp_path):
+        """Test that unchanged templates are not re-read from disk."""
+        template_file = tmp_path / "template.md"
+        template_file.write_text("# Cached")
+        preset = PresetFactory(id="claude_md:test", template_path=template_file)
+        repo = TomlPresetRepository()
+        repo.clear_cache()
+
+        assert repo.get_template_content(preset) == "# Cached"
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            assert repo.get_template_content(preset) == "# Cached"
+
+    def test_get_template_content_detects_changes(self, tmp_path):
+        """Test that a modified template invalidates the cached content."""
+        template_file = tmp_path / "template.md"
+        template_file.write_text("# Version 1")
+        preset = PresetFactory(id="claude_md:test", template_path=template_file)
+        repo = TomlPresetRepository()
+
+        assert repo.get_template_content(preset) == "# Version 1"
+        template_file.write_text("# Version 22")
+
+        assert repo.get_template_content(preset) == "# Version 22"
+
+    def test_clear_cache_invalidates_template_content(self, tmp_path):
+        """Test that clear_cache drops cached template content."""
+        template_file = tmp_path / "template.md"
+        template_file.write_text("# Cached")
+        preset = PresetFactory(id="claude_md:test", template_path=template_file)
+        repo = TomlPresetRepository()
+        repo.get_template_content(preset)
+
+        repo.clear_cache()
+
+        with (
+            patch.object(Path, "read_text", side_effect=OSError("read")),
+            pytest.raises(FileReadError),
+        ):
+            repo.get_template_content(preset)
+
     def test_caching_works(self):
         """Test that caching reduces file I/O."""
         repo = TomlPresetRepository()
@@ -241,6 +287,466 @@ class TestTomlPresetRepository:
             assert any("invalid" in err.lower() for err in errors)
 
 
+class TestListIndex:
+    """Tests for the sorted listings behind TomlPresetRepository.list_presets."""
+
+    def _repo(self, tmp_path):
+        return TomlPresetRepository(
+            user_presets_dir=tmp_path / "user",
+            project_presets_dir=tmp_path / "project",
+        )
+
+    def _expected(self, repo, file_type=None, source=None):
+        presets = list(repo._preset_cache.values())
+        if file_type:
+            presets = [p for p in presets if p.type.value == file_type]
+        if source:
+            presets = [p for p in presets if p.source == source]
+        return sorted(presets, key=lambda p: (p.type.value, p.name, p.id))
+
+    @pytest.mark.parametrize(
+        ("file_type", "source"),
+        [
+            (None, None),
+            ("claude_md", None),
+            (None, PresetSource.USER),
+            ("gitignore", PresetSource.PROJECT),
+            ("unknown", None),
+        ],
+    )
+    def test_filters_match_full_scan(self, tmp_path, file_type, source):
+        """Test that indexed listings equal filtering and sorting the cache."""
+        repo = self._repo(tmp_path)
+        for i, preset_type in enumerate([FileType.CLAUDE_MD, FileType.GITIGNORE] * 3):
+            repo.add_preset(
+                PresetFactory(name=f"z-{i}", type=preset_type),
+                PresetSource.USER if i % 2 else PresetSource.PROJECT,
+            )
+
+        presets = repo.list_presets(file_type=file_type, source=source)
+
+        assert presets == self._expected(repo, file_type, source)
+
+    def test_updates_are_reflected(self, tmp_path):
+        """Test that add, update and delete keep the listings current."""
+        repo = self._repo(tmp_path)
+        preset = PresetFactory(id="claude_md:mine", name="mine")
+        repo.add_preset(preset, PresetSource.USER)
+
+        renamed = PresetFactory(
+            id="claude_md:mine", name="AAA", source=PresetSource.USER
+        )
+        repo.update_preset(renamed)
+        user_presets = repo.list_presets(source=PresetSource.USER)
+
+        assert user_presets == [renamed]
+        assert repo.list_presets(file_type="claude_md")[0] is renamed
+
+        repo.delete_preset("claude_md:mine")
+
+        assert repo.list_presets(source=PresetSource.USER) == []
+        assert repo.list_presets() == self._expected(repo)
+
+
+class TestInheritanceTable:
+    """Tests for inheritance flattened when TomlPresetRepository loads."""
+
+    def _write_preset(self, directory, name, variables, extends=None):
+        lines = [
+            "[preset]",
+            f'id = "claude_md:{name}"',
+            'type = "claude_md"',
+            f'name = "{name}"',
+        ]
+        if extends:
+            lines.append(f'extends = "claude_md:{extends}"')
+        lines.append("[preset.variables]")
+        lines.extend(f'{key} = "{value}"' for key, value in variables.items())
+        (directory / f"claude_md_{name}.toml").write_text(
+            "\n".join(lines), encoding="utf-8"
+        )
+
+    def _repo(self, tmp_path):
+        return TomlPresetRepository(
+            user_presets_dir=tmp_path / "user",
+            project_presets_dir=tmp_path / "project",
+        )
+
+    def test_merges_deep_chain(self, tmp_path):
+        """Test that each preset stores variables merged along its chain."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        self._write_preset(user_dir, "level0", {"a": "0", "b": "0"})
+        for i in range(1, 50):
+            self._write_preset(user_dir, f"level{i}", {"b": str(i)}, f"level{i - 1}")
+        repo = self._repo(tmp_path)
+
+        leaf = repo.get_preset("claude_md:level49")
+        assert leaf is not None
+        with patch.object(repo, "get_preset", side_effect=AssertionError("walk")):
+            resolved = repo.get_resolved_variables(leaf)
+
+        assert resolved == {"a": "0", "b": "49"}
+        assert repo.get_load_errors() == []
+
+    def test_missing_parent_keeps_own_variables(self, tmp_path):
+        """Test that a preset extending an unknown preset keeps its own values."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        self._write_preset(user_dir, "orphan", {"a": "1"}, "missing")
+        repo = self._repo(tmp_path)
+
+        orphan = repo.get_preset("claude_md:orphan")
+        assert orphan is not None
+        assert repo.get_resolved_variables(orphan) == {"a": "1"}
+
+    def test_reports_cycles_once(self, tmp_path):
+        """Test that a cycle is reported once and fails presets depending on it."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        self._write_preset(user_dir, "a", {}, "b")
+        self._write_preset(user_dir, "b", {}, "a")
+        self._write_preset(user_dir, "child", {}, "a")
+        repo = self._repo(tmp_path)
+
+        errors = repo.get_load_errors()
+
+        assert len(errors) == 1
+        assert "Circular dependency" in errors[0]
+        for name in ("a", "child"):
+            preset = repo.get_preset(f"claude_md:{name}")
+            assert preset is not None
+            with pytest.raises(CircularDependencyError):
+                repo.get_resolved_variables(preset)
+
+    def test_update_rebuilds_table(self, tmp_path):
+        """Test that modifying a parent is reflected in its children."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        self._write_preset(user_dir, "base", {"a": "old"})
+        self._write_preset(user_dir, "child", {}, "base")
+        repo = self._repo(tmp_path)
+        base = repo.get_preset("claude_md:base")
+        assert base is not None
+
+        updated = PresetFactory(
+            id="claude_md:base", name="base", variables={"a": "new"}
+        )
+        updated.source = PresetSource.USER
+        repo.update_preset(updated)
+
+        child = repo.get_preset("claude_md:child")
+        assert child is not None
+        assert repo.get_resolved_variables(child) == {"a": "new"}
+        # Stale objects are not answered from the table
+        assert repo.get_resolved_variables(base) is None
+
+
+class TestLazyLoading:
+    """Tests for lookups that load only the presets they need."""
+
+    def _write_preset(self, directory, file_name, preset_id, name="Mine"):
+        directory.mkdir(parents=True, exist_ok=True)
+        file_type = preset_id.split(":")[0]
+        (directory / file_name).write_text(
+            f'[preset]\nid = "{preset_id}"\ntype = "{file_type}"\nname = "{name}"\n',
+            encoding="utf-8",
+        )
+
+    def _repo(self, tmp_path):
+        return TomlPresetRepository(
+            user_presets_dir=tmp_path / "user",
+            project_presets_dir=tmp_path / "project",
+        )
+
+    def test_project_lookup_skips_lower_sources(self, tmp_path):
+        """Test that a project preset is found without loading user or built-in presets."""
+        self._write_preset(
+            tmp_path / "project", "claude_md_mine.toml", "claude_md:mine"
+        )
+        self._write_preset(tmp_path / "user", "claude_md_mine.toml", "claude_md:mine")
+        repo = self._repo(tmp_path)
+
+        with patch.object(
+            repo, "_load_builtin_presets", side_effect=AssertionError("built-in")
+        ):
+            preset = repo.get_preset("claude_md:mine")
+
+        assert preset is not None
+        assert preset.source == PresetSource.PROJECT
+        assert all(source == PresetSource.PROJECT for source, _ in repo._loaded_parts)
+
+    def test_lookup_reads_only_matching_file_type(self, tmp_path):
+        """Test that files of other file types are not parsed by a lookup."""
+        user_dir = tmp_path / "user"
+        self._write_preset(user_dir, "claude_md_mine.toml", "claude_md:mine")
+        (user_dir / "gitignore_broken.toml").write_text("invalid {{{", encoding="utf-8")
+        repo = self._repo(tmp_path)
+
+        assert repo.get_preset("claude_md:mine") is not None
+        assert repo._file_errors == {}
+        assert repo._cache_loaded is False
+
+        assert any("gitignore_broken" in error for error in repo.get_load_errors())
+
+    def test_unconventional_file_names_are_always_read(self, tmp_path):
+        """Test that files not named after a file type are read on every lookup."""
+        self._write_preset(tmp_path / "user", "custom.toml", "claude_md:custom")
+        repo = self._repo(tmp_path)
+
+        preset = repo.get_preset("claude_md:custom")
+
+        assert preset is not None
+        assert preset.source == PresetSource.USER
+
+    def test_file_named_after_another_type_is_found(self, tmp_path):
+        """Test that a preset stored under a mismatched file name is found."""
+        self._write_preset(tmp_path / "user", "settings_json_q.toml", "gitignore:yyy")
+        repo = self._repo(tmp_path)
+
+        preset = repo.get_preset("gitignore:yyy")
+
+        assert preset is not None
+        assert preset.source == PresetSource.USER
+        assert repo.exists("gitignore:yyy")
+        with pytest.raises(PresetExistsError):
+            repo.add_preset(
+                PresetFactory(id="gitignore:yyy", type=FileType.GITIGNORE),
+                PresetSource.USER,
+            )
+
+    def test_mismatched_file_name_still_overrides_lower_source(self, tmp_path):
+        """Test that a project override in a mismatched file beats the user one."""
+        self._write_preset(
+            tmp_path / "project", "settings_json_x.toml", "claude_md:mine", "Project"
+        )
+        self._write_preset(
+            tmp_path / "user", "claude_md_mine.toml", "claude_md:mine", "User"
+        )
+        repo = self._repo(tmp_path)
+
+        preset = repo.get_preset("claude_md:mine")
+
+        assert preset is not None
+        assert preset.source == PresetSource.PROJECT
+        assert preset.name == "Project"
+
+    def test_priority_holds_across_lookups(self, tmp_path):
+        """Test that earlier lookups never let a lower source win."""
+        self._write_preset(
+            tmp_path / "user", "claude_md_default.toml", "claude_md:default"
+        )
+        self._write_preset(
+            tmp_path / "user", "claude_md_shared.toml", "claude_md:shared"
+        )
+        self._write_preset(
+            tmp_path / "project", "claude_md_shared.toml", "claude_md:shared"
+        )
+        repo = self._repo(tmp_path)
+
+        # Loads the whole built-in source, including claude_md:default
+        assert repo.get_preset("gitignore:default") is not None
+
+        default = repo.get_preset("claude_md:default")
+        shared = repo.get_preset("claude_md:shared")
+        assert default is not None and default.source == PresetSource.USER
+        assert shared is not None and shared.source == PresetSource.PROJECT
+
+    def test_full_load_keeps_looked_up_instances(self, tmp_path):
+        """Test that listing after a lookup returns the same preset objects."""
+        self._write_preset(tmp_path / "user", "claude_md_mine.toml", "claude_md:mine")
+        repo = self._repo(tmp_path)
+        mine = repo.get_preset("claude_md:mine")
+
+        presets = repo.list_presets()
+
+        assert repo._cache_loaded is True
+        assert any(preset is mine for preset in presets)
+        assert len({preset.id for preset in presets}) == len(presets)
+
+
+class TestAddPresets:
+    """Tests for bulk writes through TomlPresetRepository.add_presets."""
+
+    def _repo(self, tmp_path):
+        return TomlPresetRepository(
+            user_presets_dir=tmp_path / "user",
+            project_presets_dir=tmp_path / "project",
+        )
+
+    def _presets(self, count):
+        return [
+            PresetFactory(id=f"claude_md:bulk{i}", name=f"bulk{i}")
+            for i in range(count)
+        ]
+
+    def test_writes_and_caches_all_presets(self, tmp_path):
+        """Test that every preset is written and listed after one call."""
+        repo = self._repo(tmp_path)
+        repo.list_presets()
+        presets = self._presets(5)
+
+        with patch.object(
+            repo, "_build_inheritance_table", wraps=repo._build_inheritance_table
+        ) as build:
+            repo.add_presets(presets, PresetSource.USER)
+
+        build.assert_called_once()
+        assert repo.list_presets(source=PresetSource.USER) == presets
+        assert sorted(p.name for p in (tmp_path / "user").iterdir()) == [
+            f"claude_md_bulk{i}.toml" for i in range(5)
+        ]
+        reloaded = self._repo(tmp_path).get_preset("claude_md:bulk3")
+        assert reloaded is not None
+        assert reloaded.source == PresetSource.USER
+
+    @pytest.mark.parametrize(
+        "preset_id", ["claude_md:bulk1", "claude_md:default", "claude_md:../evil"]
+    )
+    def test_invalid_batch_writes_nothing(self, tmp_path, preset_id):
+        """Test that repeated, existing or unsafe IDs are rejected up front."""
+        repo = self._repo(tmp_path)
+        presets = [*self._presets(2), PresetFactory(id=preset_id, name="x")]
+
+        with pytest.raises((PresetExistsError, InvalidPresetNameError)):
+            repo.add_presets(presets, PresetSource.USER)
+
+        assert not (tmp_path / "user").exists()
+        assert not repo.exists("claude_md:bulk0")
+
+    def test_failed_commit_removes_written_presets(self, tmp_path):
+        """Test that a failing rename leaves no preset or temporary file behind."""
+        repo = self._repo(tmp_path)
+        real_replace = os.replace
+        calls = []
+
+        def flaky_replace(src, dst):
+            calls.append(dst)
+            if len(calls) == 3:
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        with (
+            patch(
+                "claudefig.repositories.preset_repository.os.replace",
+                side_effect=flaky_replace,
+            ),
+            pytest.raises(FileWriteError),
+        ):
+            repo.add_presets(self._presets(4), PresetSource.PROJECT)
+
+        assert list((tmp_path / "project").iterdir()) == []
+        assert not repo.exists("claude_md:bulk0")
+
+    def test_rejects_builtin_source(self, tmp_path):
+        """Test that presets cannot be added to the built-in source."""
+        with pytest.raises(BuiltInModificationError):
+            self._repo(tmp_path).add_presets(self._presets(1), PresetSource.BUILT_IN)
+
+
+class TestRefresh:
+    """Tests for incremental reloads through TomlPresetRepository.refresh."""
+
+    def _write_preset(self, directory, name, description="", file_name=None):
+        directory.mkdir(parents=True, exist_ok=True)
+        preset_file = directory / (file_name or f"claude_md_{name}.toml")
+        preset_file.write_text(
+            f'[preset]\nid = "claude_md:{name}"\ntype = "claude_md"\n'
+            f'name = "{name}"\ndescription = "{description}"\n',
+            encoding="utf-8",
+        )
+        return preset_file
+
+    def _repo(self, tmp_path):
+        return TomlPresetRepository(
+            user_presets_dir=tmp_path / "user",
+            project_presets_dir=tmp_path / "project",
+        )
+
+    def test_reparses_only_changed_files(self, tmp_path):
+        """Test that a changed file is re-parsed and others keep their instances."""
+        user_dir = tmp_path / "user"
+        self._write_preset(user_dir, "kept")
+        changed_file = self._write_preset(user_dir, "changed")
+        repo = self._repo(tmp_path)
+        kept = repo.get_preset("claude_md:kept")
+        repo.list_presets()
+
+        self._write_preset(user_dir, "changed", "a longer description")
+        with patch.object(
+            repo, "_load_preset_file", wraps=repo._load_preset_file
+        ) as load_file:
+            repo.refresh()
+
+        load_file.assert_called_once_with(changed_file, PresetSource.USER)
+        changed = repo.get_preset("claude_md:changed")
+        assert changed is not None
+        assert changed.description == "a longer description"
+        assert repo.get_preset("claude_md:kept") is kept
+        assert changed in repo.list_presets(file_type="claude_md")
+
+    def test_picks_up_added_and_removed_files(self, tmp_path):
+        """Test that added files appear and removed files disappear."""
+        user_dir = tmp_path / "user"
+        removed_file = self._write_preset(user_dir, "removed")
+        repo = self._repo(tmp_path)
+        repo.list_presets()
+
+        removed_file.unlink()
+        self._write_preset(user_dir, "added")
+        self._write_preset(user_dir, "other", file_name="gitignore_other.toml")
+        repo.refresh()
+
+        ids = {preset.id for preset in repo.list_presets(source=PresetSource.USER)}
+        assert ids == {"claude_md:added", "claude_md:other"}
+        assert not repo.exists("claude_md:removed")
+
+    def test_removed_override_reveals_lower_source(self, tmp_path):
+        """Test that removing a project override falls back to the user preset."""
+        self._write_preset(tmp_path / "user", "shared", "user")
+        project_file = self._write_preset(tmp_path / "project", "shared", "project")
+        repo = self._repo(tmp_path)
+        shared = repo.get_preset("claude_md:shared")
+        assert shared is not None and shared.source == PresetSource.PROJECT
+
+        project_file.unlink()
+        repo.refresh()
+
+        shared = repo.get_preset("claude_md:shared")
+        assert shared is not None
+        assert shared.source == PresetSource.USER
+        assert shared.description == "user"
+
+    def test_fixed_file_clears_its_load_error(self, tmp_path):
+        """Test that load errors follow the files they came from."""
+        user_dir = tmp_path / "user"
+        user_dir.mkdir()
+        broken = user_dir / "claude_md_broken.toml"
+        broken.write_text("invalid {{{", encoding="utf-8")
+        repo = self._repo(tmp_path)
+        assert repo.get_load_errors()
+
+        self._write_preset(user_dir, "broken")
+        repo.refresh()
+
+        assert repo.get_load_errors() == []
+        assert repo.exists("claude_md:broken")
+
+    def test_own_writes_are_not_reparsed(self, tmp_path):
+        """Test that presets saved through the repository are not read back."""
+        repo = self._repo(tmp_path)
+        repo.list_presets()
+        preset = PresetFactory(id="claude_md:mine", name="mine")
+        repo.add_preset(preset, PresetSource.USER)
+
+        with patch.object(
+            repo, "_load_preset_file", side_effect=AssertionError("parsed")
+        ):
+            repo.refresh()
+
+        assert repo.get_preset("claude_md:mine") is preset
+
+
 class TestFakePresetRepository:
     """Test FakePresetRepository in-memory implementation."""
 
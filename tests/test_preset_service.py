@@ -155,6 +155,46 @@ class TestCreatePreset:
         assert repo.exists("claude_md:test")
 
 
+class TestCreatePresets:
+    """Test create_presets() function."""
+
+    def test_creates_all_presets(self):
+        """Test that every preset is added to the source."""
+        repo = FakePresetRepository()
+        presets = [PresetFactory(id=f"claude_md:p{i}", name=f"p{i}") for i in range(3)]
+
+        result = preset_service.create_presets(repo, presets, PresetSource.PROJECT)
+
+        assert result == presets
+        for preset in presets:
+            retrieved = repo.get_preset(preset.id)
+            assert retrieved is not None
+            assert retrieved.source == PresetSource.PROJECT
+
+    def test_duplicate_leaves_repository_unchanged(self):
+        """Test that one existing ID rejects the whole batch."""
+        existing = PresetFactory(id="claude_md:existing", name="existing")
+        repo = FakePresetRepository([existing])
+        presets = [
+            PresetFactory(id="claude_md:new", name="new"),
+            PresetFactory(id="claude_md:existing", name="existing"),
+        ]
+
+        with pytest.raises(PresetExistsError):
+            preset_service.create_presets(repo, presets)
+
+        assert not repo.exists("claude_md:new")
+
+    def test_raises_error_for_builtin_source(self):
+        """Test raises error when trying to create in built-in source."""
+        repo = FakePresetRepository()
+
+        with pytest.raises(BuiltInModificationError):
+            preset_service.create_presets(
+                repo, [PresetFactory()], PresetSource.BUILT_IN
+            )
+
+
 class TestDeletePreset:
     """Test delete_preset() function."""
 
@@ -234,6 +274,28 @@ class TestRenderPreset:
 
         assert isinstance(result, str)
 
+    def test_file_template_is_loaded_once(self, tmp_path, monkeypatch):
+        """Test that a file-backed template is compiled once and reused."""
+        template_file = tmp_path / "template.md"
+        template_file.write_text("Hello {name}", encoding="utf-8")
+        preset = PresetFactory(id="claude_md:test", variables={"name": "default"})
+        repo = FakePresetRepository([preset])
+        monkeypatch.setattr(repo, "get_template_path", lambda p: template_file)
+        calls = []
+
+        def load_content(p):
+            calls.append(p.id)
+            return template_file.read_text(encoding="utf-8")
+
+        monkeypatch.setattr(repo, "get_template_content", load_content)
+
+        first = preset_service.render_preset(repo, preset)
+        second = preset_service.render_preset(repo, preset, {"name": "World"})
+
+        assert first == "Hello default"
+        assert second == "Hello World"
+        assert calls == ["claude_md:test"]
+
 
 class TestExtractTemplateVariables:
     """Test extract_template_variables() function."""
@@ -13,6 +13,7 @@ from hypothesis import strategies as st
 
 from claudefig.models import FileType
 from claudefig.services import file_instance_service
+from claudefig.utils.templating import compile_template, render_template_file
 from tests.factories import FileInstanceFactory
 
 
@@ -148,3 +149,44 @@ class TestFileTypeProperties:
         """All FileType values have a default path."""
         assert file_type.default_path
         assert isinstance(file_type.default_path, str)
+
+
+def _replace_render(content: str, variables: dict[str, str]) -> str:
+    """Reference renderer: one full-text replace per variable."""
+    result = content.replace("{{", "\x00").replace("}}", "\x01")
+    for name, value in variables.items():
+        result = result.replace(f"{{{name}}}", value)
+    return result.replace("\x00", "{").replace("\x01", "}")
+
+
+class TestCompiledTemplateProperties:
+    """Property-based tests for compiled template rendering."""
+
+    @given(
+        content=st.text(alphabet="{}ab ", max_size=30),
+        values=st.lists(st.text(alphabet="xyz", max_size=3), min_size=2, max_size=2),
+    )
+    def test_matches_replace_rendering(self, content, values):
+        """Compiled rendering matches sequential replacement of placeholders."""
+        variables = dict(zip(["a", "b"], values, strict=True))
+
+        result = compile_template(content).render(variables)
+
+        assert result == _replace_render(content, variables)
+
+    @given(
+        content=st.text(alphabet="{}ab \n", max_size=40),
+        chunk_size=st.integers(min_value=1, max_value=8),
+    )
+    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+    def test_streaming_matches_in_memory_rendering(self, tmp_path, content, chunk_size):
+        """Streaming rendering matches rendering the whole template at once."""
+        source = tmp_path / "template.md"
+        source.write_text(content, encoding="utf-8")
+        destination = tmp_path / "out.md"
+        variables = {"a": "x", "b": "{a}"}
+
+        render_template_file(source, destination, variables, chunk_size=chunk_size)
+
+        expected = compile_template(content).render(variables)
+        assert destination.read_text(encoding="utf-8") == expected
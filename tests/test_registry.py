@@ -0,0 +1,104 @@
+"""Tests for the process-wide repository registry."""
+
+from claudefig import registry
+from claudefig.initializer import Initializer
+from claudefig.models import PresetSource
+from tests.factories import PresetFactory
+
+
+class TestGetPresetRepository:
+    """Tests for get_preset_repository()."""
+
+    def test_same_directories_share_instance(self, tmp_path):
+        """Test that equal directories, however spelled, share one repository."""
+        user_dir = tmp_path / "user"
+        repo = registry.get_preset_repository(user_dir, tmp_path / "project")
+
+        same = registry.get_preset_repository(
+            tmp_path / "x" / ".." / "user", tmp_path / "project"
+        )
+
+        assert same is repo
+        assert repo.user_presets_dir == user_dir.resolve()
+
+    def test_different_directories_get_own_instances(self, tmp_path):
+        """Test that other directory pairs get separate repositories."""
+        repo = registry.get_preset_repository(tmp_path / "a", tmp_path / "p")
+
+        assert (
+            registry.get_preset_repository(tmp_path / "b", tmp_path / "p") is not repo
+        )
+
+    def test_default_project_dir_follows_cwd(self, tmp_path, monkeypatch):
+        """Test that the default project directory is resolved per call."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        repo = registry.get_preset_repository(tmp_path / "user")
+        monkeypatch.chdir(second)
+        other = registry.get_preset_repository(tmp_path / "user")
+
+        assert other is not repo
+        assert (
+            other.project_presets_dir == (second / ".claudefig" / "presets").resolve()
+        )
+
+
+class TestGetPresetManager:
+    """Tests for get_preset_manager()."""
+
+    def test_manager_wraps_shared_repository(self, tmp_path):
+        """Test that the manager and repository see the same presets."""
+        manager = registry.get_preset_manager(tmp_path / "user", tmp_path / "project")
+        repo = registry.get_preset_repository(tmp_path / "user", tmp_path / "project")
+
+        repo.add_preset(
+            PresetFactory(id="claude_md:shared", name="shared"), PresetSource.USER
+        )
+
+        assert manager.get_preset("claude_md:shared") is repo.get_preset(
+            "claude_md:shared"
+        )
+        assert (
+            registry.get_preset_manager(tmp_path / "user", tmp_path / "project")
+            is manager
+        )
+
+    def test_initializer_uses_shared_instances(self, tmp_path):
+        """Test that initializers created without arguments share presets."""
+        first = Initializer(tmp_path / "claudefig.toml")
+        second = Initializer(tmp_path / "claudefig.toml")
+
+        assert first.preset_repo is second.preset_repo
+        assert first.preset_manager is second.preset_manager
+        assert first.preset_manager._repo is first.preset_repo
+
+
+class TestScope:
+    """Tests for scope() and clear()."""
+
+    def test_scope_isolates_instances(self, tmp_path):
+        """Test that a scope neither sees nor leaks registrations."""
+        outer = registry.get_preset_repository(tmp_path / "user", tmp_path / "p")
+
+        with registry.scope():
+            inner = registry.get_preset_repository(tmp_path / "user", tmp_path / "p")
+            assert inner is not outer
+
+        assert (
+            registry.get_preset_repository(tmp_path / "user", tmp_path / "p") is outer
+        )
+
+    def test_clear_forgets_instances(self, tmp_path):
+        """Test that clear() drops the current scope's instances."""
+        repo = registry.get_preset_repository(tmp_path / "user", tmp_path / "p")
+
+        registry.clear()
+
+        assert (
+            registry.get_preset_repository(tmp_path / "user", tmp_path / "p")
+            is not repo
+        )
@@ -0,0 +1,187 @@
+"""Tests for the debounced TUI config save scheduler."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from claudefig.tui.base.save_scheduler import (
+    ConfigSaveScheduler,
+    get_save_scheduler,
+)
+
+
+class FakeTimers:
+    """Collects one-shot timers so tests can fire them by hand."""
+
+    def __init__(self):
+        self.started: list[tuple[float, object]] = []
+        self.stopped = 0
+
+    def set_timer(self, delay, callback):
+        self.started.append((delay, callback))
+        timer = Mock()
+        timer.stop.side_effect = self._stop
+        return timer
+
+    def _stop(self):
+        self.stopped += 1
+
+    def fire(self):
+        _, callback = self.started[-1]
+        callback()
+
+
+def _repo(path: str = "/tmp/claudefig.toml") -> Mock:
+    repo = Mock()
+    repo.get_path.return_value = Path(path)
+    return repo
+
+
+class TestConfigSaveScheduler:
+    """Test ConfigSaveScheduler."""
+
+    def test_schedule_does_not_save_immediately(self):
+        """Test scheduling only starts the timer."""
+        timers = FakeTimers()
+        scheduler = ConfigSaveScheduler(timers.set_timer, delay=0.25)
+        repo = _repo()
+
+        scheduler.schedule({"files": []}, repo)
+
+        repo.save.assert_not_called()
+        assert scheduler.pending
+        assert [delay for delay, _ in timers.started] == [0.25]
+
+    def test_edits_in_window_are_coalesced(self):
+        """Test many edits within one window produce a single write."""
+        timers = FakeTimers()
+        scheduler = ConfigSaveScheduler(timers.set_timer)
+        repo = _repo()
+        config: dict = {"files": []}
+
+        for i in range(12):
+            config["files"].append({"id": str(i)})
+            scheduler.schedule(config, repo)
+        timers.fire()
+
+        assert len(timers.started) == 1
+        repo.save.assert_called_once_with(config)
+        assert len(repo.save.call_args.args[0]["files"]) == 12
+        assert not scheduler.pending
+
+    def test_new_window_after_write(self):
+        """Test an edit after a write starts a new window."""
+        timers = FakeTimers()
+        scheduler = ConfigSaveScheduler(timers.set_timer)
+        repo = _repo()
+
+        scheduler.schedule({"a": 1}, repo)
+        timers.fire()
+        scheduler.schedule({"a": 2}, repo)
+        timers.fire()
+
+        assert len(timers.started) == 2
+        assert repo.save.call_count == 2
+
+    def test_latest_data_wins(self):
+        """Test the most recently scheduled data is written."""
+        timers = FakeTimers()
+        scheduler = ConfigSaveScheduler(timers.set_timer)
+        repo = _repo()
+
+        scheduler.schedule({"version": 1}, repo)
+        scheduler.schedule({"version": 2}, repo)
+        scheduler.flush()
+
+        repo.save.assert_called_once_with({"version": 2})
+
+    def test_configs_tracked_per_path(self):
+        """Test pending saves for different files are all written."""
+        timers = FakeTimers()
+        scheduler = ConfigSaveScheduler(timers.set_timer)
+        first, second = _repo("/tmp/a.toml"), _repo("/tmp/b.toml")
+
+        scheduler.schedule({"a": 1}, first)
+        scheduler.schedule({"b": 1}, second)
+        scheduler.flush()
+
+        first.save.assert_called_once_with({"a": 1})
+        second.save.assert_called_once_with({"b": 1})
+
+    def test_flush_stops_timer(self):
+        """Test flushing writes now and cancels the pending timer."""
+        timers = FakeTimers()
+        scheduler = ConfigSaveScheduler(timers.set_timer)
+        repo = _repo()
+
+        scheduler.schedule({"a": 1}, repo)
+        scheduler.flush()
+
+        repo.save.assert_called_once()
+        assert timers.stopped == 1
+
+    def test_flush_without_pending_is_noop(self):
+        """Test flushing with nothing pending writes nothing."""
+        timers = FakeTimers()
+        scheduler = ConfigSaveScheduler(timers.set_timer)
+
+        scheduler.flush()
+
+        assert timers.started == []
+
+    def test_failed_flush_keeps_config_pending(self):
+        """Test a failed write raises and is retried by the next flush."""
+        timers = FakeTimers()
+        scheduler = ConfigSaveScheduler(timers.set_timer)
+        repo = _repo()
+        repo.save.side_effect = [OSError("disk full"), None]
+
+        scheduler.schedule({"a": 1}, repo)
+        with pytest.raises(OSError, match="disk full"):
+            scheduler.flush()
+        assert scheduler.pending
+
+        scheduler.flush()
+        assert not scheduler.pending
+        assert repo.save.call_count == 2
+
+    def test_timer_failure_reported_to_on_error(self):
+        """Test a failed timed write is reported instead of raised."""
+        timers = FakeTimers()
+        on_error = Mock()
+        scheduler = ConfigSaveScheduler(timers.set_timer, on_error=on_error)
+        repo = _repo()
+        error = OSError("read-only")
+        repo.save.side_effect = error
+
+        scheduler.schedule({"a": 1}, repo)
+        timers.fire()
+
+        on_error.assert_called_once_with(error)
+        assert scheduler.pending
+
+
+class TestGetSaveScheduler:
+    """Test get_save_scheduler."""
+
+    def test_returns_app_scheduler(self):
+        """Test the scheduler is found through the node's app."""
+        scheduler = ConfigSaveScheduler(FakeTimers().set_timer)
+        node = Mock()
+        node.app.config_saver = scheduler
+
+        assert get_save_scheduler(node) is scheduler
+
+    def test_returns_none_without_app(self):
+        """Test nodes outside an app have no scheduler."""
+        assert get_save_scheduler(object()) is None
+
+    def test_returns_none_when_app_has_no_scheduler(self):
+        """Test apps without a scheduler save directly."""
+        node = Mock()
+        node.app.config_saver = None
+
+        assert get_save_scheduler(node) is None
@@ -0,0 +1,225 @@
+"""Tests for the preset and component search service."""
+
+import os
+import time
+from unittest.mock import patch
+
+from claudefig.models import SearchEntry
+from claudefig.repositories import preset_index
+from claudefig.repositories.preset_repository import TomlPresetRepository
+from claudefig.services import search_service
+from claudefig.services.search_service import SearchIndex
+
+
+def _entry(name, description="", tags=(), kind="component", file_type="commands"):
+    return SearchEntry(
+        kind=kind,
+        id=f"{file_type}:{name}",
+        name=name,
+        file_type=file_type,
+        source="global",
+        description=description,
+        tags=tuple(tags),
+    )
+
+
+def _names(matches):
+    return [match.entry.name for match in matches]
+
+
+class TestTokenize:
+    """Tests for tokenize and trigrams."""
+
+    def test_tokenize_splits_and_lowercases(self):
+        """Test that punctuation and underscores separate tokens."""
+        assert search_service.tokenize("Claude_MD: Python-Lint v2") == [
+            "claude",
+            "md",
+            "python",
+            "lint",
+            "v2",
+        ]
+
+    def test_trigrams_are_padded(self):
+        """Test that trigrams mark the start and end of a token."""
+        assert search_service.trigrams("ab") == {"^ab", "ab$"}
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex ranking and filtering."""
+
+    def test_exact_match_ranks_name_over_description(self):
+        """Test that name matches outrank description matches."""
+        index = SearchIndex(
+            [
+                _entry("formatter", description="Runs the python tools"),
+                _entry("python"),
+            ]
+        )
+
+        assert _names(index.search("python")) == ["python", "formatter"]
+
+    def test_tags_are_searchable(self):
+        """Test that entries are found by tag."""
+        index = SearchIndex([_entry("build", tags=["docker"]), _entry("lint")])
+
+        assert _names(index.search("docker")) == ["build"]
+
+    def test_prefix_match(self):
+        """Test that a term matches tokens it starts."""
+        index = SearchIndex([_entry("security-review"), _entry("setup")])
+
+        assert _names(index.search("secur")) == ["security-review"]
+
+    def test_exact_match_outranks_prefix_match(self):
+        """Test that whole-word matches score higher than prefixes."""
+        index = SearchIndex([_entry("testing"), _entry("test")])
+
+        matches = index.search("test")
+
+        assert _names(matches) == ["test", "testing"]
+        assert matches[0].score > matches[1].score
+
+    def test_trigram_match_tolerates_typos(self):
+        """Test that misspelled terms still find similar tokens."""
+        index = SearchIndex([_entry("docker"), _entry("python")])
+
+        assert _names(index.search("dockr")) == ["docker"]
+
+    def test_all_terms_must_match(self):
+        """Test that query terms are combined with AND."""
+        index = SearchIndex(
+            [_entry("python-lint"), _entry("python-test"), _entry("js-lint")]
+        )
+
+        assert _names(index.search("python lint")) == ["python-lint"]
+
+    def test_empty_query_lists_everything_sorted(self):
+        """Test that an empty query returns all entries by kind and name."""
+        index = SearchIndex(
+            [
+                _entry("zeta"),
+                _entry("alpha", kind="preset", file_type="claude_md"),
+                _entry("beta"),
+            ]
+        )
+
+        assert _names(index.search()) == ["beta", "zeta", "alpha"]
+
+    def test_filters_and_limit(self):
+        """Test kind, type and source filters and the result limit."""
+        index = SearchIndex(
+            [
+                _entry("lint"),
+                _entry("lint-strict", file_type="hooks"),
+                _entry("lint", kind="preset", file_type="claude_md"),
+            ]
+        )
+
+        assert _names(index.search("lint", kind="preset")) == ["lint"]
+        assert _names(index.search("lint", file_type="hooks")) == ["lint-strict"]
+        assert index.search("lint", sources=["preset"]) == []
+        assert len(index.search("lint", limit=1)) == 1
+
+
+class TestCollectEntries:
+    """Tests for collecting preset and component entries."""
+
+    def test_reads_component_metadata(self, tmp_path, sample_component_toml):
+        """Test that component.toml descriptions and tags are indexed."""
+        component_dir = tmp_path / "commands" / "reviewer"
+        component_dir.mkdir(parents=True)
+        (component_dir / "component.toml").write_text(
+            sample_component_toml, encoding="utf-8"
+        )
+        (tmp_path / "hooks" / "plain").mkdir(parents=True)
+
+        entries = search_service.collect_entries(
+            TomlPresetRepository(), [("global", tmp_path)]
+        )
+        components = {e.id: e for e in entries if e.kind == "component"}
+
+        assert set(components) == {"commands:reviewer", "hooks:plain"}
+        reviewer = components["commands:reviewer"]
+        assert reviewer.description == "Test component for unit tests"
+        assert reviewer.tags == ("test", "example")
+        assert reviewer.source == "global"
+        assert components["hooks:plain"].description == ""
+
+    def test_includes_presets(self, tmp_path):
+        """Test that presets are indexed with their tags."""
+        entries = search_service.collect_entries(TomlPresetRepository(), [])
+
+        default = next(e for e in entries if e.id == "claude_md:default")
+        assert default.kind == "preset"
+        assert default.source == "built-in"
+        assert default.tags
+
+
+class TestLoadSearchIndex:
+    """Tests for the cached search index."""
+
+    def _setup(self, tmp_path):
+        roots = [("global", tmp_path / "components")]
+        component_dir = tmp_path / "components" / "commands" / "reviewer"
+        component_dir.mkdir(parents=True)
+        old = time.time_ns() - 10 * preset_index.RACY_WINDOW_NS
+        for path in (component_dir, component_dir.parent, tmp_path / "components"):
+            os.utime(path, ns=(old, old))
+        repo = TomlPresetRepository(
+            user_presets_dir=tmp_path / "user", project_presets_dir=tmp_path / "p"
+        )
+        return repo, roots
+
+    def test_second_load_uses_cache(self, tmp_path, isolate_search_index):
+        """Test that an unchanged setup does not collect entries again."""
+        repo, roots = self._setup(tmp_path)
+        first = search_service.load_search_index(repo, roots)
+        assert isolate_search_index.exists()
+
+        with patch.object(
+            search_service, "collect_entries", side_effect=AssertionError("built")
+        ):
+            second = search_service.load_search_index(repo, roots)
+
+        assert second.entries == first.entries
+        assert _names(second.search("reviewer")) == ["reviewer"]
+
+    def test_new_component_invalidates_cache(self, tmp_path):
+        """Test that adding a component is picked up."""
+        repo, roots = self._setup(tmp_path)
+        search_service.load_search_index(repo, roots)
+
+        (tmp_path / "components" / "commands" / "linter").mkdir()
+
+        index = search_service.load_search_index(repo, roots)
+        assert _names(index.search("linter")) == ["linter"]
+
+    def test_edited_metadata_invalidates_cache(self, tmp_path):
+        """Test that editing a component.toml is picked up."""
+        repo, roots = self._setup(tmp_path)
+        metadata_file = tmp_path / "components" / "commands" / "reviewer"
+        metadata_file = metadata_file / "component.toml"
+        metadata_file.write_text('[component]\ndescription = "old"\n')
+        old = time.time_ns() - 10 * preset_index.RACY_WINDOW_NS
+        os.utime(metadata_file, ns=(old, old))
+        os.utime(metadata_file.parent, ns=(old, old))
+        search_service.load_search_index(repo, roots)
+
+        metadata_file.write_text('[component]\ndescription = "updated text"\n')
+
+        index = search_service.load_search_index(repo, roots)
+        assert _names(index.search("updated")) == ["reviewer"]
+
+    def test_rebuild_ignores_cache(self, tmp_path):
+        """Test that rebuild collects entries even when the cache is valid."""
+        repo, roots = self._setup(tmp_path)
+        search_service.load_search_index(repo, roots)
+
+        with patch.object(
+            search_service, "collect_entries", return_value=[]
+        ) as collect:
+            index = search_service.load_search_index(repo, roots, rebuild=True)
+
+        collect.assert_called_once()
+        assert index.entries == []
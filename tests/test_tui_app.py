@@ -100,6 +100,28 @@ class TestAppStartup:
             await pilot.press("ctrl+c")
             await pilot.pause()
 
+    @pytest.mark.asyncio
+    async def test_quit_flushes_pending_config_saves(
+        self, mock_user_home, mock_cwd_with_config
+    ):
+        """Test quitting writes config edits still waiting in the scheduler."""
+        from claudefig.repositories.config_repository import TomlConfigRepository
+        from claudefig.tui import ClaudefigApp
+
+        app = ClaudefigApp()
+
+        async with app.run_test() as pilot:
+            app.config_data["claudefig"]["template_source"] = "edited"
+            app.config_saver.schedule(app.config_data, app.config_repo)
+            assert app.config_saver.pending
+
+            await pilot.press("q")
+            await pilot.pause()
+
+        assert not app.config_saver.pending
+        config = TomlConfigRepository(mock_cwd_with_config / "claudefig.toml").load()
+        assert config["claudefig"]["template_source"] == "edited"
+
     @pytest.mark.asyncio
     async def test_app_has_header_and_footer(self, mock_user_home):
         """Test app displays header and footer."""
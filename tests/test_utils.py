@@ -1,11 +1,18 @@
-"""Tests for utility functions in claudefig.utils.paths."""
+"""Tests for utility functions in claudefig.utils."""
 
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from claudefig.utils.paths import ensure_directory, is_git_repository
+from claudefig.utils.cache import LRUCache
+from claudefig.utils.paths import (
+    copy_file,
+    ensure_directory,
+    exclusive_lock,
+    is_git_repository,
+)
 
 
 class TestEnsureDirectory:
@@ -172,3 +179,173 @@ class TestIsGitRepository:
         # Should return False or True depending on if tmp_path has .git
         # In any case, should not infinite loop
         assert isinstance(result, bool)
+
+
+class TestLRUCache:
+    """Tests for the LRUCache class."""
+
+    def test_get_and_set(self):
+        """Test that cached values are returned."""
+        cache: LRUCache[str] = LRUCache(maxsize=2)
+        cache.set("a", "1")
+
+        assert cache.get("a") == "1"
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache: LRUCache[int] = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+
+    def test_pop_and_clear(self):
+        """Test removing entries."""
+        cache: LRUCache[int] = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.pop("a")
+        cache.pop("missing")
+        assert "a" not in cache
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_maxsize(self):
+        """Test that a cache must hold at least one entry."""
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+
+
+class TestCopyFile:
+    """Tests for copy_file function."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        """Create a source file to copy."""
+        source = tmp_path / "source.md"
+        source.write_text("# Component", encoding="utf-8")
+        return source
+
+    @pytest.mark.parametrize("strategy", ["copy", "reflink", "auto"])
+    def test_copies_are_independent(self, source, tmp_path, strategy):
+        """Test that non-link strategies produce an independent copy."""
+        dest = tmp_path / "dest.md"
+
+        copy_file(source, dest, strategy)
+        dest.write_text("# Edited", encoding="utf-8")
+
+        assert source.read_text(encoding="utf-8") == "# Component"
+
+    @pytest.mark.parametrize("strategy", ["copy", "reflink", "hardlink", "auto"])
+    def test_overwrites_existing_destination(self, source, tmp_path, strategy):
+        """Test that every strategy replaces an existing destination."""
+        dest = tmp_path / "dest.md"
+        dest.write_text("old content that is longer", encoding="utf-8")
+
+        copy_file(source, dest, strategy)
+
+        assert dest.read_text(encoding="utf-8") == "# Component"
+
+    @pytest.mark.parametrize("strategy", ["copy", "reflink", "auto"])
+    def test_copy_over_hardlink_keeps_source(self, source, tmp_path, strategy):
+        """Test that copying onto a hard link of the source doesn't empty it."""
+        dest = tmp_path / "dest.md"
+        copy_file(source, dest, "hardlink")
+
+        copy_file(source, dest, strategy)
+
+        assert source.read_text(encoding="utf-8") == "# Component"
+        assert dest.read_text(encoding="utf-8") == "# Component"
+        dest.write_text("# Edited", encoding="utf-8")
+        assert source.read_text(encoding="utf-8") == "# Component"
+        assert not list(tmp_path.glob(".*claudefig-copy"))
+
+    def test_failed_copy_leaves_destination(self, source, tmp_path):
+        """Test that a failing copy keeps the old destination and no temp file."""
+        dest = tmp_path / "dest.md"
+        dest.write_text("old", encoding="utf-8")
+
+        with (
+            patch("claudefig.utils.paths._try_reflink", side_effect=OSError("io")),
+            pytest.raises(OSError, match="io"),
+        ):
+            copy_file(source, dest, "auto")
+
+        assert dest.read_text(encoding="utf-8") == "old"
+        assert not list(tmp_path.glob(".*claudefig-copy"))
+
+    def test_hardlink_shares_inode(self, source, tmp_path):
+        """Test that the hardlink strategy links to the source."""
+        dest = tmp_path / "dest.md"
+
+        used = copy_file(source, dest, "hardlink")
+
+        if used == "hardlink":
+            assert dest.stat().st_ino == source.stat().st_ino
+        assert not list(tmp_path.glob(".*claudefig-link"))
+
+    def test_falls_back_to_copy(self, source, tmp_path):
+        """Test that unsupported strategies fall back to a regular copy."""
+        dest = tmp_path / "dest.md"
+
+        with (
+            patch("claudefig.utils.paths._try_reflink", return_value=False),
+            patch("claudefig.utils.paths._try_copy_file_range", return_value=False),
+        ):
+            used = copy_file(source, dest, "auto")
+
+        assert used == "copy"
+        assert dest.read_text(encoding="utf-8") == "# Component"
+
+    def test_preserves_modification_time(self, source, tmp_path):
+        """Test that metadata is copied like shutil.copy2."""
+        dest = tmp_path / "dest.md"
+
+        copy_file(source, dest, "auto")
+
+        assert dest.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+    def test_unknown_strategy(self, source, tmp_path):
+        """Test that an unknown strategy raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown copy strategy"):
+            copy_file(source, tmp_path / "dest.md", "rsync")
+
+
+class TestExclusiveLock:
+    """Tests for exclusive_lock context manager."""
+
+    def test_creates_lock_file_and_parents(self, tmp_path):
+        """Test the lock file and its directory are created."""
+        lock_path = tmp_path / "nested" / "cache.lock"
+
+        with exclusive_lock(lock_path):
+            assert lock_path.exists()
+
+    def test_excludes_other_holders(self, tmp_path):
+        """Test a second holder waits until the first releases the lock."""
+        lock_path = tmp_path / "cache.lock"
+        events = []
+        entered = threading.Event()
+
+        def second():
+            with exclusive_lock(lock_path):
+                events.append("second")
+
+        with exclusive_lock(lock_path):
+            thread = threading.Thread(target=lambda: (entered.set(), second()))
+            thread.start()
+            entered.wait()
+            thread.join(timeout=0.2)
+            events.append("first released")
+        thread.join()
+
+        assert events == ["first released", "second"]
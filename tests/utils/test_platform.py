@@ -1,6 +1,8 @@
 """Tests for platform detection and system operation utilities."""
 
 import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,6 +16,7 @@ from claudefig.utils.platform import (
     is_windows,
     open_file_in_editor,
     open_folder_in_explorer,
+    run_commands_concurrently,
     run_platform_command,
 )
 
@@ -379,3 +382,60 @@ class TestRunPlatformCommand:
 
         mock_run.assert_called_once()
         assert mock_run.call_args[1]["timeout"] == 10
+
+
+class TestRunCommandsConcurrently:
+    """Tests for run_commands_concurrently function."""
+
+    def test_empty_command_list(self):
+        """Test that no commands produce no outcomes."""
+        assert run_commands_concurrently([]) == []
+
+    def test_outcomes_keep_command_order(self):
+        """Test that outcomes are returned in command order with output."""
+        outcomes = run_commands_concurrently(
+            [
+                [sys.executable, "-c", "import time; time.sleep(0.3); print('first')"],
+                [sys.executable, "-c", "print('second')"],
+            ]
+        )
+
+        assert [o.stdout.strip() for o in outcomes] == ["first", "second"]
+        assert all(o.returncode == 0 for o in outcomes)
+
+    def test_failure_exit_code_and_stderr(self):
+        """Test that a failing command returns its exit code and stderr."""
+        (outcome,) = run_commands_concurrently(
+            [[sys.executable, "-c", "import sys; sys.exit('boom')"]]
+        )
+
+        assert isinstance(outcome, subprocess.CompletedProcess)
+        assert outcome.returncode == 1
+        assert "boom" in outcome.stderr
+
+    def test_timeout_only_affects_slow_command(self):
+        """Test that a timed-out command does not fail the others."""
+        outcomes = run_commands_concurrently(
+            [
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                [sys.executable, "-c", "print('ok')"],
+            ],
+            timeout=1,
+        )
+
+        assert isinstance(outcomes[0], subprocess.TimeoutExpired)
+        assert outcomes[1].stdout.strip() == "ok"
+
+    def test_runs_in_given_directory(self, tmp_path):
+        """Test that commands run in the requested working directory."""
+        (outcome,) = run_commands_concurrently(
+            [[sys.executable, "-c", "import os; print(os.getcwd())"]], cwd=tmp_path
+        )
+
+        assert Path(outcome.stdout.strip()).resolve() == tmp_path.resolve()
+
+    def test_missing_executable(self):
+        """Test that a missing executable is returned as FileNotFoundError."""
+        (outcome,) = run_commands_concurrently([["claudefig-no-such-command"]])
+
+        assert isinstance(outcome, FileNotFoundError)
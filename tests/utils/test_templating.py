@@ -0,0 +1,154 @@
+"""Tests for compiled template rendering."""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from claudefig.utils.templating import (
+    clear_compiled_cache,
+    compile_template,
+    get_compiled_template,
+    render_template_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty compiled template cache."""
+    clear_compiled_cache()
+    yield
+    clear_compiled_cache()
+
+
+class TestCompileTemplate:
+    """Tests for compile_template and CompiledTemplate.render."""
+
+    def test_substitutes_variables(self):
+        """Test that placeholders are replaced with their values."""
+        template = compile_template("Hello {name}, v{version}!")
+
+        assert template.render({"name": "World", "version": 2}) == "Hello World, v2!"
+        assert template.variables == {"name", "version"}
+
+    def test_escaped_braces(self):
+        """Test that doubled braces render as literal braces."""
+        template = compile_template("{{literal}} {name}")
+
+        assert template.render({"name": "x", "literal": "y"}) == "{literal} x"
+        assert template.variables == {"name"}
+
+    def test_missing_variables_are_kept(self):
+        """Test that placeholders without a value stay as written."""
+        template = compile_template("{known} {unknown}")
+
+        assert template.render({"known": "a"}) == "a {unknown}"
+
+    def test_closing_escape_is_not_a_placeholder(self):
+        """Test that '{name}}' is a literal brace followed by an escape."""
+        template = compile_template("{name}}")
+
+        assert template.variables == set()
+        assert template.render({"name": "x"}) == "{name}"
+
+    def test_values_are_not_re_expanded(self):
+        """Test that braces inside substituted values are inserted as-is."""
+        template = compile_template("{a} {b}")
+
+        assert template.render({"a": "{b}", "b": "x"}) == "{b} x"
+
+    def test_adjacent_literals_are_merged(self):
+        """Test that escapes and text collapse into a single literal segment."""
+        template = compile_template("a {{b}} c")
+
+        assert template.segments == (("a {b} c", False),)
+
+
+class TestGetCompiledTemplate:
+    """Tests for the per-file compiled template cache."""
+
+    def test_reuses_compiled_template(self, tmp_path):
+        """Test that an unchanged file is compiled only once."""
+        path = tmp_path / "template.md"
+        path.write_text("{name}", encoding="utf-8")
+        loader = Mock(return_value="{name}")
+
+        first = get_compiled_template(path, loader)
+        second = get_compiled_template(path, loader)
+
+        assert first is second
+        loader.assert_called_once()
+
+    def test_recompiles_when_file_changes(self, tmp_path):
+        """Test that a modified file is compiled again."""
+        path = tmp_path / "template.md"
+        path.write_text("old {name}", encoding="utf-8")
+        first = get_compiled_template(path)
+
+        path.write_text("new {name}", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert get_compiled_template(path).render({"name": "x"}) == "new x"
+        assert first.render({"name": "x"}) == "old x"
+
+    def test_missing_file_uses_loader(self, tmp_path):
+        """Test that files that cannot be stat'ed defer to the loader."""
+        loader = Mock(side_effect=FileNotFoundError("gone"))
+
+        with pytest.raises(FileNotFoundError):
+            get_compiled_template(tmp_path / "missing.md", loader)
+
+    def test_clear_cache(self, tmp_path):
+        """Test that clearing the cache forces recompilation."""
+        path = tmp_path / "template.md"
+        path.write_text("{name}", encoding="utf-8")
+        loader = Mock(return_value="{name}")
+
+        get_compiled_template(path, loader)
+        clear_compiled_cache()
+        get_compiled_template(path, loader)
+
+        assert loader.call_count == 2
+
+
+class TestRenderTemplateFile:
+    """Tests for streaming template rendering."""
+
+    TEMPLATE = "# {name}\n{{literal}} {name}} {missing} {version}\n" * 50
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+    def test_matches_in_memory_rendering(self, tmp_path, chunk_size):
+        """Test that tokens split across chunks render like the whole text."""
+        source = tmp_path / "template.md"
+        source.write_text(self.TEMPLATE, encoding="utf-8")
+        destination = tmp_path / "out.md"
+        variables = {"name": "API", "version": "{name}"}
+
+        render_template_file(source, destination, variables, chunk_size=chunk_size)
+
+        expected = compile_template(self.TEMPLATE).render(variables)
+        assert destination.read_text(encoding="utf-8") == expected
+
+    def test_copies_verbatim_without_variables(self, tmp_path):
+        """Test that escapes are kept when there is nothing to render."""
+        source = tmp_path / "template.md"
+        source.write_text(self.TEMPLATE, encoding="utf-8")
+        destination = tmp_path / "out.md"
+
+        render_template_file(source, destination, None, chunk_size=5)
+
+        assert destination.read_text(encoding="utf-8") == self.TEMPLATE
+
+    def test_failure_leaves_destination_untouched(self, tmp_path):
+        """Test that a failed render neither replaces nor litters the target."""
+        source = tmp_path / "template.md"
+        source.write_bytes(b"# {name}\n\xff\xfe")
+        destination = tmp_path / "out.md"
+        destination.write_text("original", encoding="utf-8")
+
+        with pytest.raises(UnicodeDecodeError):
+            render_template_file(source, destination, {"name": "x"})
+
+        assert destination.read_text(encoding="utf-8") == "original"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["out.md", "template.md"]